@@ -1,6 +1,8 @@
 import streamlit as st
+import os
 import sys
-import plotly.graph_objects as go
+import time
+import uuid
 from pathlib import Path
 import json
 
@@ -11,8 +13,18 @@ from text_mining import TextMiningAnalyzer
 from scoring import ScoringEngine
 from visualizations import VisualizationGenerator
 from data_loader import DataLoader
+from data_watcher import DataWatcher
 from cv_analyzer import CVAnalyzer
+from cv_service import CVAnalysisService
 from voice_handler import VoiceHandler
+from reference_models import ReferenceModelBank
+from instrumentation import timing_registry
+from result_cache import ResultCache, make_cache_key, normalize_answer
+from incremental_analysis import IncrementalAnalyzer
+from question_index import QuestionIndex, QuestionSampler
+from question_scheduler import AdaptiveScheduler
+from history_store import HistoryStore
+from dashboard_stats import DashboardAggregates
 
 # ✅ PINDAHKAN KE SINI - HARUS PALING ATAS SEBELUM st.markdown()
 st.set_page_config(
@@ -231,12 +243,6 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Inisialisasi Session State
-if 'interview_history' not in st.session_state:
-    st.session_state.interview_history = []
-if 'total_score' not in st.session_state:
-    st.session_state.total_score = 0
-if 'question_count' not in st.session_state:
-    st.session_state.question_count = 0
 if 'cv_uploaded' not in st.session_state:
     st.session_state.cv_uploaded = False
 if 'cv_data' not in st.session_state:
@@ -246,34 +252,159 @@ if 'interview_mode' not in st.session_state:
 if 'current_analysis' not in st.session_state:
     st.session_state.current_analysis = None
 
+# Set ANALYSIS_TIMING=1 untuk mencatat waktu per tahap analisis
+ANALYSIS_TIMING = os.environ.get('ANALYSIS_TIMING') == '1'
+
 # Load Data
-@st.cache_resource
-def load_application_data():
-    data_loader = DataLoader()
+def build_application_data(bank, initial):
+    # Semua yang bergantung pada isi data/ ikut dalam satu snapshot
+    reference_models = ReferenceModelBank(
+        bank['questions'], bank['keywords'], bank['best_answers'], bank['stopwords']
+    )
+    text_analyzer = TextMiningAnalyzer(bank['stopwords'], reference_models, instrument=ANALYSIS_TIMING)
+    if not initial:
+        # Reload berjalan di thread watcher: model TF-IDF dan automaton keyword
+        # disiapkan dulu, sesi baru memakai data baru setelah semuanya siap
+        reference_models.fit_all()
+        for keywords in bank['question_keywords'].values():
+            text_analyzer.compile_keywords(keywords)
     return {
-        'questions': data_loader.load_questions(),
-        'keywords': data_loader.load_keywords(),
-        'best_answers': data_loader.load_best_answers(),
-        'stopwords': data_loader.load_stopwords()
+        **bank,
+        'reference_models': reference_models,
+        'text_analyzer': text_analyzer,
+        'question_index': QuestionIndex(bank['question_items'])
     }
 
+@st.cache_resource
+def get_data_watcher():
+    # Dibaca dari data/question_bank.bin; perubahan file di data/ dimuat ulang
+    # otomatis tanpa restart aplikasi (session state pengguna tetap ada)
+    return DataWatcher(DataLoader(), build_application_data)
+
+@st.cache_resource
+def get_history_store():
+    # Riwayat latihan disimpan di SQLite (set HISTORY_DB untuk lokasi lain)
+    return HistoryStore(os.environ.get('HISTORY_DB', str(Path(__file__).parent / 'history.db')))
+
+@st.cache_resource
+def get_analysis_cache():
+    # Dipakai bersama semua sesi: jawaban identik tidak dianalisis ulang
+    return ResultCache(max_size=512, ttl_seconds=3600)
+
 try:
-    data = load_application_data()
-    questions_data = data['questions']
+    # Satu snapshot dipakai untuk seluruh run script ini
+    data = get_data_watcher().current()
     keywords_data = data['keywords']
-    best_answers_data = data['best_answers']
     stopwords = data['stopwords']
+    reference_models = data['reference_models']
+    data_version = data['version']
+    question_keywords = data['question_keywords']
+    best_answer_points = data['best_answer_points']
+    text_analyzer = data['text_analyzer']
+    question_index = data['question_index']
 except Exception as e:
     st.error(f"❌ Gagal memuat data: {str(e)}")
     st.info("💡 Pastikan semua file data ada di folder 'data/'")
     st.stop()
 
+# Identitas pengguna dari URL (?user=...), agar riwayat tetap ada setelah refresh
+if 'user' not in st.query_params:
+    st.query_params['user'] = uuid.uuid4().hex[:12]
+user_id = st.query_params['user']
+history_store = get_history_store()
+
+# Agregat dashboard per sesi, diperbarui O(1) tiap latihan baru; dibangun
+# ulang dari SQLite hanya jika tidak sinkron (user lain, reset, tab lain)
+attempt_count = history_store.attempt_count(user_id)
+dashboard_stats = st.session_state.get('dashboard_stats')
+rebuild_dashboard = (
+    dashboard_stats is None
+    or st.session_state.get('dashboard_user') != user_id
+    or dashboard_stats.count != attempt_count
+)
+
+# Estimasi skill (Elo) per kategori untuk rekomendasi pertanyaan berikutnya,
+# disinkronkan sama seperti dashboard_stats dan saat data dimuat ulang
+question_scheduler = st.session_state.get('question_scheduler')
+rebuild_scheduler = (
+    question_scheduler is None
+    or st.session_state.get('scheduler_user') != user_id
+    or question_scheduler.count != attempt_count
+)
+
+# Riwayat dibaca sekali saja untuk keduanya
+history = history_store.history(user_id) if rebuild_dashboard or rebuild_scheduler else None
+
+if rebuild_dashboard:
+    dashboard_stats = DashboardAggregates.from_history(history)
+    st.session_state.dashboard_stats = dashboard_stats
+    st.session_state.dashboard_user = user_id
+
+if rebuild_scheduler:
+    question_scheduler = AdaptiveScheduler.from_history(history, question_index.categories())
+    st.session_state.question_scheduler = question_scheduler
+    st.session_state.scheduler_user = user_id
+    st.session_state.scheduler_index = question_index
+elif st.session_state.get('scheduler_index') is not question_index:
+    question_scheduler.sync_categories(question_index.categories())
+    st.session_state.scheduler_index = question_index
+
 # Inisialisasi Komponen
-text_analyzer = TextMiningAnalyzer(stopwords)
-scoring_engine = ScoringEngine()
-viz_generator = VisualizationGenerator()
-cv_analyzer = CVAnalyzer()
-voice_handler = VoiceHandler()
+@st.cache_resource
+def load_components():
+    # Dibuat sekali per proses dan dipakai bersama semua sesi;
+    # komponen tidak menyimpan state per pengguna dan tidak bergantung pada data/
+    return {
+        'scoring_engine': ScoringEngine(),
+        'viz_generator': VisualizationGenerator(),
+        'cv_analyzer': CVAnalyzer(),
+        'cv_service': CVAnalysisService(),
+        'voice_handler': VoiceHandler()
+    }
+
+components = load_components()
+scoring_engine = components['scoring_engine']
+viz_generator = components['viz_generator']
+cv_analyzer = components['cv_analyzer']
+cv_service = components['cv_service']
+voice_handler = components['voice_handler']
+
+def show_live_stats(answer, question, state_key):
+    # Statistik langsung: hanya teks yang baru ditambahkan yang diproses ulang
+    tracker = st.session_state.get(state_key)
+    if tracker is None or tracker.keywords != question['keywords']:
+        tracker = IncrementalAnalyzer(
+            question['keywords'],
+            stopwords,
+            text_analyzer.compile_keywords(question['keywords'])
+        )
+        st.session_state[state_key] = tracker
+    tracker.update(answer)
+    live = tracker.snapshot(question['ideal_length'])
+    ideal_range = question['ideal_length']
+    
+    col_c1, col_c2, col_c3, col_c4 = st.columns(4)
+    with col_c1:
+        st.caption(f"📝 Jumlah kata: {live['word_count']}")
+    with col_c2:
+        st.caption(f"🎯 Target: {ideal_range[0]}-{ideal_range[1]} kata")
+    with col_c3:
+        status = {
+            'ok': "✅ Pas",
+            'short': "⚠️ Masih terlalu pendek",
+            'long': "⚠️ Terlalu panjang"
+        }[live['length_status']]
+        st.caption(f"{status}")
+    with col_c4:
+        st.caption(f"🔑 Keyword: {live['keyword_coverage']:.0f}% ({len(live['keywords_found'])}/{len(question['keywords'])})")
+    
+    if answer.strip() and live['keywords_missing']:
+        st.caption(f"💡 Belum dibahas: {', '.join(live['keywords_missing'][:6])}")
+
+    # Frasa yang diulang-ulang, dari penghitung n-gram yang diperbarui bertahap
+    repeated = [(' '.join(gram), count) for gram, count in live['trigrams'] + live['bigrams'] if count > 1]
+    if repeated:
+        st.caption(f"🔁 Frasa berulang: {', '.join(f'{phrase} ({count}x)' for phrase, count in repeated[:3])}")
 
 # Header
 st.markdown('''
@@ -360,7 +491,8 @@ with st.sidebar:
         )
     if uploaded_file:
             with st.spinner("Menganalisis CV Anda..."):
-                cv_data = cv_analyzer.analyze_cv(uploaded_file)
+                # Diproses di worker process; file yang sama diambil dari cache
+                cv_data = cv_service.analyze(uploaded_file.getvalue(), uploaded_file.name)
                 st.session_state.cv_uploaded = True
                 st.session_state.cv_data = cv_data
             
@@ -421,12 +553,12 @@ with st.sidebar:
     
     # Statistik Interview
     st.markdown("### 📊 Progress Latihan")
-    if st.session_state.question_count > 0:
-        avg_score = st.session_state.total_score / st.session_state.question_count
+    if dashboard_stats.count > 0:
+        avg_score = dashboard_stats.overall.mean
         
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Pertanyaan", st.session_state.question_count)
+            st.metric("Pertanyaan", dashboard_stats.count)
         with col2:
             st.metric("Rata-rata", f"{avg_score:.1f}")
         
@@ -439,9 +571,7 @@ with st.sidebar:
             st.warning("💪 Terus Berlatih!")
         
         if st.button("🔄 Reset Progress", use_container_width=True):
-            st.session_state.interview_history = []
-            st.session_state.total_score = 0
-            st.session_state.question_count = 0
+            history_store.clear(user_id)
             st.session_state.current_analysis = None
             st.rerun()
     else:
@@ -461,6 +591,26 @@ with st.sidebar:
     
     if st.session_state.interview_mode == 'voice':
         st.info("🎤 Mode suara: Bicara jawaban Anda dan sistem akan mentranskripsikannya!")
+    
+    # Statistik waktu per tahap analisis (opt-in)
+    if ANALYSIS_TIMING:
+        st.markdown("---")
+        with st.expander("⏱️ Waktu Analisis per Tahap"):
+            timing_stats = timing_registry.snapshot()
+            if timing_stats:
+                st.table({
+                    stage: {
+                        'calls': stats['calls'],
+                        'mean (ms)': round(stats['mean_seconds'] * 1000, 1),
+                        'max (ms)': round(stats['max_seconds'] * 1000, 1)
+                    }
+                    for stage, stats in sorted(timing_stats.items(), key=lambda x: -x[1]['total_seconds'])
+                })
+            else:
+                st.caption("Belum ada analisis yang tercatat")
+
+# Diset True selama ada transkripsi yang masih berjalan
+poll_transcription = False
 
 # Konten Utama
 tab1, tab2, tab3 = st.tabs(["🎯 Latihan Interview", "📊 Analitik", "💡 Tips & Panduan"])
@@ -469,13 +619,43 @@ with tab1:
     # Pemilihan Pertanyaan
     st.markdown("### 📝 Pilih Topik Pertanyaan")
     
-    col1, col2, col3 = st.columns([2, 1, 1])
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    
+    # Sampler per sesi: pertanyaan tidak diulang sampai semua pertanyaan
+    # dengan filter yang sama sudah muncul (dibuat ulang jika data dimuat ulang)
+    question_sampler = st.session_state.get('question_sampler')
+    if question_sampler is None or question_sampler.index is not question_index:
+        question_sampler = QuestionSampler(question_index)
+        st.session_state.question_sampler = question_sampler
+        st.session_state.current_question_id = None
+    
+    categories = question_index.categories()
+    
+    def pick_random_category():
+        # Dijalankan sebelum widget dibuat ulang, jadi selectbox ikut berubah
+        import random
+        st.session_state.category_select = random.choice(categories)
+        st.session_state.current_question_id = None
+    
+    def next_question():
+        st.session_state.current_question_id = None
+    
+    recommendation = question_scheduler.recommend()
+    
+    def pick_recommended():
+        # Kategori terlemah dengan level yang menantang tapi masih terjangkau
+        st.session_state.category_select = recommendation['category']
+        st.session_state.difficulty_select = recommendation['difficulty']
+        st.session_state.current_question_id = None
+    
+    if 'difficulty_select' not in st.session_state:
+        st.session_state.difficulty_select = "Mid-level"
     
     with col1:
-        categories = list(questions_data.keys())
         category = st.selectbox(
             "Kategori:",
             categories,
+            key='category_select',
             help="Pilih kategori sesuai fokus latihan Anda"
         )
     
@@ -483,18 +663,61 @@ with tab1:
         difficulty = st.select_slider(
             "Level:",
             options=["Junior", "Mid-level", "Senior"],
-            value="Mid-level"
+            key='difficulty_select'
         )
     
     with col3:
-        if st.button("🎲 Acak", use_container_width=True):
-            import random
-            category = random.choice(categories)
-            st.rerun()
+        st.button("🎲 Acak", use_container_width=True, on_click=pick_random_category)
+    
+    with col4:
+        st.button(
+            "🎯 Rekomendasi",
+            use_container_width=True,
+            on_click=pick_recommended,
+            disabled=recommendation is None,
+            help="Pilih area terlemah Anda berdasarkan riwayat latihan"
+        )
+    
+    if recommendation is not None:
+        component_labels = {
+            'technical_accuracy': "Akurasi Teknis",
+            'depth_of_knowledge': "Kedalaman",
+            'communication_clarity': "Komunikasi"
+        }
+        focus = component_labels.get(recommendation['weak_component'])
+        st.caption(
+            f"🎯 Rekomendasi berikutnya: **{recommendation['category']}** ({recommendation['difficulty']})"
+            + (f" · fokus: {focus}" if focus else " · belum pernah dilatih")
+        )
+    
+    category_tags = question_index.tags(category)
+    tag = None
+    col_tag, col_next = st.columns([3, 1])
+    with col_tag:
+        if category_tags:
+            tag_choice = st.selectbox("Tag:", ["Semua"] + category_tags)
+            tag = None if tag_choice == "Semua" else tag_choice
+    with col_next:
+        if question_index.count(category) > 1:
+            st.button("🔄 Pertanyaan Lain", use_container_width=True, on_click=next_question)
+    
+    # Ambil pertanyaan baru jika filter berubah atau diminta
+    selection = (category, difficulty, tag)
+    current_question = question_index.by_id.get(st.session_state.get('current_question_id'))
+    if current_question is None or st.session_state.get('question_selection') != selection:
+        current_question = question_sampler.next(category, difficulty, tag)
+        if current_question is None:
+            # Tidak ada pertanyaan untuk level ini: pakai level lain di kategori yang sama
+            st.info(f"💡 Belum ada pertanyaan level {difficulty} untuk filter ini, menampilkan level lain.")
+            current_question = question_sampler.next(category, None, tag) or question_sampler.next(category)
+        if current_question is None:
+            st.error(f"❌ Tidak ada pertanyaan yang bisa ditampilkan untuk kategori {category}.")
+            st.stop()
+        st.session_state.current_question_id = current_question['id']
+        st.session_state.question_selection = selection
     
     # Tampilkan Pertanyaan
     st.markdown("---")
-    current_question = questions_data[category]
     
     st.markdown(f"### 💬 Pertanyaan: {category}")
     st.markdown(f'<div class="feature-card"><h4>{current_question["question"]}</h4></div>', unsafe_allow_html=True)
@@ -507,7 +730,7 @@ with tab1:
             
             st.markdown("**Skill Relevan yang Bisa Disebutkan:**")
             relevant_skills = [s for s in cv_data.get('skills', []) 
-                             if any(kw in s.lower() for kw in current_question['keywords'])]
+                             if any(kw in s.lower() for kw in question_keywords.get(current_question['id'], ()))]
             if relevant_skills:
                 for skill in relevant_skills[:5]:
                     st.markdown(f"• {skill}")
@@ -552,18 +775,8 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
             key="answer_input"
         )
         
-        # Penghitung kata
-        word_count = len(answer.split()) if answer else 0
-        ideal_range = current_question['ideal_length']
-        
-        col_c1, col_c2, col_c3 = st.columns(3)
-        with col_c1:
-            st.caption(f"📝 Jumlah kata: {word_count}")
-        with col_c2:
-            st.caption(f"🎯 Target: {ideal_range[0]}-{ideal_range[1]} kata")
-        with col_c3:
-            status = "✅ Pas" if ideal_range[0] <= word_count <= ideal_range[1] else "⚠️ Perlu disesuaikan"
-            st.caption(f"{status}")
+        # Penghitung kata & cakupan keyword
+        show_live_stats(answer, current_question, 'live_text_stats')
         
     else:  # Mode suara
         # Check if mic recorder available
@@ -656,14 +869,38 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
                     st.caption("Klik untuk convert audio ke teks (memerlukan internet)")
                 
                 if transcribe_btn:
-                    with st.spinner("🔄 Sedang mentranskripsikan audio... (10-30 detik)"):
-                        transcribed_text = voice_handler.transcribe_from_audio_bytes(audio_data['bytes'])
-                        st.session_state.transcribed_answer = transcribed_text
-                    
-                    if "❌" in transcribed_text:
-                        st.error(transcribed_text)
-                    else:
+                    # Transkripsi berjalan di latar belakang; halaman memeriksa statusnya
+                    st.session_state.transcription_job = voice_handler.submit_transcription(audio_data['bytes'])
+                    st.session_state.transcribed_answer = None
+                    st.session_state.transcription_warning = None
+            
+            # Status transkripsi di latar belakang
+            job_id = st.session_state.get('transcription_job')
+            if job_id:
+                job = voice_handler.get_job(job_id)
+                if job is None:
+                    st.session_state.transcription_job = None
+                elif not job.finished:
+                    done_chunks, total_chunks = job.progress
+                    st.info(f"🔄 Sedang mentranskripsikan audio... bagian {done_chunks}/{total_chunks} selesai (halaman diperbarui otomatis)")
+                    if total_chunks:
+                        st.progress(done_chunks / total_chunks)
+                    if job.partial_text:
+                        st.caption(f"📝 {job.partial_text} ...")
+                    poll_transcription = True
+                else:
+                    voice_handler.pop_job(job_id)
+                    st.session_state.transcription_job = None
+                    if job.status == 'done':
+                        st.session_state.transcribed_answer = job.text
                         st.success("✅ Transkripsi berhasil!")
+                    elif job.status == 'partial':
+                        # Peringatan tetap tampil bersama hasil sampai transkripsi berikutnya
+                        st.session_state.transcribed_answer = job.text
+                        st.session_state.transcription_warning = job.error
+                    else:
+                        st.session_state.transcribed_answer = job.error
+                        st.error(job.error)
             
             # Tampilkan hasil transkripsi
             if st.session_state.get('transcribed_answer'):
@@ -673,6 +910,8 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
                 if "❌" not in transcribed:
                     st.markdown("---")
                     st.markdown("### ✍️ Hasil Transkripsi")
+                    if st.session_state.get('transcription_warning'):
+                        st.warning(st.session_state.transcription_warning)
                     st.info("💡 Anda bisa edit hasil transkripsi di bawah jika ada yang salah")
                     
                     answer = st.text_area(
@@ -683,18 +922,8 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
                         help="Hasil transkripsi bisa diedit untuk perbaiki kesalahan"
                     )
                     
-                    # Word counter
-                    word_count = len(answer.split()) if answer else 0
-                    ideal_range = current_question['ideal_length']
-                    
-                    col_c1, col_c2, col_c3 = st.columns(3)
-                    with col_c1:
-                        st.caption(f"📝 Jumlah kata: {word_count}")
-                    with col_c2:
-                        st.caption(f"🎯 Target: {ideal_range[0]}-{ideal_range[1]} kata")
-                    with col_c3:
-                        status = "✅ Pas" if ideal_range[0] <= word_count <= ideal_range[1] else "⚠️ Perlu disesuaikan"
-                        st.caption(f"{status}")
+                    # Word counter & cakupan keyword
+                    show_live_stats(answer, current_question, 'live_voice_stats')
     
     # Tombol Aksi
     st.markdown("---")
@@ -738,30 +967,36 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
             st.warning("⚠️ Jawaban terlalu singkat. Minimal 20 kata untuk analisis bermakna.")
         else:
             with st.spinner("🔬 Sedang menganalisis jawaban Anda..."):
-                # Ambil jawaban terbaik
-                best_answer = best_answers_data.get(category, {}).get('answer', '')
+                # Jawaban terbaik pertanyaan ini (fallback: jawaban kategori)
+                best_answer = current_question['best_answer']
                 
-                # Jalankan analisis
-                analysis_result = text_analyzer.comprehensive_analysis(
-                    answer=answer,
-                    question_data=current_question,
-                    best_answer=best_answer,
-                    category_keywords=keywords_data.get(category, [])
-                )
+                # Jalankan analisis + hitung skor (di-cache per jawaban)
+                def run_analysis():
+                    analysis = text_analyzer.comprehensive_analysis(
+                        answer=answer,
+                        question_data=current_question,
+                        best_answer=best_answer,
+                        category_keywords=keywords_data.get(category, []),
+                        category=category
+                    )
+                    return analysis, scoring_engine.calculate_scores(
+                        analysis_result=analysis,
+                        question_weights=current_question['weight'],
+                        difficulty=difficulty
+                    )
                 
-                # Hitung skor
-                scores = scoring_engine.calculate_scores(
-                    analysis_result=analysis_result,
-                    question_weights=current_question['weight'],
-                    difficulty=difficulty
+                cache_key = make_cache_key(
+                    normalize_answer(answer), category, current_question['id'], difficulty, data_version
                 )
+                analysis_result, scores = get_analysis_cache().get_or_compute(cache_key, run_analysis)
                 
                 # Generate feedback
                 feedback = scoring_engine.generate_detailed_feedback(
                     answer=answer,
                     best_answer=best_answer,
                     analysis_result=analysis_result,
-                    scores=scores
+                    scores=scores,
+                    key_points=best_answer_points.get(current_question['id'])
                 )
                 
                 # Simpan ke session
@@ -775,14 +1010,10 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
                     'feedback': feedback
                 }
                 
-                # Update history
-                st.session_state.question_count += 1
-                st.session_state.total_score += scores['overall']
-                st.session_state.interview_history.append({
-                    'category': category,
-                    'score': scores['overall'],
-                    'difficulty': difficulty
-                })
+                # Simpan ke riwayat
+                history_store.add_attempt(user_id, category, difficulty, scores)
+                dashboard_stats.add(category, difficulty, scores['overall'])
+                question_scheduler.record(category, difficulty, scores)
             
             # Tampilkan Hasil
             st.markdown("---")
@@ -962,21 +1193,17 @@ Ingat: Sertakan angka, tools spesifik, dan dampak bisnis!""",
 with tab2:
     st.markdown("### 📊 Dashboard Analitik Anda")
 
-    if st.session_state.question_count == 0:
+    if dashboard_stats.count == 0:
         st.info("📝 Mulai latihan untuk melihat analitik Anda!")
 
     else:
         # =============================================================
         # 1. HITUNG METRIK UTAMA
         # =============================================================
-        avg_score = st.session_state.total_score / st.session_state.question_count
-        best_score = max([item['score'] for item in st.session_state.interview_history])
-
-        improvement = 0
-        if len(st.session_state.interview_history) >= 2:
-            recent_avg = sum([item['score'] for item in st.session_state.interview_history[-3:]]) / min(3, len(st.session_state.interview_history))
-            first_avg = sum([item['score'] for item in st.session_state.interview_history[:3]]) / min(3, len(st.session_state.interview_history))
-            improvement = recent_avg - first_avg
+        # Semua agregat dibaca dari dashboard_stats, tanpa memindai riwayat
+        avg_score = dashboard_stats.overall.mean
+        best_score = dashboard_stats.overall.max
+        improvement = dashboard_stats.improvement()
 
         # =============================================================
         # 2. HERO CARDS (Performance Overview)
@@ -989,7 +1216,7 @@ with tab2:
             st.markdown(f"""
             <div style="background: linear-gradient(135deg, #667eea, #764ba2); padding: 1.5rem; border-radius: 15px; text-align: center;">
                 <div style="color:white; opacity:0.9; font-size:0.9rem;">Total Latihan</div>
-                <div style="color:white; font-size:2.5rem; font-weight:800;">{st.session_state.question_count}</div>
+                <div style="color:white; font-size:2.5rem; font-weight:800;">{dashboard_stats.count}</div>
                 <div style="color:white; opacity:0.8; font-size:0.85rem;">pertanyaan dijawab</div>
             </div>
             """, unsafe_allow_html=True)
@@ -1035,36 +1262,7 @@ with tab2:
         # =====================================================
         st.markdown("### 🧭 Skill Radar Analysis")
 
-        # Hitung kategori dulu
-        category_data = {}
-        for item in st.session_state.interview_history:
-            category_data.setdefault(item['category'], []).append(item['score'])
-
-        category_avgs = {cat: sum(v)/len(v) for cat, v in category_data.items()}
-
-        radar_categories = list(category_avgs.keys())
-        radar_values     = list(category_avgs.values())
-
-        # Tutup polygon jika kategori > 1
-        if len(radar_categories) > 1:
-            radar_categories.append(radar_categories[0])
-            radar_values.append(radar_values[0])
-
-        fig_radar = go.Figure()
-        fig_radar.add_trace(go.Scatterpolar(
-            r = radar_values,
-            theta = radar_categories,
-            fill='toself',
-            line=dict(color="#6C63FF", width=3),
-            marker=dict(size=7)
-        ))
-
-        fig_radar.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0,5])),
-            showlegend=False,
-            height=500
-        )
-
+        fig_radar = viz_generator.create_category_radar_chart(dashboard_stats)
         st.plotly_chart(fig_radar, use_container_width=True)
 
         st.markdown("---")
@@ -1072,40 +1270,7 @@ with tab2:
         # ============ CATEGORY PERFORMANCE RANKING ============
         st.markdown("#### 📊 Category Performance Ranking")
 
-        # buat data kategori
-        category_data = {}
-        for item in st.session_state.interview_history:
-            cat = item['category']
-            category_data.setdefault(cat, []).append(item['score'])
-
-        category_avgs = {cat: sum(v) / len(v) for cat, v in category_data.items()}
-
-        sorted_cats = sorted(category_avgs.items(), key=lambda x: x[1], reverse=True)
-        cats_sorted = [c[0] for c in sorted_cats]
-        scores_sorted = [c[1] for c in sorted_cats]
-        attempts_sorted = [len(category_data[c[0]]) for c in sorted_cats]
-
-        colors_sorted = [
-            '#11998e' if s >= 4 else '#667eea' if s >= 3.5 else '#f093fb' if s >= 3 else '#dc3545'
-            for s in scores_sorted
-        ]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            y=cats_sorted,
-            x=scores_sorted,
-            orientation='h',
-            text=[f"{s:.1f} ({a}x)" for s, a in zip(scores_sorted, attempts_sorted)],
-            textposition='outside',
-            marker=dict(color=colors_sorted, line=dict(color='white', width=2))
-        ))
-
-        fig.update_layout(
-            xaxis=dict(range=[0, 5.5]),
-            height=max(300, len(cats_sorted) * 50),
-            margin=dict(l=150)
-        )
-
+        fig = viz_generator.create_category_ranking_chart(dashboard_stats)
         st.plotly_chart(fig, use_container_width=True)
         st.caption("💡 Hijau ≥4.0 | Biru ≥3.5 | Pink ≥3.0 | Merah <3.0")
 
@@ -1115,7 +1280,23 @@ with tab2:
 
         st.markdown("#### 📈 Perkembangan Skor dari Waktu ke Waktu")
 
-        progress_fig = viz_generator.create_progress_chart(st.session_state.interview_history)
+        col_t1, col_t2 = st.columns(2)
+        with col_t1:
+            trend_type = st.radio(
+                "Jenis trend",
+                ["Rata-rata bergerak", "EWMA"],
+                horizontal=True,
+                key='trend_type',
+                help="EWMA memberi bobot lebih besar pada latihan terbaru"
+            )
+        with col_t2:
+            trend_window = st.slider("Jendela trend (latihan)", 2, 20, 3, key='trend_window')
+
+        progress_fig = viz_generator.create_progress_chart(
+            dashboard_stats,
+            trend='ewma' if trend_type == "EWMA" else 'sma',
+            window=trend_window
+        )
         st.plotly_chart(progress_fig, use_container_width=True)
 
         st.caption("💡 Biru: skor | Hijau: trend | Kuning: target 3.5")
@@ -1125,26 +1306,7 @@ with tab2:
         # ============ PERFORMA KATEGORI (BAR CHART) ============
         st.markdown("#### 🎯 Performa per Kategori")
 
-        categories = list(category_avgs.keys())
-        avgs = list(category_avgs.values())
-        attempts = [len(category_data[c]) for c in categories]
-
-        colors = ['#28a745' if a >= 4 else '#ffc107' if a >= 3.5 else '#dc3545' for a in avgs]
-
-        fig = go.Figure([go.Bar(
-            x=categories,
-            y=avgs,
-            text=[f"{a:.1f}<br>({t}x)" for a, t in zip(avgs, attempts)],
-            textposition='outside',
-            marker_color=colors
-        )])
-
-        fig.update_layout(
-            yaxis=dict(range=[0, 5.5]),
-            height=400
-        )
-        fig.add_hline(y=3.5, line_dash="dash", line_color="orange")
-
+        fig = viz_generator.create_category_bar_chart(dashboard_stats)
         st.plotly_chart(fig, use_container_width=True)
 
         st.markdown("---")
@@ -1152,15 +1314,11 @@ with tab2:
         # ============ DIFFICULTY BREAKDOWN ============
         st.markdown("#### 📊 Performa Berdasarkan Level Kesulitan")
 
-        difficulty_data = {}
-        for item in st.session_state.interview_history:
-            difficulty_data.setdefault(item['difficulty'], []).append(item['score'])
-
         col_d1, col_d2, col_d3 = st.columns(3)
         for col, lvl in zip([col_d1, col_d2, col_d3], ['Junior', 'Mid-level', 'Senior']):
-            if lvl in difficulty_data:
-                scores = difficulty_data[lvl]
-                col.metric(lvl, f"{sum(scores)/len(scores):.1f}/5.0", f"{len(scores)} percobaan")
+            if lvl in dashboard_stats.by_difficulty:
+                stats = dashboard_stats.by_difficulty[lvl]
+                col.metric(lvl, f"{stats.mean:.1f}/5.0", f"{stats.count} percobaan")
 
         st.markdown("---")
 
@@ -1171,14 +1329,12 @@ with tab2:
 
         with col_sw1:
             st.markdown("**🌟 Kategori Terkuat:**")
-            top_3 = sorted(category_avgs.items(), key=lambda x: x[1], reverse=True)[:3]
-            for i, (cat, s) in enumerate(top_3, 1):
+            for i, (cat, s) in enumerate(dashboard_stats.top_categories(3), 1):
                 st.markdown(f"{i}. **{cat}** — {s:.1f}/5.0")
 
         with col_sw2:
             st.markdown("**📈 Perlu Latihan:**")
-            bottom_3 = sorted(category_avgs.items(), key=lambda x: x[1])[:3]
-            for i, (cat, s) in enumerate(bottom_3, 1):
+            for i, (cat, s) in enumerate(dashboard_stats.bottom_categories(3), 1):
                 st.markdown(f"{i}. **{cat}** — {s:.1f}/5.0")
 
         st.markdown("---")
@@ -1186,11 +1342,11 @@ with tab2:
         # ============ RECENT 5 ============
         st.markdown("#### 🕐 5 Latihan Terakhir")
 
-        recent = st.session_state.interview_history[-5:]
-        for i, item in enumerate(reversed(recent), 1):
+        recent = history_store.recent(user_id, 5)
+        for i, item in enumerate(recent, 1):
             c1, c2, c3 = st.columns([3,1,1])
             with c1:
-                st.markdown(f"**{len(st.session_state.interview_history)-i+1}. {item['category']}**")
+                st.markdown(f"**{dashboard_stats.count-i+1}. {item['category']}**")
             with c2:
                 color = "🟢" if item['score']>=4 else "🟡" if item['score']>=3.5 else "🔴"
                 st.markdown(f"{color} {item['score']:.1f}/5.0")
@@ -1443,3 +1599,8 @@ with tab3:
 # Footer
 st.markdown("---")
 st.caption("🎯 Simulator Interview Data Science | Dibuat dengan ❤️ untuk Data Scientist Indonesia")
+
+# Cek ulang status transkripsi setelah seluruh halaman dirender
+if poll_transcription:
+    time.sleep(1)
+    st.rerun()
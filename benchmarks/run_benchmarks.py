@@ -0,0 +1,298 @@
+"""
+Benchmark Suite
+Times every TextMiningAnalyzer method, CV analysis and the end-to-end
+analyze -> score -> feedback pipeline on synthetic answers of growing length.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 50 500 5000 --repeats 20
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<old>.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT / 'src'))
+
+from data_loader import DataLoader
+from text_mining import TextMiningAnalyzer
+from scoring import ScoringEngine
+from reference_models import ReferenceModelBank
+from cv_analyzer import CVAnalyzer
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+
+DEFAULT_SIZES = [50, 200, 1000, 5000]
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+
+
+def load_data(data_dir):
+    """Load datasets quietly (DataLoader reports progress on stdout)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader = DataLoader(data_dir)
+        return {
+            'questions': loader.load_questions(),
+            'keywords': loader.load_keywords(),
+            'best_answers': loader.load_best_answers(),
+            'stopwords': loader.load_stopwords()
+        }
+
+
+def make_answer(n_words, rng, sentences, keywords):
+    """
+    Build a synthetic answer of exactly n_words words
+
+    Sentences are sampled from the best-answer corpus, with question keywords
+    and numbers mixed in so every analyzer has something to find.
+    """
+    words = []
+    while len(words) < n_words:
+        sentence = rng.choice(sentences).split()
+        if keywords and rng.random() < 0.5:
+            sentence.insert(rng.randrange(len(sentence) + 1), rng.choice(keywords))
+        if rng.random() < 0.2:
+            sentence.insert(rng.randrange(len(sentence) + 1), str(rng.randrange(2, 100)))
+        words.extend(sentence)
+    text = ' '.join(words[:n_words])
+    return text if text.endswith('.') else text + '.'
+
+
+def make_cv_docx(text):
+    """Wrap text in an in-memory DOCX upload, or None without python-docx"""
+    if docx is None:
+        return None
+    document = docx.Document()
+    for paragraph in text.split('. '):
+        document.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    buffer.name = 'benchmark_cv.docx'
+    return buffer
+
+
+def measure(fn, repeats, warmup=2):
+    """
+    Time fn and measure its allocations
+
+    Returns:
+        dict: Latency percentiles (ms) and allocation stats
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        fn()
+        timings.append((time.perf_counter_ns() - start) / 1e6)
+
+    # Allocations are measured in a separate run: tracemalloc skews timings
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = np.array(timings)
+    return {
+        'repeats': repeats,
+        'mean_ms': float(timings.mean()),
+        'p50_ms': float(np.percentile(timings, 50)),
+        'p95_ms': float(np.percentile(timings, 95)),
+        'p99_ms': float(np.percentile(timings, 99)),
+        'peak_alloc_kib': (peak - before) / 1024,
+        'retained_alloc_kib': (current - before) / 1024
+    }
+
+
+def build_cases(data, answer, category):
+    """Benchmark cases for one answer: name -> zero-argument callable"""
+    question = data['questions'][category]
+    best_answer = data['best_answers'].get(category, {}).get('answer', '')
+    category_keywords = data['keywords'].get(category, [])
+    all_keywords = list(set(question['keywords'] + category_keywords))
+
+    analyzer = data['analyzer']
+    engine = data['engine']
+    cv_analyzer = data['cv_analyzer']
+
+    def pipeline():
+        analysis = analyzer.comprehensive_analysis(
+            answer, question, best_answer, category_keywords, category=category
+        )
+        scores = engine.calculate_scores(analysis, question['weight'], 'Mid-level')
+        engine.generate_detailed_feedback(answer, best_answer, analysis, scores)
+
+    cases = {
+        'parse': lambda: analyzer.parse(answer),
+        'quick_analysis': lambda: analyzer.quick_analysis(answer, question['keywords']),
+        'keyword_analysis': lambda: analyzer.keyword_analysis(answer, all_keywords),
+        'tfidf_analysis': lambda: analyzer.tfidf_analysis(answer, [best_answer], category),
+        'calculate_cosine_similarity': lambda: analyzer.calculate_cosine_similarity(answer, best_answer, category),
+        'ngram_analysis': lambda: analyzer.ngram_analysis(answer),
+        'named_entity_recognition': lambda: analyzer.named_entity_recognition(answer),
+        'sentiment_analysis': lambda: analyzer.sentiment_analysis(answer),
+        'readability_analysis': lambda: analyzer.readability_analysis(answer),
+        'structural_analysis': lambda: analyzer.structural_analysis(answer, question['ideal_length']),
+        'coherence_analysis': lambda: analyzer.coherence_analysis(answer),
+        'comprehensive_analysis': lambda: analyzer.comprehensive_analysis(
+            answer, question, best_answer, category_keywords, category=category
+        ),
+        'pipeline': pipeline,
+        'cv_extract_skills': lambda: cv_analyzer.extract_skills(answer),
+        'cv_detect_experience_level': lambda: cv_analyzer.detect_experience_level(answer),
+        'cv_extract_education': lambda: cv_analyzer.extract_education(answer)
+    }
+
+    cv_file = make_cv_docx(answer)
+    if cv_file is not None:
+        def analyze_cv():
+            cv_file.seek(0)
+            cv_analyzer.analyze_cv(cv_file)
+        cases['cv_analyze_cv'] = analyze_cv
+
+    return cases
+
+
+def run(sizes, repeats, seed, only=None, data_dir=ROOT / 'data'):
+    """
+    Run the suite
+
+    Returns:
+        list: One result dict per (case, answer size)
+    """
+    data = load_data(data_dir)
+    reference_models = ReferenceModelBank(
+        data['questions'], data['keywords'], data['best_answers'], data['stopwords']
+    ).fit_all()
+    data['analyzer'] = TextMiningAnalyzer(data['stopwords'], reference_models)
+    data['engine'] = ScoringEngine()
+    data['cv_analyzer'] = CVAnalyzer()
+
+    rng = random.Random(seed)
+    category = sorted(data['questions'])[0]
+    sentences = [
+        s.strip() + '.'
+        for entry in data['best_answers'].values()
+        for s in entry.get('answer', '').split('.')
+        if len(s.split()) > 3
+    ]
+    keywords = list(data['questions'][category]['keywords'])
+
+    results = []
+    for size in sizes:
+        answer = make_answer(size, rng, sentences, keywords)
+        for name, fn in build_cases(data, answer, category).items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+            # Long inputs get fewer repeats so the suite stays practical
+            case_repeats = max(5, repeats if size <= 1000 else repeats // 4)
+            stats = measure(fn, case_repeats)
+            results.append({'case': name, 'words': size, **stats})
+            print(
+                f"{name:<30} {size:>6} words  p50 {stats['p50_ms']:9.2f} ms  "
+                f"p95 {stats['p95_ms']:9.2f} ms  p99 {stats['p99_ms']:9.2f} ms  "
+                f"peak {stats['peak_alloc_kib']:9.1f} KiB",
+                file=sys.stderr
+            )
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    """
+    Print p50 ratios against a previous results file
+
+    Returns:
+        int: Number of cases slower than threshold x baseline
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['case'], r['words']): r for r in baseline['results']}
+
+    regressions = 0
+    print(f"\nComparison with {baseline_path} (commit {baseline['meta'].get('commit')}):", file=sys.stderr)
+    for result in results:
+        old = previous.get((result['case'], result['words']))
+        if not old or old['p50_ms'] <= 0:
+            continue
+        ratio = result['p50_ms'] / old['p50_ms']
+        flag = ''
+        if ratio > threshold:
+            flag = '  ⚠️ REGRESSION'
+            regressions += 1
+        print(
+            f"{result['case']:<30} {result['words']:>6} words  "
+            f"{old['p50_ms']:9.2f} -> {result['p50_ms']:9.2f} ms  x{ratio:5.2f}{flag}",
+            file=sys.stderr
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark analyzers and the scoring pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Answer lengths in words")
+    parser.add_argument('--repeats', type=int, default=30, help="Timed runs per case")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for synthetic answers")
+    parser.add_argument('--only', nargs='+', help="Only run cases whose name contains one of these")
+    parser.add_argument('--output', help="Results JSON path (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--compare', help="Previous results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.2, help="p50 ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeats, args.seed, args.only)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'repeats': args.repeats,
+            'seed': args.seed
+        },
+        'results': results
+    }
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['commit'] or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results saved to {output}", file=sys.stderr)
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+Batch Scoring Module
+Headless scoring of archived answers: JSONL records in, JSONL results out
+
+Usage:
+    python src/batch_scoring.py answers.jsonl -o scored.jsonl --workers 4
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from data_loader import DataLoader
+from text_mining import TextMiningAnalyzer
+from scoring import ScoringEngine
+from reference_models import ReferenceModelBank
+from parallel import bounded_imap
+from question_index import QuestionIndex
+
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+class BatchScorer:
+    """
+    Runs the same analyze -> score -> feedback pipeline as the app, without Streamlit
+    """
+
+    def __init__(self, data_dir=DEFAULT_DATA_DIR):
+        """
+        Load datasets and build the analysis components
+
+        Args:
+            data_dir (str): Directory containing data files
+        """
+        # DataLoader reports progress on stdout; keep stdout clean for JSONL output
+        with contextlib.redirect_stdout(sys.stderr):
+            bank = DataLoader(data_dir).load_bank()
+        self.questions = bank['questions']
+        self.keywords = bank['keywords']
+        self.best_answers = bank['best_answers']
+        self.best_answer_points = bank['best_answer_points']
+        self.question_index = QuestionIndex(bank['question_items'])
+        # Records without 'question_id' are scored against the first question of their category
+        self.default_questions = {}
+        for item in self.question_index.items:
+            self.default_questions.setdefault(item['category'], item)
+        stopwords = bank['stopwords']
+
+        reference_models = ReferenceModelBank(self.questions, self.keywords, self.best_answers, stopwords).fit_all()
+        self.text_analyzer = TextMiningAnalyzer(stopwords, reference_models)
+        self.scoring_engine = ScoringEngine()
+
+    def score_record(self, record, include_analysis=False):
+        """
+        Score a single answer record
+
+        Args:
+            record (dict): {'category', 'difficulty', 'answer'}, optional 'question_id',
+                plus optional passthrough fields
+            include_analysis (bool): Include the raw analysis result in the output
+
+        Returns:
+            dict: Input record with 'scores' and 'feedback', or 'error'
+        """
+        result = dict(record)
+        if 'error' in record:
+            # Malformed input record, passed through unchanged
+            return result
+
+        category = record.get('category')
+        answer = record.get('answer') or ''
+        difficulty = record.get('difficulty') or 'Mid-level'
+        question_id = record.get('question_id')
+
+        # Field types are checked before any lookup so a bad record can't end the run
+        for field, value in (('category', category), ('answer', answer), ('difficulty', difficulty)):
+            if not isinstance(value, str):
+                result['error'] = f"Field '{field}' must be a string, got {type(value).__name__}"
+                return result
+        if question_id is not None:
+            if isinstance(question_id, bool) or not isinstance(question_id, (str, int)):
+                result['error'] = f"Field 'question_id' must be a string, got {type(question_id).__name__}"
+                return result
+            # Question ids are stored as strings
+            question_id = str(question_id)
+
+        if category not in self.questions:
+            result['error'] = f"Unknown category: {category}"
+            return result
+        if not answer.strip():
+            result['error'] = "Empty answer"
+            return result
+
+        if question_id is not None:
+            question_data = self.question_index.by_id.get(question_id)
+            if question_data is None or question_data['category'] != category:
+                result['error'] = f"Unknown question_id for {category}: {question_id}"
+                return result
+        else:
+            question_data = self.default_questions[category]
+        best_answer = question_data['best_answer']
+
+        try:
+            analysis_result = self.text_analyzer.comprehensive_analysis(
+                answer=answer,
+                question_data=question_data,
+                best_answer=best_answer,
+                category_keywords=self.keywords.get(category, []),
+                category=category
+            )
+            scores = self.scoring_engine.calculate_scores(
+                analysis_result=analysis_result,
+                question_weights=question_data['weight'],
+                difficulty=difficulty
+            )
+            feedback = self.scoring_engine.generate_detailed_feedback(
+                answer=answer,
+                best_answer=best_answer,
+                analysis_result=analysis_result,
+                scores=scores,
+                key_points=self.best_answer_points.get(question_data['id'])
+            )
+        except Exception as e:
+            result['error'] = f"Analysis failed: {e}"
+            return result
+
+        result['scores'] = scores
+        result['feedback'] = feedback
+        if include_analysis:
+            result['analysis'] = analysis_result
+        return result
+
+
+# Per-process scorer, built once by the pool initializer
+_worker_scorer = None
+_worker_include_analysis = False
+
+
+def _init_worker(data_dir, include_analysis):
+    global _worker_scorer, _worker_include_analysis
+    _worker_scorer = BatchScorer(data_dir)
+    _worker_include_analysis = include_analysis
+
+
+def _score_chunk(records):
+    return [_worker_scorer.score_record(r, _worker_include_analysis) for r in records]
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def score_records(records, data_dir=DEFAULT_DATA_DIR, workers=None, chunk_size=16,
+                  include_analysis=False):
+    """
+    Score answer records on a process pool, streaming results in input order
+
+    Args:
+        records (iterable): Answer records, consumed lazily
+        data_dir (str): Directory containing data files
+        workers (int): Number of worker processes (default: CPU count); 1 runs in-process
+        chunk_size (int): Records sent to a worker per task
+        include_analysis (bool): Include the raw analysis result in each output
+
+    Yields:
+        dict: Scored record (see BatchScorer.score_record)
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        scorer = BatchScorer(data_dir)
+        for record in records:
+            yield scorer.score_record(record, include_analysis)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(str(data_dir), include_analysis)
+    ) as executor:
+        for results in bounded_imap(executor, _score_chunk, _chunks(records, chunk_size), workers * 4):
+            yield from results
+
+
+def read_jsonl(stream):
+    """
+    Parse JSONL records lazily; malformed lines become error records
+
+    Args:
+        stream (file): Text stream
+
+    Yields:
+        dict: Parsed record
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            record = {'line': line_number, 'error': f"Invalid JSON: {e}"}
+        if not isinstance(record, dict):
+            record = {'line': line_number, 'error': "Record is not a JSON object"}
+        yield record
+
+
+def _json_default(value):
+    """Serialize numpy scalars, sets and other non-JSON types"""
+    if hasattr(value, 'item'):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score interview answers offline (JSONL in, JSONL out)")
+    parser.add_argument('input', help="Input JSONL with {category, difficulty, answer} records ('-' for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="Output JSONL file ('-' for stdout)")
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR), help="Data directory")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=16, help="Records per worker task")
+    parser.add_argument('--include-analysis', action='store_true', help="Include raw analysis results")
+    args = parser.parse_args(argv)
+
+    in_stream = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    out_stream = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    total = 0
+    errors = 0
+    start = time.perf_counter()
+    try:
+        results = score_records(
+            read_jsonl(in_stream),
+            data_dir=args.data_dir,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            include_analysis=args.include_analysis
+        )
+        for result in results:
+            out_stream.write(json.dumps(result, ensure_ascii=False, default=_json_default) + '\n')
+            total += 1
+            if 'error' in result:
+                errors += 1
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(
+        f"📊 Scored {total} answers in {elapsed:.1f}s ({rate:.1f} answers/sec), {errors} errors",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
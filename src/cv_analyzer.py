@@ -7,6 +7,8 @@ import re
 from collections import Counter
 import io
 
+from keyword_matcher import KeywordRegex
+
 try:
     import PyPDF2
 except ImportError:
@@ -18,6 +20,18 @@ except ImportError:
     docx = None
 
 
+# Pola tahun pengalaman dalam satu regex (urutan prioritas: years, label, range).
+# Dibungkus lookahead agar match boleh tumpang tindih, misalnya "5 years experience"
+# di dalam "2-5 years experience".
+_EXPERIENCE_YEARS_PATTERN = re.compile(
+    r'(?=[\de])(?=(?:'
+    r'(?P<years>\d+)\+?\s*years?\s+(?:of\s+)?experience'
+    r'|experience:\s*(?P<label>\d+)\+?\s*years?'
+    r'|(?P<range_from>\d+)\s*-\s*(?P<range_to>\d+)\s*years?'
+    r'))'
+)
+
+
 class CVAnalyzer:
     """
     Menganalisis CV untuk mengekstraksi informasi penting dan memberikan saran yang relevan
@@ -44,10 +58,32 @@ class CVAnalyzer:
             'senior': ['senior', 'lead', 'principal', 'staff', 'architect', '5+ years', 'manager', 'head']
         }
 
+        # Kata kunci gelar pendidikan
+        self.degree_keywords = ['bachelor', 'b.s.', 'b.sc', 'b.tech', 'ba', 'bs', 'master', 'm.s.', 'm.sc', 'm.tech', 'ma', 'ms', 'mba', 'phd', 'ph.d', 'doctorate', 'doctoral']
+
+        # Satu regex untuk skill, indikator level dan gelar, dikompilasi sekali.
+        # Satu pola bisa punya beberapa peran ('skill', 'degree', atau nama level)
+        self.pattern_roles = {}
+        for skills in self.ds_skills.values():
+            for skill in skills:
+                self.pattern_roles.setdefault(skill, set()).add('skill')
+        for level, keywords in self.experience_keywords.items():
+            for keyword in keywords:
+                self.pattern_roles.setdefault(keyword, set()).add(level)
+        for degree in self.degree_keywords:
+            self.pattern_roles.setdefault(degree, set()).add('degree')
+        self.cv_pattern = KeywordRegex(self.pattern_roles)
+
     def analyze_cv(self, uploaded_file):
         """Fungsi utama untuk menganalisis CV"""
-        text = self.extract_text(uploaded_file)
+        return self.analyze_text(self.extract_text(uploaded_file))
+
+    def analyze_cv_bytes(self, data, file_name):
+        """Menganalisis CV dari isi file (bytes), misalnya di worker process"""
+        return self.analyze_text(self.extract_text_from_bytes(data, file_name))
 
+    def analyze_text(self, text):
+        """Menganalisis teks CV yang sudah diekstrak"""
         if not text:
             return {
                 'error': 'Tidak dapat mengekstrak teks dari CV',
@@ -55,10 +91,12 @@ class CVAnalyzer:
                 'experience_level': 'Tidak terdeteksi'
             }
 
-        skills = self.extract_skills(text)
-        experience_level = self.detect_experience_level(text)
-        experience_years = self.extract_experience_years(text)
-        education = self.extract_education(text)
+        # Satu kali scan untuk semua sinyal
+        scan = self.scan(text)
+        skills = self._format_skills(scan['skills'])
+        experience_level = self._level_from_keywords(scan['level_keywords'])
+        experience_years = scan['experience_years']
+        education = self._format_degrees(scan['degrees'])
 
         return {
             'skills': skills,
@@ -86,6 +124,28 @@ class CVAnalyzer:
             print(f"Kesalahan saat ekstraksi teks: {e}")
             return ""
 
+    def extract_text_from_bytes(self, data, file_name):
+        """Ekstraksi teks dari isi file; ekstensi file_name menentukan format"""
+        buffer = io.BytesIO(data)
+        buffer.name = file_name
+        return self.extract_text(buffer)
+
+    def pdf_page_count(self, data):
+        """Jumlah halaman PDF"""
+        return len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+
+    def extract_pdf_pages(self, data, start, end):
+        """Ekstraksi teks halaman [start, end) dari PDF"""
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+        texts = []
+        for page in pdf_reader.pages[start:end]:
+            try:
+                texts.append(page.extract_text() or '')
+            except Exception as e:
+                # Halaman rusak dilewati, halaman lain tetap dibaca
+                print(f"Kesalahan membaca halaman PDF: {e}")
+        return "".join(texts).lower()
+
     def extract_from_pdf(self, uploaded_file):
         if PyPDF2 is None:
             return "Pembacaan PDF tidak tersedia. Install PyPDF2."
@@ -95,7 +155,9 @@ class CVAnalyzer:
             text = "".join([page.extract_text() or '' for page in pdf_reader.pages])
             return text.lower()
         except Exception as e:
-            return f"Kesalahan membaca PDF: {str(e)}"
+            # Teks kosong: pesan error tidak boleh ikut dianalisis sebagai isi CV
+            print(f"Kesalahan membaca PDF: {str(e)}")
+            return ""
 
     def extract_from_docx(self, uploaded_file):
         if docx is None:
@@ -106,18 +168,47 @@ class CVAnalyzer:
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             return text.lower()
         except Exception as e:
-            return f"Kesalahan membaca DOCX: {str(e)}"
+            print(f"Kesalahan membaca DOCX: {str(e)}")
+            return ""
+
+    def scan(self, text):
+        """
+        Scan teks CV sekali untuk skill, sinyal level, tahun pengalaman dan gelar
+
+        Args:
+            text (str): Teks CV
+
+        Returns:
+            dict: 'skills' (set), 'level_keywords' (level -> set),
+                  'degrees' (set) dan 'experience_years' (str)
+        """
+        text_lower = text.lower()
+        skills = set()
+        degrees = set()
+        level_keywords = {level: set() for level in self.experience_keywords}
+
+        for pattern in self.cv_pattern.found(text_lower):
+            for role in self.pattern_roles[pattern]:
+                if role == 'skill':
+                    skills.add(pattern)
+                elif role == 'degree':
+                    degrees.add(pattern)
+                else:
+                    level_keywords[role].add(pattern)
+
+        return {
+            'skills': skills,
+            'level_keywords': level_keywords,
+            'degrees': degrees,
+            'experience_years': self._match_experience_years(text_lower)
+        }
 
     def extract_skills(self, text):
         """Mengekstraksi keahlian yang disebutkan di CV"""
-        found_skills = []
-        text_lower = text.lower()
-        for category, skills in self.ds_skills.items():
-            for skill in skills:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill.title())
-        return sorted(list(set(found_skills)))
+        return self._format_skills(self.scan(text)['skills'])
+
+    def _format_skills(self, found):
+        return sorted(set(skill.title() for skill in found))
 
     def categorize_skills(self, skills):
         """Mengelompokkan keahlian berdasarkan kategori"""
@@ -149,18 +240,15 @@ class CVAnalyzer:
 
     def detect_experience_level(self, text):
         """Mendeteksi level pengalaman berdasarkan isi CV"""
-        text_lower = text.lower()
-        level_scores = {'Junior': 0, 'Mid-level': 0, 'Senior': 0}
+        return self._level_from_keywords(self.scan(text)['level_keywords'])
 
-        for level, keywords in self.experience_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    if level == 'junior':
-                        level_scores['Junior'] += 1
-                    elif level == 'mid':
-                        level_scores['Mid-level'] += 1
-                    elif level == 'senior':
-                        level_scores['Senior'] += 1
+    def _level_from_keywords(self, level_keywords):
+        """Level dengan indikator terbanyak (default Mid-level)"""
+        level_scores = {
+            'Junior': len(level_keywords['junior']),
+            'Mid-level': len(level_keywords['mid']),
+            'Senior': len(level_keywords['senior'])
+        }
 
         if max(level_scores.values()) == 0:
             return 'Mid-level'
@@ -168,29 +256,33 @@ class CVAnalyzer:
 
     def extract_experience_years(self, text):
         """Mengekstraksi jumlah tahun pengalaman kerja"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'experience:\s*(\d+)\+?\s*years?',
-            r'(\d+)\s*-\s*(\d+)\s*years?'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                if len(match.groups()) == 1:
-                    return f"{match.group(1)} tahun"
-                else:
-                    return f"{match.group(1)}-{match.group(2)} tahun"
+        return self._match_experience_years(text.lower())
+
+    def _match_experience_years(self, text_lower):
+        # Match pertama untuk setiap bentuk; bentuk dengan prioritas lebih tinggi menang
+        first_label = None
+        first_range = None
+        for match in _EXPERIENCE_YEARS_PATTERN.finditer(text_lower):
+            if match.group('years'):
+                return f"{match.group('years')} tahun"
+            if match.group('label') and first_label is None:
+                first_label = match
+            elif match.group('range_from') and first_range is None:
+                first_range = match
+
+        if first_label is not None:
+            return f"{first_label.group('label')} tahun"
+        if first_range is not None:
+            return f"{first_range.group('range_from')}-{first_range.group('range_to')} tahun"
         return "Tidak disebutkan"
 
     def extract_education(self, text):
         """Mengekstraksi tingkat pendidikan"""
-        degrees = []
-        degree_keywords = ['bachelor', 'b.s.', 'b.sc', 'b.tech', 'ba', 'bs', 'master', 'm.s.', 'm.sc', 'm.tech', 'ma', 'ms', 'mba', 'phd', 'ph.d', 'doctorate', 'doctoral']
-        text_lower = text.lower()
-        for degree in degree_keywords:
-            if degree in text_lower:
-                degrees.append(degree.upper())
-        return list(set(degrees)) if degrees else ['Tidak disebutkan']
+        return self._format_degrees(self.scan(text)['degrees'])
+
+    def _format_degrees(self, found):
+        degrees = [degree.upper() for degree in self.degree_keywords if degree in found]
+        return degrees if degrees else ['Tidak disebutkan']
 
     def generate_recommendations(self, skills, experience_level):
         """Memberikan saran perbaikan CV berdasarkan hasil analisis"""
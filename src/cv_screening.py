@@ -0,0 +1,228 @@
+"""
+CV Screening Module
+Bulk CV analysis for a folder or zip archive of resumes
+
+Usage:
+    python src/cv_screening.py resumes/ -o screening/ --workers 4
+    python src/cv_screening.py resumes.zip -o screening/ --parquet
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from cv_analyzer import CVAnalyzer
+from parallel import bounded_imap
+
+
+CV_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+SUMMARY_COLUMNS = [
+    'file', 'experience_level', 'experience_years', 'education',
+    'skill_count', 'skills', 'error', 'json_file'
+]
+
+
+def list_cv_files(source):
+    """
+    Names of the CV files in a directory (recursive) or zip archive
+
+    Args:
+        source (str): Directory or .zip path
+
+    Returns:
+        list: Relative file names, sorted and unique
+    """
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [
+                info.filename for info in archive.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(CV_EXTENSIONS)
+            ]
+    else:
+        names = [
+            path.relative_to(source).as_posix() for path in source.rglob('*')
+            if path.is_file() and path.name.lower().endswith(CV_EXTENSIONS)
+        ]
+    # A zip may hold the same name twice; reading it returns the last entry anyway
+    return sorted(set(names))
+
+
+def iter_cv_files(source, names):
+    """
+    Read CV files one at a time
+
+    Args:
+        source (str): Directory or .zip path
+        names (list): File names from list_cv_files
+
+    Yields:
+        tuple: (file_name, bytes)
+    """
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for name in names:
+                yield name, archive.read(name)
+    else:
+        for name in names:
+            yield name, (source / name).read_bytes()
+
+
+# Per-process analyzer, built once by the pool initializer
+_worker_analyzer = None
+
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = CVAnalyzer()
+
+
+def _screen_file(item):
+    name, data = item
+    try:
+        result = _worker_analyzer.analyze_cv_bytes(data, name)
+    except Exception as e:
+        result = {'error': f"Kesalahan saat menganalisis CV: {e}", 'skills': []}
+    return {'file': name, **result}
+
+
+def screen_files(items, workers=None):
+    """
+    Analyze CV files on a process pool, streaming results in input order
+
+    Args:
+        items (iterable): (file_name, bytes) pairs, consumed lazily
+        workers (int): Worker processes (default: CPU count); 1 runs in-process
+
+    Yields:
+        dict: CVAnalyzer result plus 'file'
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker()
+        for item in items:
+            yield _screen_file(item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        # At most workers * 2 files are held in memory at once
+        yield from bounded_imap(executor, _screen_file, items, workers * 2)
+
+
+def summary_row(result):
+    """
+    Flatten one result into a summary row
+
+    Args:
+        result (dict): Result from screen_files
+
+    Returns:
+        dict: Values for SUMMARY_COLUMNS
+    """
+    education = result.get('education') or []
+    skills = result.get('skills') or []
+    return {
+        'file': result['file'],
+        'experience_level': result.get('experience_level', ''),
+        'experience_years': result.get('experience_years', ''),
+        'education': ';'.join(education) if isinstance(education, list) else education,
+        'skill_count': len(skills),
+        'skills': ';'.join(skills),
+        'error': result.get('error', ''),
+        'json_file': json_file_name(result['file'])
+    }
+
+
+def json_file_name(name):
+    """
+    Flat, filesystem-safe JSON file name for a CV path
+
+    Flattening maps different paths to the same text ('a/b.pdf' and
+    'a__b.pdf'), so a short hash of the original path keeps names unique.
+    """
+    digest = hashlib.sha256(name.encode('utf-8')).hexdigest()[:10]
+    # Keep well under the 255-byte file name limit
+    readable = re.sub(r'[^\w.-]+', '__', name)[-120:]
+    return f"{readable}.{digest}.json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a folder or zip of CVs (PDF/DOCX)")
+    parser.add_argument('source', help="Directory or .zip archive with CV files")
+    parser.add_argument('-o', '--output', default='screening', help="Output directory")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--parquet', action='store_true', help="Also write summary.parquet (needs pyarrow)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.source):
+        print(f"❌ Source not found: {args.source}", file=sys.stderr)
+        return 1
+
+    names = list_cv_files(args.source)
+    if not names:
+        print(f"⚠️ No PDF/DOCX files found in {args.source}", file=sys.stderr)
+        return 1
+
+    output_dir = Path(args.output)
+    json_dir = output_dir / 'json'
+    json_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = output_dir / 'summary.csv'
+
+    errors = 0
+    written = set()
+    start = time.perf_counter()
+    with open(summary_path, 'w', encoding='utf-8', newline='') as summary_file:
+        writer = csv.DictWriter(summary_file, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+
+        results = screen_files(iter_cv_files(args.source, names), workers=args.workers)
+        for index, result in enumerate(results, 1):
+            row = summary_row(result)
+            if row['json_file'] in written:
+                # Never let one CV's result silently replace another's
+                print(f"❌ Duplicate output name {row['json_file']} for {result['file']}", file=sys.stderr)
+                return 1
+            written.add(row['json_file'])
+            writer.writerow(row)
+            with open(json_dir / row['json_file'], 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+
+            status = '✅'
+            if result.get('error'):
+                status = '❌'
+                errors += 1
+            print(f"{status} [{index}/{len(names)}] {result['file']}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    rate = len(names) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"📊 Screened {len(names)} CVs in {elapsed:.1f}s ({rate:.1f} CVs/sec), "
+        f"{errors} errors",
+        file=sys.stderr
+    )
+    print(f"💾 Summary saved to {summary_path}", file=sys.stderr)
+
+    if args.parquet:
+        try:
+            import pandas as pd
+            pd.read_csv(summary_path, keep_default_na=False).to_parquet(output_dir / 'summary.parquet', index=False)
+            print(f"💾 Parquet summary saved to {output_dir / 'summary.parquet'}", file=sys.stderr)
+        except ImportError as e:
+            print(f"⚠️ Parquet output not available: {e}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+CV Service Module
+Runs CV extraction in a process pool with timeouts and a content-hash cache
+"""
+
+import hashlib
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+
+from cv_analyzer import CVAnalyzer
+from result_cache import ResultCache
+
+
+# Per-process analyzer, built once by the pool initializer
+_worker_analyzer = None
+# Queue on which workers announce the tasks they start
+_worker_started = None
+
+
+def _init_worker(started):
+    global _worker_analyzer, _worker_started
+    _worker_analyzer = CVAnalyzer()
+    _worker_started = started
+
+
+def _run_task(task_id, function, *args):
+    _worker_started.put(task_id)
+    return function(*args)
+
+
+def _analyze_bytes(data, file_name):
+    return _worker_analyzer.analyze_cv_bytes(data, file_name)
+
+
+def _pdf_page_count(data):
+    return _worker_analyzer.pdf_page_count(data)
+
+
+def _extract_pdf_pages(data, start, end):
+    return _worker_analyzer.extract_pdf_pages(data, start, end)
+
+
+def _error_result(message):
+    """Error result with the same shape as CVAnalyzer.analyze_text"""
+    return {
+        'error': message,
+        'skills': [],
+        'experience_level': 'Tidak terdeteksi'
+    }
+
+
+class _QueueTimeout(Exception):
+    """No worker picked up a request's task in time"""
+
+
+class CVAnalysisService:
+    """
+    Analyzes uploaded CVs outside the calling thread
+
+    Parsing runs in worker processes so a huge or malicious file can be
+    abandoned after a timeout. Workers announce each task they start, so
+    a CV's time budget runs from the moment a worker picks it up, not
+    from when it was queued behind other sessions' files. The pool is
+    shared by every session, so a timeout of a running task only retires
+    it: new requests go to a fresh pool, requests already running on the
+    old one finish there, and the old pool (with the stuck worker) is
+    terminated once its last caller has left. A request that is still
+    queued when its wait runs out just gets a "busy" error.
+    Large PDFs are split into page ranges extracted in parallel, and
+    results are cached by the SHA-256 of the file bytes.
+    """
+
+    def __init__(self, processes=None, timeout_seconds=30, queue_timeout_seconds=None,
+                 max_bytes=10 * 1024 * 1024, parallel_page_threshold=16, cache_size=64,
+                 cache_ttl_seconds=3600, analyzer=None):
+        """
+        Args:
+            processes (int): Worker processes (default: min(4, CPU count))
+            timeout_seconds (float): Time budget for one CV, from the start
+                of its first task
+            queue_timeout_seconds (float): Longest wait for a free worker
+                (default: timeout_seconds)
+            max_bytes (int): Larger files are rejected without parsing
+            parallel_page_threshold (int): PDFs with at least this many pages
+                are extracted in parallel page ranges
+            cache_size (int): Cached CV results
+            cache_ttl_seconds (float): Lifetime of a cached result
+            analyzer (CVAnalyzer): Analyzer for already extracted text
+        """
+        self.processes = processes or min(4, os.cpu_count() or 1)
+        self.timeout_seconds = timeout_seconds
+        self.queue_timeout_seconds = queue_timeout_seconds or timeout_seconds
+        self.max_bytes = max_bytes
+        self.parallel_page_threshold = parallel_page_threshold
+        self.analyzer = analyzer or CVAnalyzer()
+        self.cache = ResultCache(max_size=cache_size, ttl_seconds=cache_ttl_seconds)
+
+        self._pool = None
+        self._callers = {}
+        self._retired = set()
+        self._start_queues = {}
+        self._started = {}
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def _acquire_pool(self):
+        """Current pool, counted as in use until _release_pool"""
+        with self._lock:
+            if self._pool is None:
+                # Streamlit runs many threads; spawn avoids forking held locks
+                context = multiprocessing.get_context('spawn')
+                start_queue = context.Queue()
+                self._pool = context.Pool(self.processes, initializer=_init_worker, initargs=(start_queue,))
+                self._start_queues[self._pool] = start_queue
+                threading.Thread(target=self._listen_for_starts, args=(start_queue,), daemon=True).start()
+            pool = self._pool
+            self._callers[pool] = self._callers.get(pool, 0) + 1
+            return pool
+
+    def _release_pool(self, pool):
+        """Stop using a pool; a retired pool is terminated by its last caller"""
+        with self._lock:
+            remaining = self._callers.pop(pool) - 1
+            if remaining:
+                self._callers[pool] = remaining
+                return
+            if pool not in self._retired:
+                return
+            self._retired.discard(pool)
+        self._terminate(pool)
+
+    def _terminate(self, pool):
+        pool.terminate()
+        with self._lock:
+            start_queue = self._start_queues.pop(pool, None)
+        if start_queue is not None:
+            start_queue.put(None)
+
+    def _listen_for_starts(self, start_queue):
+        """Mark tasks as started as workers announce them (one thread per pool)"""
+        while True:
+            task_id = start_queue.get()
+            if task_id is None:
+                return
+            with self._lock:
+                started = self._started.get(task_id)
+            if started is not None:
+                started.set()
+
+    def _retire_pool(self, pool):
+        """Stop handing out a pool with a stuck task; the next call starts a fresh one"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+            self._retired.add(pool)
+
+    def _submit(self, pool, request, function, *args):
+        """Queue a task of a request on the pool"""
+        task_id = next(self._task_ids)
+        started = threading.Event()
+        with self._lock:
+            self._started[task_id] = started
+        async_result = pool.apply_async(_run_task, (task_id, function) + args)
+        request['tasks'].append((task_id, started, async_result))
+        return async_result
+
+    def _get(self, request, async_result):
+        """
+        Result of a request's task
+
+        The request's time budget starts when the first task it waits for
+        starts running; until then it waits at most until its queue deadline.
+        """
+        if request['run_deadline'] is None:
+            started = next(event for _, event, result in request['tasks'] if result is async_result)
+            if not started.wait(self._remaining(request['queue_deadline'])):
+                raise _QueueTimeout()
+            request['run_deadline'] = time.monotonic() + self.timeout_seconds
+        return async_result.get(self._remaining(request['run_deadline']))
+
+    @staticmethod
+    def _running(request):
+        """Whether a task of the request is on a worker and unfinished"""
+        return any(event.is_set() and not result.ready() for _, event, result in request['tasks'])
+
+    def analyze(self, data, file_name):
+        """
+        Analyze a CV file
+
+        Args:
+            data (bytes): File contents
+            file_name (str): Original file name (its extension selects the parser)
+
+        Returns:
+            dict: CVAnalyzer.analyze_text result, or a result with 'error'
+        """
+        if len(data) > self.max_bytes:
+            return _error_result(
+                f"File CV terlalu besar (maksimal {self.max_bytes // (1024 * 1024)} MB)"
+            )
+
+        extension = os.path.splitext(file_name)[1].lower()
+        key = (hashlib.sha256(data).hexdigest(), extension)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        pool = self._acquire_pool()
+        request = {
+            'tasks': [],
+            'queue_deadline': time.monotonic() + self.queue_timeout_seconds,
+            'run_deadline': None
+        }
+        try:
+            if extension == '.pdf':
+                result = self._analyze_pdf(pool, request, data, file_name)
+            else:
+                result = self._get(request, self._submit(pool, request, _analyze_bytes, data, file_name))
+        except (multiprocessing.TimeoutError, _QueueTimeout):
+            # Not cached: a retry on a less busy server may succeed
+            if not self._running(request):
+                return _error_result("Server sedang sibuk menganalisis CV lain. Silakan coba lagi sebentar lagi.")
+            self._retire_pool(pool)
+            return _error_result("Waktu analisis CV habis. File mungkin terlalu besar atau rusak.")
+        except Exception as e:
+            return _error_result(f"Kesalahan saat menganalisis CV: {e}")
+        finally:
+            with self._lock:
+                for task_id, _, _ in request['tasks']:
+                    self._started.pop(task_id, None)
+            self._release_pool(pool)
+
+        self.cache.put(key, result)
+        return result
+
+    def _analyze_pdf(self, pool, request, data, file_name):
+        """Extract a PDF, in parallel page ranges when it is large"""
+        page_count = self._get(request, self._submit(pool, request, _pdf_page_count, data))
+
+        if page_count < self.parallel_page_threshold or self.processes == 1:
+            return self._get(request, self._submit(pool, request, _analyze_bytes, data, file_name))
+
+        step = -(-page_count // self.processes)
+        pending = [
+            self._submit(pool, request, _extract_pdf_pages, data, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        text = "".join(self._get(request, result) for result in pending)
+        return self.analyzer.analyze_text(text)
+
+    @staticmethod
+    def _remaining(deadline):
+        return max(deadline - time.monotonic(), 0.001)
+
+    def close(self):
+        """Shut down the worker pools"""
+        with self._lock:
+            pools = self._retired | ({self._pool} if self._pool is not None else set())
+            self._pool = None
+            self._retired = set()
+            self._callers = {}
+        for pool in pools:
+            self._terminate(pool)
+            pool.join()
@@ -0,0 +1,262 @@
+"""
+Dashboard Stats Module
+Running aggregates of interview attempts for the analytics dashboard
+"""
+
+import hashlib
+from collections import deque
+
+import numpy as np
+
+
+class RunningStats:
+    """
+    Count, sum, min, max and mean of a stream of scores, updated in O(1)
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """
+        Add one score
+
+        Args:
+            value (float): Score
+        """
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        """
+        Returns:
+            dict: attempts, avg_score, best_score, worst_score
+        """
+        return {
+            'attempts': self.count,
+            'avg_score': self.mean,
+            'best_score': self.max,
+            'worst_score': self.min
+        }
+
+
+class DashboardAggregates:
+    """
+    Everything the progress dashboard shows, maintained per appended attempt
+
+    Overall, per-category and per-difficulty RunningStats, the score series
+    with its trailing moving average (the trend line), and the first/last
+    windows used for the improvement figure. Adding an attempt costs O(1);
+    rendering never rescans the history.
+
+    `fingerprint` is a hash chained over every added attempt, so equal
+    fingerprints mean equal content (used as a figure cache key).
+    """
+
+    def __init__(self, trend_window=3, improvement_window=3):
+        """
+        Args:
+            trend_window (int): Attempts in the moving average of the trend line
+            improvement_window (int): Attempts averaged at each end for improvement
+        """
+        self.trend_window = trend_window
+        self.improvement_window = improvement_window
+
+        self.overall = RunningStats()
+        self.by_category = {}
+        self.by_difficulty = {}
+
+        self.scores = []
+        self.trend = []
+        self._trend_values = deque(maxlen=trend_window)
+        self._first_scores = []
+        self._last_scores = deque(maxlen=improvement_window)
+        self.fingerprint = f'{trend_window}:{improvement_window}'
+
+    @classmethod
+    def from_history(cls, history, **kwargs):
+        """
+        Build aggregates from stored attempts
+
+        Args:
+            history (list): Attempt dicts with 'category', 'difficulty', 'score'
+                in chronological order (e.g. HistoryStore.history)
+            **kwargs: Passed to the constructor
+
+        Returns:
+            DashboardAggregates: Seeded aggregates
+        """
+        aggregates = cls(**kwargs)
+        for item in history:
+            aggregates.add(item['category'], item['difficulty'], item['score'])
+        return aggregates
+
+    def add(self, category, difficulty, score):
+        """
+        Append one attempt
+
+        Args:
+            category (str): Question category
+            difficulty (str): Difficulty level
+            score (float): Overall score
+        """
+        self.overall.add(score)
+        self.by_category.setdefault(category, RunningStats()).add(score)
+        self.by_difficulty.setdefault(difficulty, RunningStats()).add(score)
+
+        self.scores.append(score)
+        # The window holds at most trend_window values, so this sum is O(1)
+        self._trend_values.append(score)
+        self.trend.append(sum(self._trend_values) / len(self._trend_values))
+
+        if len(self._first_scores) < self.improvement_window:
+            self._first_scores.append(score)
+        self._last_scores.append(score)
+
+        self.fingerprint = hashlib.sha256(
+            f"{self.fingerprint}\x1f{category}\x1f{difficulty}\x1f{score!r}".encode('utf-8')
+        ).hexdigest()
+
+    @property
+    def count(self):
+        return self.overall.count
+
+    def improvement(self):
+        """
+        Average of the last attempts minus average of the first attempts
+
+        Returns:
+            float: Score change (0 with fewer than 2 attempts)
+        """
+        if self.count < 2:
+            return 0
+        change = (
+            sum(self._last_scores) / len(self._last_scores)
+            - sum(self._first_scores) / len(self._first_scores)
+        )
+        # Scores carry 2 decimals; drop float noise so equal averages give exactly 0
+        return round(change, 4)
+
+    def category_averages(self):
+        """
+        Returns:
+            dict: category -> average score, in order of first attempt
+        """
+        return {category: stats.mean for category, stats in self.by_category.items()}
+
+    def ranked_categories(self, descending=True):
+        """
+        Categories sorted by average score
+
+        Returns:
+            list: (category, RunningStats) pairs
+        """
+        return sorted(self.by_category.items(), key=lambda item: item[1].mean, reverse=descending)
+
+    def top_categories(self, n=3):
+        """Best n categories as (category, average) pairs"""
+        return [(category, stats.mean) for category, stats in self.ranked_categories()[:n]]
+
+    def bottom_categories(self, n=3):
+        """Weakest n categories as (category, average) pairs"""
+        return [(category, stats.mean) for category, stats in self.ranked_categories(descending=False)[:n]]
+
+
+def rolling_mean(values, window):
+    """
+    Trailing moving average, shorter at the start of the series
+
+    Computed from a cumulative sum, so the cost is O(n) whatever the window.
+
+    Args:
+        values (sequence): Scores in chronological order
+        window (int): Attempts per average
+
+    Returns:
+        numpy.ndarray: Average of up to `window` values ending at each point
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return values
+    window = max(1, int(window))
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    ends = np.arange(1, values.size + 1)
+    starts = np.maximum(ends - window, 0)
+    return (cumsum[ends] - cumsum[starts]) / (ends - starts)
+
+
+def ewma(values, span):
+    """
+    Exponentially weighted moving average
+
+    Args:
+        values (sequence): Scores in chronological order
+        span (float): Decay in terms of span (alpha = 2 / (span + 1))
+
+    Returns:
+        numpy.ndarray: Smoothed series
+    """
+    import pandas as pd
+
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return values
+    return pd.Series(values).ewm(span=max(float(span), 1.0), adjust=False).mean().to_numpy()
+
+
+def lttb_indices(y, threshold):
+    """
+    Points kept by Largest-Triangle-Three-Buckets downsampling
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket, which preserves peaks
+    and dips of the series.
+
+    Args:
+        y (sequence): Series values at x = 0..n-1
+        threshold (int): Maximum number of points to keep
+
+    Returns:
+        numpy.ndarray: Sorted indices into y
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float)
+    # Bucket edges over the points between the fixed first and last ones
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start = end
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+    return indices
@@ -1,25 +1,81 @@
 """
 Data Loader Module
 Handles loading and validation of external datasets
+
+The JSON/text sources are compiled into one binary artifact
+(question_bank.bin in the data directory) that later starts load with a
+single read. The artifact is rebuilt automatically when a source file's
+mtime or size changes; it can also be built explicitly:
+
+    python src/data_loader.py data/
 """
 
+import argparse
+import hashlib
 import json
+import marshal
+import os
+import sys
 from pathlib import Path
 
 
+# Files that make up a dataset version
+DATA_FILES = (
+    'questions.json',
+    'keywords.json',
+    'best_answers.json',
+    'stopwords_id.txt',
+    'stopwords_english.txt'
+)
+
+BANK_FILE = 'question_bank.bin'
+BANK_MAGIC = b'DSQBANK\x00'
+# Bump when the payload layout changes
+BANK_FORMAT = 3
+
+DEFAULT_ID_STOPWORDS = frozenset({
+    'yang', 'untuk', 'pada', 'ke', 'para', 'namun', 'menurut', 'antara',
+    'dia', 'dua', 'ia', 'seperti', 'jika', 'sehingga', 'kembali', 'dengan',
+    'dan', 'di', 'dari', 'ini', 'itu', 'tidak', 'ada', 'atau', 'oleh',
+    'sebagai', 'adalah', 'akan', 'saya', 'kami', 'kita', 'mereka', 'anda',
+    'juga', 'sudah', 'dapat', 'telah', 'bisa', 'sangat', 'hanya', 'dalam',
+    'tersebut', 'hal', 'masih', 'saat', 'bahwa', 'karena', 'ketika', 'setelah',
+    'selama', 'hingga', 'serta', 'maka', 'masing', 'sama', 'lain', 'lebih',
+    'pernah', 'belum', 'banyak', 'antara', 'sekitar', 'sekali', 'setiap',
+    'semua', 'sebuah', 'suatu', 'bila', 'apabila', 'bahwa', 'dimana',
+    'dimana', 'kepada', 'terhadap', 'yaitu', 'yakni'
+})
+
+DEFAULT_EN_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
+    'who', 'when', 'where', 'why', 'how', 'if', 'then', 'than', 'so',
+    'just', 'only', 'very', 'too', 'also', 'about', 'into', 'through',
+    'over', 'before', 'after', 'above', 'below', 'between', 'under',
+    'again', 'once', 'here', 'there', 'all', 'both', 'each', 'few',
+    'more', 'most', 'some', 'such', 'no', 'not', 'yes', 'other', 'any'
+})
+
+
 class DataLoader:
     """
     Loads datasets from external files
     """
     
-    def __init__(self, data_dir='data'):
+    def __init__(self, data_dir='data', bank_path=None):
         """
         Initialize data loader
         
         Args:
             data_dir (str): Directory containing data files
+            bank_path (str): Compiled artifact path (default: <data_dir>/question_bank.bin)
         """
         self.data_dir = Path(data_dir)
+        self.bank_path = Path(bank_path) if bank_path else self.data_dir / BANK_FILE
+        self._bank = None
         
         # Ensure data directory exists
         if not self.data_dir.exists():
@@ -27,23 +83,12 @@ class DataLoader:
     
     def load_questions(self):
         """
-        Load interview questions from JSON file
+        Load interview questions
         
         Returns:
             dict: Questions organized by category
         """
-        filepath = self.data_dir / 'questions.json'
-        
-        if not filepath.exists():
-            # Return default questions if file doesn't exist
-            return self._get_default_questions()
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading questions: {e}")
-            return self._get_default_questions()
+        return self.load_bank()['questions']
     
     def load_keywords(self):
         """
@@ -52,17 +97,7 @@ class DataLoader:
         Returns:
             dict: Keywords by category
         """
-        filepath = self.data_dir / 'keywords.json'
-        
-        if not filepath.exists():
-            return self._get_default_keywords()
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading keywords: {e}")
-            return self._get_default_keywords()
+        return self.load_bank()['keywords']
     
     def load_best_answers(self):
         """
@@ -71,102 +106,207 @@ class DataLoader:
         Returns:
             dict: Best answers by category
         """
-        filepath = self.data_dir / 'best_answers.json'
+        return self.load_bank()['best_answers']
+    
+    def load_stopwords(self):
+        """
+        Load stopwords for text preprocessing (Indonesian + English)
         
-        if not filepath.exists():
-            return self._get_default_best_answers()
+        Returns:
+            frozenset: Combined stopwords
+        """
+        return self.load_bank()['stopwords']
+    
+    def data_version(self):
+        """
+        Content hash of the data files, used to invalidate derived caches
         
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading best answers: {e}")
-            return self._get_default_best_answers()
+        Returns:
+            str: Short SHA-256 hex digest (missing files hash as empty)
+        """
+        return self.load_bank()['version']
     
-    def load_stopwords(self):
+    def load_bank(self):
         """
-        Load stopwords for text preprocessing from files or use defaults
-        Supports both Indonesian and English stopwords
+        Load the compiled data, rebuilding it if any source file changed
         
         Returns:
-            set: Combined set of stopwords (Indonesian + English)
+            dict: 'questions', 'keywords', 'best_answers', 'stopwords' (frozenset),
+                'question_items' (one normalized record per question, with its
+                resolved 'best_answer'), 'question_keywords' (question id ->
+                lowercased keyword tuple), 'best_answer_points' (question id ->
+                key point tuple) and 'version'
         """
-        stopwords = set()
+        if self._bank is None:
+            header = self._bank_header()
+            bank = self._read_bank(header)
+            if bank is None:
+                bank = self.compile_bank(header)
+            self._bank = bank
+        return self._bank
+    
+    def source_signature(self):
+        """
+        Cheap change detector for the source files
         
-        # Try to load Indonesian stopwords
-        id_filepath = self.data_dir / 'stopwords_id.txt'
-        if id_filepath.exists():
+        Returns:
+            tuple: (name, mtime_ns, size) of every data file; -1 for missing files
+        """
+        signature = []
+        for name in DATA_FILES:
             try:
-                with open(id_filepath, 'r', encoding='utf-8') as f:
-                    id_words = set(line.strip().lower() for line in f if line.strip())
-                stopwords.update(id_words)
-                print(f"✅ Loaded {len(id_words)} Indonesian stopwords from file")
-            except Exception as e:
-                print(f"⚠️ Error loading Indonesian stopwords: {e}")
-        else:
-            # Fallback: Comprehensive Indonesian stopwords
-            default_id = {
-                'yang', 'untuk', 'pada', 'ke', 'para', 'namun', 'menurut', 'antara',
-                'dia', 'dua', 'ia', 'seperti', 'jika', 'sehingga', 'kembali', 'dengan',
-                'dan', 'di', 'dari', 'ini', 'itu', 'tidak', 'ada', 'atau', 'oleh',
-                'sebagai', 'adalah', 'akan', 'saya', 'kami', 'kita', 'mereka', 'anda',
-                'juga', 'sudah', 'dapat', 'telah', 'bisa', 'sangat', 'hanya', 'dalam',
-                'tersebut', 'hal', 'masih', 'saat', 'bahwa', 'karena', 'ketika', 'setelah',
-                'selama', 'hingga', 'serta', 'maka', 'masing', 'sama', 'lain', 'lebih',
-                'pernah', 'belum', 'banyak', 'antara', 'sekitar', 'sekali', 'setiap',
-                'semua', 'sebuah', 'suatu', 'bila', 'apabila', 'bahwa', 'dimana',
-                'dimana', 'kepada', 'terhadap', 'yaitu', 'yakni'
-            }
-            stopwords.update(default_id)
-            print(f"⚠️ File not found, using {len(default_id)} default Indonesian stopwords")
+                stat = (self.data_dir / name).stat()
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((name, -1, -1))
+        return tuple(signature)
+    
+    def _bank_header(self):
+        # marshal output is only guaranteed readable by the same Python version
+        return (BANK_FORMAT, marshal.version, tuple(sys.version_info[:2]), self.source_signature())
+    
+    def _read_bank(self, header):
+        """Payload of the compiled artifact, or None if missing or stale"""
+        try:
+            raw = self.bank_path.read_bytes()
+        except FileNotFoundError:
+            return None
         
-        # Try to load English stopwords
-        en_filepath = self.data_dir / 'stopwords_english.txt'
-        if en_filepath.exists():
-            try:
-                with open(en_filepath, 'r', encoding='utf-8') as f:
-                    en_words = set(line.strip().lower() for line in f if line.strip())
-                stopwords.update(en_words)
-                print(f"✅ Loaded {len(en_words)} English stopwords from file")
-            except Exception as e:
-                print(f"⚠️ Error loading English stopwords: {e}")
-        else:
-            # Fallback: Essential English stopwords
-            default_en = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
-                'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
-                'who', 'when', 'where', 'why', 'how', 'if', 'then', 'than', 'so',
-                'just', 'only', 'very', 'too', 'also', 'about', 'into', 'through',
-                'over', 'before', 'after', 'above', 'below', 'between', 'under',
-                'again', 'once', 'here', 'there', 'all', 'both', 'each', 'few',
-                'more', 'most', 'some', 'such', 'no', 'not', 'yes', 'other', 'any'
-            }
-            stopwords.update(default_en)
-            print(f"⚠️ File not found, using {len(default_en)} default English stopwords")
+        if not raw.startswith(BANK_MAGIC):
+            return None
+        offset = len(BANK_MAGIC)
+        header_size = int.from_bytes(raw[offset:offset + 4], 'little')
+        offset += 4
+        try:
+            if marshal.loads(raw[offset:offset + header_size]) != header:
+                return None
+            return marshal.loads(memoryview(raw)[offset + header_size:])
+        except (EOFError, ValueError, TypeError):
+            # Truncated or corrupt artifact: rebuild
+            return None
     
+    def compile_bank(self, header=None):
+        """
+        Parse the source files and write the compiled artifact
+        
+        Args:
+            header (tuple): Artifact header (default: from the current source files)
+            
+        Returns:
+            dict: Compiled payload (see load_bank)
+            
+        Raises:
+            ValueError: If a source JSON file is malformed or a question is invalid
+        """
+        from question_index import best_answer_for, normalize_questions
+        from scoring import extract_key_points
+        
+        header = header or self._bank_header()
+        digest = hashlib.sha256()
+        sources = {}
+        for name in DATA_FILES:
+            filepath = self.data_dir / name
+            digest.update(name.encode('utf-8'))
+            if filepath.exists():
+                sources[name] = filepath.read_bytes()
+                digest.update(sources[name])
+        
+        questions = self._parse_json(sources, 'questions.json', self._get_default_questions)
+        keywords = self._parse_json(sources, 'keywords.json', self._get_default_keywords)
+        best_answers = self._parse_json(sources, 'best_answers.json', self._get_default_best_answers)
+        question_items = normalize_questions(questions)
+        # Questions without their own answer share their category's, and its key points
+        points_by_answer = {}
+        best_answer_points = {}
+        for item in question_items:
+            item['best_answer'] = best_answer_for(item, best_answers)
+            if item['best_answer'] not in points_by_answer:
+                points_by_answer[item['best_answer']] = tuple(extract_key_points(item['best_answer']))
+            best_answer_points[item['id']] = points_by_answer[item['best_answer']]
+        stopwords = frozenset(
+            self._parse_stopwords(sources, 'stopwords_id.txt', 'Indonesian', DEFAULT_ID_STOPWORDS)
+            | self._parse_stopwords(sources, 'stopwords_english.txt', 'English', DEFAULT_EN_STOPWORDS)
+        )
         print(f"📊 Total stopwords loaded: {len(stopwords)}")
-        return stopwords
+        
+        bank = {
+            'questions': questions,
+            'keywords': keywords,
+            'best_answers': best_answers,
+            'stopwords': stopwords,
+            'question_items': question_items,
+            'question_keywords': {
+                item['id']: tuple(dict.fromkeys(kw.lower() for kw in item.get('keywords', [])))
+                for item in question_items
+            },
+            'best_answer_points': best_answer_points,
+            'version': digest.hexdigest()[:16]
+        }
+        self._write_bank(header, bank)
+        return bank
+    
+    def _write_bank(self, header, bank):
+        """Write the artifact atomically; a read-only data dir only costs the next start"""
+        header_bytes = marshal.dumps(header)
+        tmp_path = self.bank_path.with_name(f"{self.bank_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(BANK_MAGIC)
+                f.write(len(header_bytes).to_bytes(4, 'little'))
+                f.write(header_bytes)
+                f.write(marshal.dumps(bank))
+            os.replace(tmp_path, self.bank_path)
+            print(f"✅ Compiled question bank to {self.bank_path}")
+        except OSError as e:
+            print(f"⚠️ Could not write compiled question bank: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def _parse_json(self, sources, name, default_factory):
+        """Parse a JSON source, using the defaults when the file is missing"""
+        if name not in sources:
+            print(f"⚠️ {name} not found, using default data")
+            return default_factory()
+        try:
+            return json.loads(sources[name].decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid {self.data_dir / name}: {e}") from e
+    
+    def _parse_stopwords(self, sources, name, label, defaults):
+        """Parse a one-word-per-line stopword file, using the defaults when missing"""
+        if name not in sources:
+            print(f"⚠️ File not found, using {len(defaults)} default {label} stopwords")
+            return set(defaults)
+        words = {
+            line.strip().lower()
+            for line in sources[name].decode('utf-8', errors='replace').splitlines()
+            if line.strip()
+        }
+        print(f"✅ Loaded {len(words)} {label} stopwords from file")
+        return words
     
     def save_questions(self, questions):
         """Save questions to JSON file"""
         filepath = self.data_dir / 'questions.json'
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(questions, f, indent=2, ensure_ascii=False)
+        self._bank = None
     
     def save_keywords(self, keywords):
         """Save keywords to JSON file"""
         filepath = self.data_dir / 'keywords.json'
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(keywords, f, indent=2, ensure_ascii=False)
+        self._bank = None
     
     def save_best_answers(self, answers):
         """Save best answers to JSON file"""
         filepath = self.data_dir / 'best_answers.json'
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(answers, f, indent=2, ensure_ascii=False)
+        self._bank = None
     
     def _get_default_questions(self):
         """Return default question set"""
@@ -251,3 +391,23 @@ class DataLoader:
                 "answer": """In a recent healthcare analytics project, I faced significant data quality challenges. The dataset had 30% missing values across critical features. I implemented multiple imputation strategies - mean/median for numerical data, mode for categorical, and KNN imputation for complex patterns. For outliers, I used IQR method and domain knowledge to distinguish genuine anomalies from data errors. My EDA revealed unexpected correlations through correlation matrices and revealed seasonality patterns via time series decomposition. The biggest challenge was handling inconsistent data formats across different source systems, which I resolved through extensive data profiling and standardization."""
             }
         }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the data directory into question_bank.bin")
+    parser.add_argument('data_dir', nargs='?', default='data', help="Directory containing data files")
+    parser.add_argument('-o', '--output', default=None, help="Artifact path (default: <data_dir>/question_bank.bin)")
+    args = parser.parse_args(argv)
+
+    loader = DataLoader(args.data_dir, bank_path=args.output)
+    try:
+        bank = loader.compile_bank()
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"📦 {len(bank['questions'])} categories, version {bank['version']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
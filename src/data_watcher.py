@@ -0,0 +1,115 @@
+"""
+Data Watcher Module
+Hot reload of the data directory: poll, rebuild in the background, swap atomically
+"""
+
+import threading
+
+from data_loader import DataLoader
+
+
+class DataWatcher:
+    """
+    Serves the current dataset snapshot and replaces it when the data files change
+
+    A daemon thread polls DataLoader.source_signature() (a few stat calls).
+    When it changes, the compiled bank is reloaded and validated and the
+    build callable derives everything that depends on it (reference models,
+    analyzers, ...) on the watcher thread. Only a complete snapshot is
+    published, with a single reference assignment, so readers see either the
+    old or the new dataset and never a mix. A failed reload keeps the old
+    snapshot.
+    """
+
+    def __init__(self, data_loader, build, interval_seconds=2.0, start=True):
+        """
+        Load the initial snapshot and start polling
+
+        Args:
+            data_loader (DataLoader): Loader for the watched data directory
+            build (callable): build(bank, initial) -> snapshot dict; called with
+                initial=False for reloads, which run off the request path
+            interval_seconds (float): Polling interval
+            start (bool): Start the polling thread immediately
+        """
+        self.data_loader = data_loader
+        self.build = build
+        self.interval_seconds = interval_seconds
+
+        self.reload_count = 0
+        self.last_error = None
+
+        self._signature = data_loader.source_signature()
+        self._snapshot = build(data_loader.load_bank(), True)
+        self._check_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        if start:
+            self.start()
+
+    def current(self):
+        """
+        Current snapshot; read it once per request and use it throughout
+
+        Returns:
+            dict: Snapshot returned by build
+        """
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self._snapshot['version']
+
+    def start(self):
+        """Start the polling thread (no-op if already running)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='data-watcher', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.check()
+            except Exception as e:
+                # Never let the watcher thread die
+                print(f"⚠️ Data watcher error: {e}")
+
+    def check(self):
+        """
+        Reload and swap the snapshot if the data files changed
+
+        Returns:
+            bool: True if a new snapshot was published
+        """
+        with self._check_lock:
+            signature = self.data_loader.source_signature()
+            if signature == self._signature:
+                return False
+            # Recorded even on failure: a half-saved file is retried once it changes again
+            self._signature = signature
+
+            try:
+                loader = DataLoader(self.data_loader.data_dir, bank_path=self.data_loader.bank_path)
+                bank = loader.load_bank()
+                if bank['version'] == self.version:
+                    # Touched but not edited
+                    return False
+                snapshot = self.build(bank, False)
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"⚠️ Data reload failed, keeping version {self.version}: {e}")
+                return False
+
+            self.data_loader = loader
+            self._snapshot = snapshot
+            self.reload_count += 1
+            self.last_error = None
+            print(f"✅ Data reloaded: version {snapshot['version']}")
+            return True
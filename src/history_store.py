@@ -0,0 +1,222 @@
+"""
+History Store Module
+Persistent interview attempt history on SQLite with indexed aggregate queries
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    category TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    overall REAL NOT NULL,
+    technical_accuracy REAL,
+    depth_of_knowledge REAL,
+    communication_clarity REAL,
+    components TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_time
+    ON attempts (user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_category
+    ON attempts (user_id, category, overall);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_difficulty
+    ON attempts (user_id, difficulty, overall);
+"""
+
+
+class HistoryStore:
+    """
+    Interview attempts per user, stored in a local SQLite database
+
+    Every aggregate query is served by an index on (user_id, ...), so its
+    cost does not grow with the length of a user's history. The app's
+    dashboard keeps its own running aggregates (DashboardAggregates),
+    seeded once per session from history().
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (and if needed create) the database
+
+        Args:
+            db_path (str): SQLite file path, or ':memory:'
+        """
+        self.db_path = str(db_path)
+        # One connection shared by Streamlit's script threads, serialized by a lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            if self.db_path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def add_attempt(self, user_id, category, difficulty, scores, created_at=None):
+        """
+        Record one scored attempt
+
+        Args:
+            user_id (str): User identifier
+            category (str): Question category
+            difficulty (str): Difficulty level
+            scores (dict): Result of ScoringEngine.calculate_scores
+            created_at (float): Unix timestamp (default: now)
+
+        Returns:
+            int: Attempt id
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO attempts (
+                    user_id, created_at, category, difficulty, overall,
+                    technical_accuracy, depth_of_knowledge, communication_clarity, components
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    user_id,
+                    created_at if created_at is not None else time.time(),
+                    category,
+                    difficulty,
+                    scores['overall'],
+                    scores.get('technical_accuracy'),
+                    scores.get('depth_of_knowledge'),
+                    scores.get('communication_clarity'),
+                    json.dumps(scores.get('components', {}))
+                )
+            )
+            return cursor.lastrowid
+
+    def clear(self, user_id):
+        """Delete all attempts of a user"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM attempts WHERE user_id = ?', (user_id,))
+
+    def attempt_count(self, user_id):
+        """Number of attempts of a user"""
+        return self._query('SELECT COUNT(*) FROM attempts WHERE user_id = ?', (user_id,))[0][0]
+
+    def summary(self, user_id):
+        """
+        Overall statistics of a user
+
+        Returns:
+            dict: attempts, avg_score, best_score, worst_score, first_at, last_at
+        """
+        row = self._query(
+            """
+            SELECT COUNT(*) AS attempts, AVG(overall) AS avg_score,
+                   MAX(overall) AS best_score, MIN(overall) AS worst_score,
+                   MIN(created_at) AS first_at, MAX(created_at) AS last_at
+            FROM attempts WHERE user_id = ?
+            """,
+            (user_id,)
+        )[0]
+        return dict(row)
+
+    def improvement(self, user_id, window=3):
+        """
+        Average of the last attempts minus average of the first attempts
+
+        Args:
+            user_id (str): User identifier
+            window (int): Attempts averaged at each end
+
+        Returns:
+            float: Score change (0 with fewer than 2 attempts)
+        """
+        first = self._query(
+            'SELECT overall FROM attempts WHERE user_id = ? ORDER BY created_at, id LIMIT ?',
+            (user_id, window)
+        )
+        last = self._query(
+            'SELECT overall FROM attempts WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?',
+            (user_id, window)
+        )
+        if len(first) < 2:
+            return 0
+        change = sum(r['overall'] for r in last) / len(last) - sum(r['overall'] for r in first) / len(first)
+        # Scores carry 2 decimals; drop float noise so equal averages give exactly 0
+        return round(change, 4)
+
+    def category_stats(self, user_id):
+        """
+        Per-category statistics
+
+        Returns:
+            dict: category -> {'attempts', 'avg_score', 'best_score'}
+        """
+        rows = self._query(
+            """
+            SELECT category, COUNT(*) AS attempts, AVG(overall) AS avg_score, MAX(overall) AS best_score
+            FROM attempts WHERE user_id = ? GROUP BY category
+            """,
+            (user_id,)
+        )
+        return {row['category']: dict(row) for row in rows}
+
+    def difficulty_stats(self, user_id):
+        """
+        Per-difficulty statistics
+
+        Returns:
+            dict: difficulty -> {'attempts', 'avg_score', 'best_score'}
+        """
+        rows = self._query(
+            """
+            SELECT difficulty, COUNT(*) AS attempts, AVG(overall) AS avg_score, MAX(overall) AS best_score
+            FROM attempts WHERE user_id = ? GROUP BY difficulty
+            """,
+            (user_id,)
+        )
+        return {row['difficulty']: dict(row) for row in rows}
+
+    def recent(self, user_id, limit=5):
+        """
+        Most recent attempts, newest first
+
+        Returns:
+            list: Attempt dicts with 'category', 'score', 'difficulty', 'created_at'
+        """
+        rows = self._query(
+            """
+            SELECT category, overall AS score, difficulty, created_at
+            FROM attempts WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?
+            """,
+            (user_id, limit)
+        )
+        return [dict(row) for row in rows]
+
+    def history(self, user_id):
+        """
+        All attempts in chronological order (e.g. for the progress chart)
+
+        Returns:
+            list: Attempt dicts with 'category', 'score', 'difficulty', 'created_at',
+                'technical_accuracy', 'depth_of_knowledge', 'communication_clarity'
+        """
+        rows = self._query(
+            """
+            SELECT category, overall AS score, difficulty, created_at,
+                   technical_accuracy, depth_of_knowledge, communication_clarity
+            FROM attempts WHERE user_id = ? ORDER BY created_at, id
+            """,
+            (user_id,)
+        )
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
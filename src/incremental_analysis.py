@@ -0,0 +1,196 @@
+"""
+Incremental Analysis Module
+Live answer statistics updated from the appended text only
+"""
+
+import string
+from collections import Counter
+
+from keyword_matcher import KeywordMatcher
+from text_mining import TRANSITION_WORDS
+
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+_SENTENCE_END = ('.', '!', '?')
+_CLOSING_CHARS = '"\')]}'
+
+# Shared, read-only automaton over the transition words
+TRANSITION_MATCHER = KeywordMatcher(TRANSITION_WORDS)
+
+
+class IncrementalAnalyzer:
+    """
+    Running answer statistics for a single answer box
+
+    Text up to the last whitespace character is "stable": its words are
+    complete, so they are folded into the running counters exactly once.
+    Each update scans only the newly stabilized region (plus a small overlap
+    for phrases crossing the old boundary) and the unfinished last word.
+    An edit before the stable boundary resets the state and rescans.
+    """
+
+    def __init__(self, keywords, stopwords=None, keyword_matcher=None):
+        """
+        Initialize empty running state
+
+        Args:
+            keywords (list): Expected keywords to track
+            stopwords (set): Stopwords excluded from the n-gram counters
+            keyword_matcher (KeywordMatcher): Pre-compiled matcher for keywords
+                (e.g. from TextMiningAnalyzer.compile_keywords)
+        """
+        self.keywords = list(keywords)
+        self.keyword_matcher = keyword_matcher or KeywordMatcher(self.keywords)
+        self.stopwords = frozenset(stopwords) if stopwords else frozenset()
+        self.reset()
+
+    def reset(self):
+        """Forget all processed text"""
+        self.text = ''
+        self._stable = 0
+        self._stable_text = ''
+
+        self._word_count = 0
+        self._sentence_count = 0
+        self._open_sentence = False
+
+        self.keyword_counts = Counter()
+        self.transition_counts = Counter()
+        self._token_count = 0
+        self.bigram_counts = Counter()
+        self.trigram_counts = Counter()
+        self._context = ()
+
+    def update(self, text):
+        """
+        Feed the current answer text
+
+        Args:
+            text (str): Full current answer
+        """
+        text = text or ''
+
+        # Prefix comparison runs at memcmp speed; anything but an append restarts
+        if not text.startswith(self._stable_text):
+            self.reset()
+
+        old_stable = self._stable
+        new_stable = old_stable
+        for i in range(len(text) - 1, old_stable - 1, -1):
+            if text[i].isspace():
+                new_stable = i + 1
+                break
+
+        if new_stable > old_stable:
+            self._consume_words(text[old_stable:new_stable])
+            for matcher, counts in (
+                (self.keyword_matcher, self.keyword_counts),
+                (TRANSITION_MATCHER, self.transition_counts)
+            ):
+                counts.update(self._scan(matcher, text, old_stable, new_stable))
+            self._stable = new_stable
+            self._stable_text = text[:new_stable]
+
+        self.text = text
+
+    def _scan(self, matcher, text, old_end, new_end):
+        """
+        Patterns ending inside (old_end, new_end]
+
+        Scanning starts max_pattern_length characters early so that phrases
+        crossing old_end are found; the extra character in front of the
+        window keeps the word-boundary check exact.
+        """
+        scan_from = max(old_end - matcher.max_pattern_length, 0)
+        base = max(scan_from - 1, 0)
+        window = text[base:new_end].lower()
+        for _, end, pattern in matcher.iter_matches(window, start=scan_from - base):
+            if base + end > old_end:
+                yield pattern
+
+    def _consume_words(self, delta):
+        """Fold complete words into the word, sentence and n-gram counters"""
+        context = self._context
+        for word in delta.split():
+            self._word_count += 1
+            if word.rstrip(_CLOSING_CHARS).endswith(_SENTENCE_END):
+                self._sentence_count += 1
+                self._open_sentence = False
+            else:
+                self._open_sentence = True
+
+            for token in word.lower().translate(_PUNCTUATION_TABLE).split():
+                if token in self.stopwords:
+                    continue
+                self._token_count += 1
+                if context:
+                    self.bigram_counts[(context[-1], token)] += 1
+                if len(context) == 2:
+                    self.trigram_counts[context + (token,)] += 1
+                context = (context + (token,))[-2:]
+        self._context = context
+
+    def snapshot(self, ideal_length=None):
+        """
+        Current statistics, including the unfinished last word
+
+        The n-gram counters only cover complete words, so a phrase is
+        counted once the word after it has been started.
+
+        Args:
+            ideal_length (tuple): Optional (min_words, max_words)
+
+        Returns:
+            dict: Word/sentence counts, keyword coverage, transition count,
+                length status and the most common bigrams/trigrams with
+                phrase richness (as in TextMiningAnalyzer.ngram_analysis)
+        """
+        tail = self.text[self._stable:]
+
+        word_count = self._word_count + (1 if tail else 0)
+        sentence_count = self._sentence_count
+        if tail:
+            sentence_count += 1
+        elif self._open_sentence:
+            sentence_count += 1
+
+        # Matches ending in the unfinished word are shown but not committed
+        keyword_counts = self.keyword_counts
+        transition_counts = self.transition_counts
+        if tail:
+            keyword_counts = keyword_counts + Counter(
+                self._scan(self.keyword_matcher, self.text, self._stable, len(self.text))
+            )
+            transition_counts = transition_counts + Counter(
+                self._scan(TRANSITION_MATCHER, self.text, self._stable, len(self.text))
+            )
+
+        keywords_found = [kw for kw in self.keywords if kw.lower() in keyword_counts]
+        keyword_coverage = (len(keywords_found) / len(self.keywords) * 100) if self.keywords else 0
+
+        length_status = None
+        if ideal_length:
+            min_len, max_len = ideal_length
+            if word_count < min_len:
+                length_status = 'short'
+            elif word_count > max_len:
+                length_status = 'long'
+            else:
+                length_status = 'ok'
+
+        return {
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'avg_sentence_length': word_count / sentence_count if sentence_count else 0,
+            'keywords_found': keywords_found,
+            'keywords_missing': [kw for kw in self.keywords if kw.lower() not in keyword_counts],
+            'keyword_coverage': keyword_coverage,
+            'transition_words_count': len(transition_counts),
+            'length_status': length_status,
+            'bigrams': self.bigram_counts.most_common(10),
+            'trigrams': self.trigram_counts.most_common(10),
+            'phrase_richness': (
+                (len(self.bigram_counts) + len(self.trigram_counts)) / self._token_count
+                if self._token_count else 0
+            )
+        }
@@ -0,0 +1,79 @@
+"""
+Instrumentation Module
+Per-stage wall-time counters for the analysis pipeline
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StageTimingRegistry:
+    """
+    Thread-safe aggregate of call counts and wall time per stage
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, stage, seconds):
+        """
+        Add one timed call of a stage
+
+        Args:
+            stage (str): Stage name
+            seconds (float): Wall time of the call
+        """
+        with self._lock:
+            entry = self._stats.get(stage)
+            if entry is None:
+                entry = {'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0}
+                self._stats[stage] = entry
+            entry['calls'] += 1
+            entry['total_seconds'] += seconds
+            if seconds > entry['max_seconds']:
+                entry['max_seconds'] = seconds
+
+    @contextmanager
+    def time(self, stage, timings=None):
+        """
+        Time a block and record it under a stage name
+
+        Args:
+            stage (str): Stage name
+            timings (dict): Optional per-call dict that also receives the wall time
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.record(stage, elapsed)
+            if timings is not None:
+                timings[stage] = elapsed
+
+    def snapshot(self):
+        """
+        Copy of the aggregate counters
+
+        Returns:
+            dict: Stage -> {'calls', 'total_seconds', 'mean_seconds', 'max_seconds'}
+        """
+        with self._lock:
+            return {
+                stage: {
+                    **entry,
+                    'mean_seconds': entry['total_seconds'] / entry['calls'] if entry['calls'] else 0.0
+                }
+                for stage, entry in self._stats.items()
+            }
+
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide default registry
+timing_registry = StageTimingRegistry()
@@ -0,0 +1,260 @@
+"""
+Keyword Matcher Module
+Aho-Corasick multi-pattern matching for keyword, entity and skill lookup
+"""
+
+import re
+from collections import Counter, deque
+
+
+def _is_word_char(ch):
+    """Word characters as in regex \\w"""
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatcher:
+    """
+    Compiled Aho-Corasick automaton over a fixed vocabulary
+
+    The automaton is built once; every lookup is a single linear pass over the
+    text, independent of how many patterns the vocabulary holds.
+    """
+
+    def __init__(self, patterns, word_boundary=True):
+        """
+        Compile the automaton
+
+        Args:
+            patterns (iterable): Keywords/phrases to match (case-insensitive)
+            word_boundary (bool): Only accept matches not embedded in a longer word
+        """
+        self.word_boundary = word_boundary
+
+        # Deduplicate while keeping vocabulary order
+        self.patterns = []
+        seen = set()
+        for pattern in patterns:
+            key = pattern.lower()
+            if key and key not in seen:
+                seen.add(key)
+                self.patterns.append(key)
+
+        self.max_pattern_length = max((len(p) for p in self.patterns), default=0)
+        self._build()
+
+    def _build(self):
+        """Build goto, failure and output tables"""
+        goto = [{}]
+        outputs = [[]]
+
+        # Trie of all patterns
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Failure links (breadth-first), merging outputs along the failure chain
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(ch, 0)
+                if fail[next_state] == next_state:
+                    fail[next_state] = 0
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def _on_boundary(self, text, start, end, limit, pattern):
+        """Check that a match is not part of a longer word"""
+        if _is_word_char(pattern[0]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(pattern[-1]) and end < limit and _is_word_char(text[end]):
+            return False
+        return True
+
+    def iter_matches(self, text, start=0, end=None):
+        """
+        Scan text once and yield every (possibly overlapping) match
+
+        Args:
+            text (str): Lowercased text to scan
+            start (int): Scan start offset; earlier characters are only used
+                for word-boundary checks
+            end (int): Scan end offset, treated as the end of the text
+
+        Yields:
+            tuple: (start, end, pattern) with end exclusive
+        """
+        if not self.patterns:
+            return
+
+        limit = len(text) if end is None else end
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        patterns = self.patterns
+
+        state = 0
+        for i in range(start, limit):
+            ch = text[i]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for index in outputs[state]:
+                pattern = patterns[index]
+                match_start = i + 1 - len(pattern)
+                if not self.word_boundary or self._on_boundary(text, match_start, i + 1, limit, pattern):
+                    yield match_start, i + 1, pattern
+
+    def find_all(self, text):
+        """
+        Find all matches with their spans
+
+        Args:
+            text (str): Lowercased text to scan
+
+        Returns:
+            list: (start, end, pattern) tuples in text order
+        """
+        return list(self.iter_matches(text))
+
+    def counts(self, text):
+        """
+        Count occurrences of each pattern
+
+        Args:
+            text (str): Lowercased text to scan
+
+        Returns:
+            Counter: Occurrences by (lowercased) pattern
+        """
+        return Counter(pattern for _, _, pattern in self.iter_matches(text))
+
+    def found(self, text):
+        """
+        Patterns present in the text
+
+        Args:
+            text (str): Lowercased text to scan
+
+        Returns:
+            set: Lowercased patterns found at least once
+        """
+        return {pattern for _, _, pattern in self.iter_matches(text)}
+
+
+class KeywordRegex:
+    """
+    Fixed vocabulary compiled into a single regular expression
+
+    Finds the same word-bounded, possibly overlapping matches as
+    KeywordMatcher, but the scan runs in the C regex engine. Patterns are
+    merged into a prefix-tree alternation inside a lookahead, so every start
+    position is tried and the longest pattern there is reported; shorter
+    patterns that are prefixes of it (e.g. 'regression' inside
+    'regression analysis') are added from a precomputed table.
+    """
+
+    def __init__(self, patterns):
+        """
+        Compile the expression
+
+        Args:
+            patterns (iterable): Keywords/phrases to match (case-insensitive)
+        """
+        self.patterns = []
+        seen = set()
+        for pattern in patterns:
+            key = pattern.lower()
+            if key and key not in seen:
+                seen.add(key)
+                self.patterns.append(key)
+
+        self._regex = re.compile('(?=(' + self._build() + '))') if self.patterns else None
+
+        # A match of pattern p at some position implies every shorter pattern
+        # that is a prefix of p and ends on a word boundary inside p
+        self._implied = {
+            pattern: [
+                other for other in self.patterns
+                if len(other) < len(pattern) and pattern.startswith(other)
+                and (not _is_word_char(other[-1]) or not _is_word_char(pattern[len(other)]))
+            ]
+            for pattern in self.patterns
+        }
+
+    def _build(self):
+        """Prefix-tree alternation with word-boundary guards"""
+        trie = {}
+        for pattern in self.patterns:
+            node = trie
+            for ch in pattern:
+                node = node.setdefault(ch, {})
+            node[''] = True
+
+        def emit(node, last):
+            # Continuations come before the end of a pattern so the longest match wins
+            alternatives = [re.escape(ch) + emit(child, ch) for ch, child in sorted(node.items()) if ch]
+            if '' in node:
+                alternatives.append(r'(?!\w)' if _is_word_char(last) else '')
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return '(?:' + '|'.join(alternatives) + ')'
+
+        word_start = {ch: child for ch, child in trie.items() if _is_word_char(ch)}
+        other_start = {ch: child for ch, child in trie.items() if not _is_word_char(ch)}
+
+        branches = []
+        if word_start:
+            branches.append(r'(?<!\w)' + emit(word_start, ''))
+        if other_start:
+            branches.append(emit(other_start, ''))
+        return '|'.join(branches)
+
+    def iter_matches(self, text):
+        """
+        Scan text once and yield every (possibly overlapping) match
+
+        Args:
+            text (str): Lowercased text to scan
+
+        Yields:
+            tuple: (start, end, pattern) with end exclusive
+        """
+        if self._regex is None:
+            return
+
+        for match in self._regex.finditer(text):
+            start = match.start()
+            pattern = match.group(1)
+            yield start, start + len(pattern), pattern
+            for implied in self._implied[pattern]:
+                yield start, start + len(implied), implied
+
+    def found(self, text):
+        """
+        Patterns present in the text
+
+        Args:
+            text (str): Lowercased text to scan
+
+        Returns:
+            set: Lowercased patterns found at least once
+        """
+        return {pattern for _, _, pattern in self.iter_matches(text)}
@@ -0,0 +1,32 @@
+"""
+Parallel Helpers Module
+Order-preserving, memory-bounded mapping over executors
+"""
+
+from collections import deque
+
+
+def bounded_imap(executor, fn, items, max_in_flight):
+    """
+    Map fn over items on an executor, yielding results in input order
+
+    Unlike Executor.map, items are consumed lazily and at most max_in_flight
+    tasks are pending at any time, so memory stays bounded for large inputs.
+
+    Args:
+        executor (concurrent.futures.Executor): Thread or process pool
+        fn (callable): Function applied to each item (must be picklable for process pools)
+        items (iterable): Input items, consumed lazily
+        max_in_flight (int): Maximum number of submitted but unconsumed tasks
+
+    Yields:
+        object: fn(item) for each item, in input order
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
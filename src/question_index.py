@@ -0,0 +1,228 @@
+"""
+Question Index Module
+Multi-question bank indexed by category, difficulty and tag, with weighted
+sampling without repeats
+"""
+
+import numpy as np
+
+
+DIFFICULTY_LEVELS = ('Junior', 'Mid-level', 'Senior')
+
+
+def normalize_questions(questions):
+    """
+    Flatten questions.json into one record per question
+
+    A category maps either to a single question object (the original
+    format) or to a list of them. Optional per-question fields: 'id',
+    'difficulty' (level or list of levels; default all), 'tags' and
+    'sample_weight' (default 1.0).
+
+    Args:
+        questions (dict): Parsed questions.json
+
+    Returns:
+        list: Question dicts with 'id', 'category', 'difficulty' (tuple),
+            'tags' (tuple, lowercased) and 'sample_weight' added
+
+    Raises:
+        ValueError: On duplicate question ids, unknown difficulty levels or
+            a sample_weight that is not a positive number
+    """
+    items = []
+    seen_ids = set()
+    for category, entries in questions.items():
+        if isinstance(entries, dict):
+            entries = [entries]
+        for position, entry in enumerate(entries):
+            question_id = str(entry.get('id') or f"{category}#{position}")
+            if question_id in seen_ids:
+                raise ValueError(f"Duplicate question id: {question_id}")
+            seen_ids.add(question_id)
+
+            difficulty = entry.get('difficulty') or DIFFICULTY_LEVELS
+            if isinstance(difficulty, str):
+                difficulty = (difficulty,)
+            unknown = set(difficulty) - set(DIFFICULTY_LEVELS)
+            if unknown:
+                raise ValueError(f"Unknown difficulty {sorted(unknown)} in question {question_id}")
+
+            # A question that can never be drawn would leave its filters empty
+            try:
+                sample_weight = float(entry.get('sample_weight', 1.0))
+            except (TypeError, ValueError):
+                sample_weight = float('nan')
+            if not 0 < sample_weight < float('inf'):
+                raise ValueError(f"sample_weight must be a positive number in question {question_id}")
+
+            items.append({
+                **entry,
+                'id': question_id,
+                'category': category,
+                'difficulty': tuple(difficulty),
+                'tags': tuple(dict.fromkeys(tag.lower() for tag in entry.get('tags', ()))),
+                'sample_weight': sample_weight
+            })
+    return items
+
+
+def best_answer_for(item, best_answers):
+    """
+    Reference answer of a question
+
+    The question's own 'best_answer' field, else the best_answers.json
+    entry keyed by its id, else the entry of its category.
+
+    Args:
+        item (dict): Record from normalize_questions
+        best_answers (dict): Parsed best_answers.json
+
+    Returns:
+        str: Reference answer ('' if there is none)
+    """
+    if item.get('best_answer'):
+        return item['best_answer']
+    entry = best_answers.get(item['id']) or best_answers.get(item['category']) or {}
+    return entry.get('answer', '')
+
+
+class QuestionIndex:
+    """
+    Read-only index of question records by (category, difficulty, tag)
+
+    Every question is registered in one bucket per difficulty level and tag,
+    plus the untagged (tag=None) and any-difficulty (difficulty=None)
+    buckets, so a lookup for any filter combination is a single dict access.
+    Buckets store item positions and sampling weights as numpy arrays.
+    """
+
+    def __init__(self, items):
+        """
+        Build the buckets
+
+        Args:
+            items (list): Records from normalize_questions
+        """
+        self.items = list(items)
+        self.by_id = {item['id']: item for item in self.items}
+        self._positions = {item['id']: position for position, item in enumerate(self.items)}
+
+        buckets = {}
+        category_tags = {}
+        for position, item in enumerate(self.items):
+            category = item['category']
+            category_tags.setdefault(category, {}).update(dict.fromkeys(item['tags']))
+            for difficulty in item['difficulty'] + (None,):
+                for tag in item['tags'] + (None,):
+                    buckets.setdefault((category, difficulty, tag), []).append(position)
+
+        self._buckets = {
+            key: (
+                np.array(positions, dtype=np.int64),
+                np.array([self.items[p]['sample_weight'] for p in positions], dtype=float)
+            )
+            for key, positions in buckets.items()
+        }
+        self._categories = list(category_tags)
+        self._tags = {category: sorted(tags) for category, tags in category_tags.items()}
+
+    def categories(self):
+        """Categories in data order"""
+        return list(self._categories)
+
+    def tags(self, category):
+        """Sorted tags used in a category"""
+        return list(self._tags.get(category, ()))
+
+    def bucket(self, category, difficulty=None, tag=None):
+        """
+        Item positions and weights matching a filter
+
+        Args:
+            category (str): Question category
+            difficulty (str): Difficulty level (None: any)
+            tag (str): Tag (None: any)
+
+        Returns:
+            tuple: (positions, weights) numpy arrays, empty if nothing matches
+        """
+        bucket = self._buckets.get((category, difficulty, tag))
+        if bucket is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=float)
+        return bucket
+
+    def count(self, category, difficulty=None, tag=None):
+        """Number of questions matching a filter"""
+        return len(self.bucket(category, difficulty, tag)[0])
+
+    def position(self, question_id):
+        """Position of a question in items (for sampler bookkeeping)"""
+        return self._positions[question_id]
+
+
+class QuestionSampler:
+    """
+    Per-session weighted question sampling without repeats
+
+    For each filter, a weighted random order of its bucket is drawn once
+    (Efraimidis-Spirakis keys, one vectorized sort), and draws then walk
+    that order, so each draw is O(1) amortized. Questions already served
+    in this session are skipped; when a bucket is exhausted its questions
+    are released and a new order starts, avoiding an immediate repeat.
+    """
+
+    def __init__(self, index, seed=None):
+        """
+        Args:
+            index (QuestionIndex): Index to sample from
+            seed (int): Random seed (default: fresh entropy)
+        """
+        self.index = index
+        self.seen = set()
+        self._rng = np.random.default_rng(seed)
+        self._orders = {}
+        self._last = {}
+
+    def _weighted_order(self, key):
+        positions, weights = self.index.bucket(*key)
+        if positions.size == 0:
+            return positions
+        # Sorting by log(u) / w descending is a weighted sample without replacement
+        keys = np.log(self._rng.random(positions.size)) / weights
+        order = positions[np.argsort(-keys)]
+        if order.size > 1 and order[0] == self._last.get(key):
+            order[[0, 1]] = order[[1, 0]]
+        return order
+
+    def next(self, category, difficulty=None, tag=None):
+        """
+        Draw the next question for a filter
+
+        Args:
+            category (str): Question category
+            difficulty (str): Difficulty level (None: any)
+            tag (str): Tag (None: any)
+
+        Returns:
+            dict: Question record, or None if nothing matches
+        """
+        key = (category, difficulty, tag)
+        for _ in range(2):
+            order, cursor = self._orders.get(key, (None, 0))
+            if order is None:
+                order = self._weighted_order(key)
+                if order.size == 0:
+                    return None
+            while cursor < order.size:
+                position = int(order[cursor])
+                cursor += 1
+                if position not in self.seen:
+                    self._orders[key] = (order, cursor)
+                    self.seen.add(position)
+                    self._last[key] = position
+                    return self.index.items[position]
+            # Bucket exhausted: allow its questions again in a new order
+            self.seen.difference_update(order.tolist())
+            self._orders.pop(key, None)
+        return None
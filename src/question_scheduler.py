@@ -0,0 +1,267 @@
+"""
+Question Scheduler Module
+Adaptive choice of the next practice question from per-category skill estimates
+"""
+
+import heapq
+import math
+
+from question_index import DIFFICULTY_LEVELS
+
+
+# Composite scores tracked as separate skills within every category
+SKILL_COMPONENTS = ('technical_accuracy', 'depth_of_knowledge', 'communication_clarity')
+
+# Elo rating of a question at each level. An attempt is a match between the
+# user and the question, won in proportion to score / 5.
+LEVEL_RATINGS = {'Junior': 1300.0, 'Mid-level': 1500.0, 'Senior': 1700.0}
+INITIAL_RATING = 1500.0
+MAX_SCORE = 5.0
+
+
+def expected_outcome(rating, opponent_rating):
+    """
+    Elo expected outcome of a player against an opponent
+
+    Args:
+        rating (float): Player rating
+        opponent_rating (float): Opponent (question level) rating
+
+    Returns:
+        float: Expected outcome in [0, 1]
+    """
+    return 1.0 / (1.0 + 10 ** ((opponent_rating - rating) / 400.0))
+
+
+class EloSkill:
+    """
+    Elo rating with an update step that shrinks as attempts accumulate
+
+    Early attempts move the estimate quickly, later ones refine it.
+    """
+
+    __slots__ = ('rating', 'attempts')
+
+    K_MAX = 64.0
+    K_MIN = 16.0
+    K_DECAY = 8.0
+
+    def __init__(self, rating=INITIAL_RATING):
+        self.rating = rating
+        self.attempts = 0
+
+    @property
+    def k_factor(self):
+        return max(self.K_MIN, self.K_MAX / (1.0 + self.attempts / self.K_DECAY))
+
+    def update(self, opponent_rating, outcome):
+        """
+        Apply one result
+
+        Args:
+            opponent_rating (float): Question level rating
+            outcome (float): Result in [0, 1]
+        """
+        self.rating += self.k_factor * (outcome - expected_outcome(self.rating, opponent_rating))
+        self.attempts += 1
+
+
+class AdaptiveScheduler:
+    """
+    Picks the category (and level) to practice next, favoring weak areas
+
+    Every category has an overall EloSkill and one per SKILL_COMPONENTS
+    entry, updated from each scored attempt. Categories sit in a min-heap
+    keyed by priority:
+
+        rating - exploration / sqrt(1 + attempts) + repeat_penalty * streak
+
+    so low-rated and little-practiced categories come first, and drilling
+    the same category repeatedly is damped. Only the categories whose
+    priority changes are re-pushed; superseded heap entries are skipped
+    when they surface (lazy invalidation). Recording an attempt and taking
+    the top are O(log n) in the number of categories; the question inside
+    the category is then drawn by QuestionSampler.
+    """
+
+    def __init__(self, categories=(), exploration=150.0, repeat_penalty=60.0, target_success=0.7):
+        """
+        Args:
+            categories (iterable): Categories that can be scheduled
+            exploration (float): Rating bonus for categories with few attempts
+            repeat_penalty (float): Rating added per consecutive attempt in a category
+            target_success (float): Expected score / 5 aimed for when choosing the level
+        """
+        self.exploration = exploration
+        self.repeat_penalty = repeat_penalty
+        self.target_success = target_success
+
+        self.skills = {}
+        self.component_skills = {}
+        self.count = 0
+
+        self._heap = []
+        # Heap entries carry a push number from one global counter; a
+        # category's entry is live only if it matches _versions, so numbers
+        # never repeat even when a category is removed and added back
+        self._versions = {}
+        self._pushes = 0
+        self._last_category = None
+        self._streak = 0
+        self.sync_categories(categories)
+
+    @classmethod
+    def from_history(cls, history, categories=(), **kwargs):
+        """
+        Build the scheduler from stored attempts
+
+        Args:
+            history (list): Attempt dicts with 'category', 'difficulty', 'score'
+                and optionally the SKILL_COMPONENTS scores, in chronological
+                order (e.g. HistoryStore.history)
+            categories (iterable): Categories that can be scheduled
+            **kwargs: Passed to the constructor
+
+        Returns:
+            AdaptiveScheduler: Seeded scheduler
+        """
+        scheduler = cls(categories, **kwargs)
+        for item in history:
+            scores = {'overall': item['score']}
+            scores.update({name: item[name] for name in SKILL_COMPONENTS if item.get(name) is not None})
+            scheduler.record(item['category'], item['difficulty'], scores)
+        return scheduler
+
+    def _skill(self, category):
+        skill = self.skills.get(category)
+        if skill is None:
+            skill = self.skills[category] = EloSkill()
+            self.component_skills[category] = {name: EloSkill() for name in SKILL_COMPONENTS}
+        return skill
+
+    def priority(self, category):
+        """Heap key of a category (lower is practiced sooner)"""
+        skill = self.skills.get(category)
+        rating, attempts = (skill.rating, skill.attempts) if skill else (INITIAL_RATING, 0)
+        priority = rating - self.exploration / math.sqrt(1.0 + attempts)
+        if category == self._last_category:
+            priority += self.repeat_penalty * self._streak
+        return priority
+
+    def _push(self, category):
+        self._pushes += 1
+        version = self._pushes
+        self._versions[category] = version
+        heapq.heappush(self._heap, (self.priority(category), version, category))
+        # Stale entries are dropped lazily; rebuild once they dominate the heap
+        if len(self._heap) > 2 * len(self._versions) + 16:
+            self._heap = [entry for entry in self._heap if self._versions.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+
+    def sync_categories(self, categories):
+        """
+        Match the schedulable categories to the question bank
+
+        Skill estimates of removed categories are kept in case they return.
+
+        Args:
+            categories (iterable): Current categories
+        """
+        categories = list(categories)
+        for category in set(self._versions) - set(categories):
+            del self._versions[category]
+        for category in categories:
+            if category not in self._versions:
+                self._push(category)
+
+    def record(self, category, difficulty, scores):
+        """
+        Update skill estimates with one scored attempt
+
+        Args:
+            category (str): Question category
+            difficulty (str): Difficulty level
+            scores (dict): Result of ScoringEngine.calculate_scores (at least 'overall')
+        """
+        opponent = LEVEL_RATINGS.get(difficulty, INITIAL_RATING)
+        self._skill(category).update(opponent, min(max(scores['overall'] / MAX_SCORE, 0.0), 1.0))
+        for name, skill in self.component_skills[category].items():
+            if scores.get(name) is not None:
+                skill.update(opponent, min(max(scores[name] / MAX_SCORE, 0.0), 1.0))
+        self.count += 1
+
+        previous = self._last_category
+        if category == previous:
+            self._streak += 1
+        else:
+            self._last_category = category
+            self._streak = 1
+            if previous in self._versions:
+                self._push(previous)
+        if category in self._versions:
+            self._push(category)
+
+    def next_category(self):
+        """
+        Category to practice next
+
+        Returns:
+            str: Category with the lowest priority, or None if there are none
+        """
+        while self._heap:
+            _, version, category = self._heap[0]
+            if self._versions.get(category) == version:
+                return category
+            heapq.heappop(self._heap)
+        return None
+
+    def recommended_difficulty(self, category):
+        """
+        Level whose expected outcome is closest to target_success
+
+        Returns:
+            str: Difficulty level
+        """
+        rating = self.skills[category].rating if category in self.skills else INITIAL_RATING
+        return min(
+            DIFFICULTY_LEVELS,
+            key=lambda level: abs(expected_outcome(rating, LEVEL_RATINGS[level]) - self.target_success)
+        )
+
+    def weakest_components(self, category, n=1):
+        """
+        Lowest-rated SKILL_COMPONENTS of a category
+
+        Returns:
+            list: (component, rating) pairs, weakest first (empty if never practiced)
+        """
+        skills = self.component_skills.get(category)
+        if not skills:
+            return []
+        ranked = sorted(
+            ((name, skill.rating) for name, skill in skills.items() if skill.attempts),
+            key=lambda item: item[1]
+        )
+        return ranked[:n]
+
+    def recommend(self):
+        """
+        Next practice target
+
+        Returns:
+            dict: 'category', 'difficulty', 'rating', 'attempts' and
+                'weak_component' (None before the first attempt), or None
+                if there are no categories
+        """
+        category = self.next_category()
+        if category is None:
+            return None
+        skill = self.skills.get(category)
+        weakest = self.weakest_components(category)
+        return {
+            'category': category,
+            'difficulty': self.recommended_difficulty(category),
+            'rating': skill.rating if skill else INITIAL_RATING,
+            'attempts': skill.attempts if skill else 0,
+            'weak_component': weakest[0][0] if weakest else None
+        }
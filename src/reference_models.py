@@ -0,0 +1,199 @@
+"""
+Reference Model Module
+Pre-fitted TF-IDF models shared by all question categories
+"""
+
+import threading
+
+from question_index import best_answer_for, normalize_questions
+
+
+class SharedVectorizers:
+    """
+    TF-IDF vectorizers fitted once over the documents of every category
+
+    Each category is scored against the whole bank (other categories act
+    as background documents so that IDF down-weights terms shared by every
+    topic), so one fit serves all categories.
+    """
+
+    def __init__(self, corpus, stop_words=None):
+        """
+        Args:
+            corpus (list): Documents of all categories
+            stop_words (list): Stopwords passed to the vectorizers
+        """
+        # Imported here so that app start-up doesn't load scikit-learn
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        # Unigram + bigram model for important-term extraction
+        self.term_vectorizer = TfidfVectorizer(stop_words=stop_words, ngram_range=(1, 2))
+        self.term_vectorizer.fit(corpus)
+        self.feature_names = self.term_vectorizer.get_feature_names_out()
+
+        # Unigram model for best-answer similarity
+        self.similarity_vectorizer = TfidfVectorizer(stop_words=stop_words)
+        self.similarity_vectorizer.fit(corpus)
+
+
+class CategoryReferenceModel:
+    """
+    Best-answer vectors of one question category on the shared vectorizers
+    """
+
+    def __init__(self, vectorizers, best_answers=()):
+        """
+        Cache the best-answer vectors
+
+        Args:
+            vectorizers (SharedVectorizers): Vectorizers fitted on the whole bank
+            best_answers (list): Best practice answers of the category's questions
+        """
+        self.term_vectorizer = vectorizers.term_vectorizer
+        self.feature_names = vectorizers.feature_names
+        self.similarity_vectorizer = vectorizers.similarity_vectorizer
+
+        best_answers = list(best_answers)
+        if best_answers:
+            matrix = self.similarity_vectorizer.transform(best_answers)
+            self.best_answer_vectors = {answer: matrix[i] for i, answer in enumerate(best_answers)}
+        else:
+            self.best_answer_vectors = {}
+
+    def term_scores(self, text):
+        """
+        Transform a text with the pre-fitted term model
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            numpy.ndarray: Dense TF-IDF scores aligned with feature_names
+        """
+        return self.term_vectorizer.transform([text]).toarray().flatten()
+
+    def similarity_to_best_answer(self, text, best_answer):
+        """
+        Cosine similarity between a text and a cached best-answer vector
+
+        Args:
+            text (str): Input text
+            best_answer (str): One of the category's best answers
+
+        Returns:
+            float: Cosine similarity (0-1), or None if best_answer is not cached
+        """
+        best_answer_vector = self.best_answer_vectors.get(best_answer)
+        if best_answer_vector is None:
+            return None
+
+        # TfidfVectorizer rows are L2-normalized, so the dot product is the cosine
+        vector = self.similarity_vectorizer.transform([text])
+        return float(vector.multiply(best_answer_vector).sum())
+
+
+class ReferenceModelBank:
+    """
+    Holds one CategoryReferenceModel per question category
+
+    The shared vectorizers are fitted on first use (or with fit_all), so
+    constructing the bank is cheap; a category model then only transforms
+    its best answers.
+    """
+
+    def __init__(self, questions, keywords=None, best_answers=None, stopwords=None):
+        """
+        Prepare the bank; no model is fitted yet
+
+        Args:
+            questions (dict): Questions organized by category (one question
+                object or a list of them per category)
+            keywords (dict): Additional keywords by category
+            best_answers (dict): Best answers by category (or by question id)
+            stopwords (set): Stopwords to filter
+        """
+        self.questions = questions
+        self.keywords = keywords or {}
+        self.best_answers = best_answers or {}
+        self.stop_words = list(stopwords) if stopwords else None
+
+        self.models = {}
+        self._vectorizers = None
+        self._answers = {}
+        self._lock = threading.Lock()
+
+    def _best_answers(self, category):
+        """Distinct best answers of a category's questions"""
+        answers = self._answers.get(category)
+        if answers is None:
+            items = normalize_questions({category: self.questions.get(category, [])})
+            answers = self._answers[category] = [
+                answer
+                for answer in dict.fromkeys(best_answer_for(item, self.best_answers) for item in items)
+                if answer
+            ]
+        return answers
+
+    def _category_documents(self, category):
+        """Documents describing a single category"""
+        entries = self.questions.get(category, {})
+        # A category holds one question object or a list of them
+        if isinstance(entries, dict):
+            entries = [entries]
+        documents = []
+        for question_data in entries:
+            documents.append(question_data.get('question', ''))
+            documents.append(' '.join(question_data.get('keywords', [])))
+        documents.append(' '.join(self.keywords.get(category, [])))
+        documents.extend(self._best_answers(category))
+        return [d for d in documents if d]
+
+    def _fit_vectorizers(self):
+        """Fit the shared vectorizers once (caller holds the lock)"""
+        if self._vectorizers is None:
+            corpus = [document for category in self.questions for document in self._category_documents(category)]
+            try:
+                self._vectorizers = SharedVectorizers(corpus, self.stop_words)
+            except ValueError as e:
+                # Empty vocabulary (e.g. a bank without any text)
+                print(f"⚠️ Reference models not available: {e}")
+                self._vectorizers = False
+        return self._vectorizers
+
+    def _fit_category(self, category):
+        """Build the reference model for one category (caller holds the lock)"""
+        vectorizers = self._fit_vectorizers()
+        if not vectorizers:
+            return None
+        return CategoryReferenceModel(vectorizers, self._best_answers(category))
+
+    def get(self, category):
+        """
+        Get the reference model for a category
+
+        Args:
+            category (str): Question category
+
+        Returns:
+            CategoryReferenceModel: Fitted model, or None if unavailable
+        """
+        if category in self.models:
+            return self.models[category]
+        if category not in self.questions:
+            return None
+
+        with self._lock:
+            if category not in self.models:
+                self.models[category] = self._fit_category(category)
+        return self.models[category]
+
+    def fit_all(self):
+        """
+        Fit every category model up front (e.g. for batch jobs or warm-up)
+
+        Returns:
+            ReferenceModelBank: self
+        """
+        for category in self.questions:
+            self.get(category)
+        return self
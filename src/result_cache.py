@@ -0,0 +1,160 @@
+"""
+Result Cache Module
+Bounded LRU cache with TTL eviction for analysis results
+"""
+
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_answer(text):
+    """
+    Normalize an answer for cache keys
+
+    Unicode is NFC-normalized, line endings unified, runs of spaces/tabs
+    collapsed and surrounding whitespace stripped. Newlines are kept because
+    they affect the structural analysis.
+
+    Args:
+        text (str): Raw answer
+
+    Returns:
+        str: Normalized answer
+    """
+    text = unicodedata.normalize('NFC', text or '')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r' ?\n ?', '\n', text)
+    return text.strip()
+
+
+def make_cache_key(*parts):
+    """
+    Hash key parts into a fixed-size cache key
+
+    Args:
+        *parts: Values identifying the cached computation
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with size and TTL eviction plus hit/miss counters
+    """
+
+    def __init__(self, max_size=256, ttl_seconds=3600, clock=time.monotonic):
+        """
+        Args:
+            max_size (int): Maximum number of entries
+            ttl_seconds (float): Entry lifetime; None disables expiry
+            clock (callable): Monotonic time source
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    _MISSING = object()
+
+    def get(self, key, default=None):
+        """
+        Look up a key, refreshing its LRU position
+
+        Args:
+            key (hashable): Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                # Expired
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries beyond max_size
+
+        Args:
+            key (hashable): Cache key
+            value: Value to cache
+        """
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        The computation runs outside the lock, so concurrent misses for the
+        same key may both compute; the last result wins.
+
+        Args:
+            key (hashable): Cache key
+            compute (callable): Zero-argument function producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+        Cache counters
+
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
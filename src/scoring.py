@@ -3,18 +3,135 @@ Scoring Engine Module
 Calculates final scores and generates feedback
 """
 
+import numpy as np
+
+from result_cache import ResultCache
+
+
+# Column order of component score matrices used by calculate_scores_batch.
+# The eight reported components plus n-grams, which feed depth of knowledge.
+COMPONENT_COLUMNS = (
+    'keyword', 'tfidf', 'ner', 'sentiment', 'readability',
+    'structural', 'coherence', 'similarity', 'ngram'
+)
+
+# How component scores combine into the three composite scores
+COMPOSITE_WEIGHTS = {
+    # Technical Accuracy: keyword coverage + NER + similarity
+    'technical_accuracy': (('keyword', 0.35), ('ner', 0.35), ('similarity', 0.30)),
+    # Depth of Knowledge: TF-IDF + structure + ngrams
+    'depth_of_knowledge': (('tfidf', 0.40), ('structural', 0.40), ('ngram', 0.20)),
+    # Communication Clarity: readability + coherence + sentiment
+    'communication_clarity': (('readability', 0.40), ('coherence', 0.35), ('sentiment', 0.25))
+}
+
+# Question weight key applied to each composite score
+QUESTION_WEIGHT_KEYS = (
+    ('technical_accuracy', 'technical'),
+    ('depth_of_knowledge', 'depth'),
+    ('communication_clarity', 'structure')
+)
+
+
+def extract_key_points(text, limit=None):
+    """
+    Split text into key points (sentences longer than 20 characters)
+
+    Args:
+        text (str): Input text
+        limit (int): Maximum number of points (default: all)
+
+    Returns:
+        list: Key point strings
+    """
+    sentences = [s.strip() for s in (text or '').split('.') if len(s.strip()) > 20]
+    return sentences[:limit] if limit is not None else sentences
+
+
+class KeyPointIndex:
+    """
+    Key points of a best answer, vectorized once as a binary word matrix
+
+    Two points "match" when they share more than a threshold of distinct
+    lowercase words. With both sides as binary bag-of-words rows, all
+    pairwise shared-word counts come from one sparse matrix product.
+    """
+
+    def __init__(self, best_answer, points=None):
+        """
+        Segment and vectorize a best answer
+
+        Args:
+            best_answer (str): Reference answer
+            points (sequence): Pre-split key points of best_answer
+                (e.g. from the compiled question bank)
+        """
+        # Imported here so that app start-up doesn't load scikit-learn
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        self.points = list(points) if points is not None else extract_key_points(best_answer)
+        self.vectorizer = None
+        self.matrix = None
+        if self.points:
+            # Whitespace tokens, as in a plain word-set comparison
+            self.vectorizer = CountVectorizer(binary=True, tokenizer=str.split, token_pattern=None)
+            self.matrix = self.vectorizer.fit_transform(self.points)
+
+    def shared_word_counts(self, sentences):
+        """
+        Distinct words shared by every key point and every sentence
+
+        Args:
+            sentences (list): Sentences of the user's answer
+
+        Returns:
+            numpy.ndarray: (points x sentences) shared-word counts
+        """
+        if self.matrix is None or not sentences:
+            return np.zeros((len(self.points), len(sentences)), dtype=int)
+        # Words outside the best-answer vocabulary cannot be shared and are dropped
+        answer_matrix = self.vectorizer.transform(sentences)
+        return (self.matrix @ answer_matrix.T).toarray()
+
+    def missing_points(self, sentences, overlap_threshold=3):
+        """
+        Key points not covered by any sentence
+
+        Args:
+            sentences (list): Sentences of the user's answer
+            overlap_threshold (int): A point is covered by a sentence sharing
+                more than this many words with it
+
+        Returns:
+            list: Uncovered key points, in best-answer order
+        """
+        if not self.points:
+            return []
+        if not sentences:
+            return list(self.points)
+        best_overlap = self.shared_word_counts(sentences).max(axis=1)
+        return [point for point, overlap in zip(self.points, best_overlap) if overlap <= overlap_threshold]
+
 
 class ScoringEngine:
     """
     Engine for calculating interview scores based on text mining results
     """
     
-    def __init__(self):
+    def __init__(self, gap_overlap_threshold=3):
+        """
+        Args:
+            gap_overlap_threshold (int): Shared words a sentence needs beyond
+                this count to cover a best-answer key point
+        """
         self.difficulty_multipliers = {
             'Junior': 0.9,
             'Mid-level': 1.0,
             'Senior': 1.15
         }
+        self.gap_overlap_threshold = gap_overlap_threshold
+        # One KeyPointIndex per best answer (i.e. per category)
+        self.key_point_indexes = ResultCache(max_size=64, ttl_seconds=None)
     
     def calculate_scores(self, analysis_result, question_weights, difficulty='Mid-level'):
         """
@@ -40,27 +157,23 @@ class ScoringEngine:
         # Add similarity if available
         similarity_score = analysis_result['similarity'].get('score', 0) if analysis_result.get('similarity') else 0
         
-        # Calculate composite scores
-        # Technical Accuracy: keyword coverage + NER + similarity
-        technical_accuracy = (
-            keyword_score * 0.35 +
-            ner_score * 0.35 +
-            similarity_score * 0.30
-        )
-        
-        # Depth of Knowledge: TF-IDF + structure + ngrams
         ngram_score = analysis_result['ngrams'].get('score', 0)
-        depth_of_knowledge = (
-            tfidf_score * 0.40 +
-            structural_score * 0.40 +
-            ngram_score * 0.20
-        )
+        values = {
+            'keyword': keyword_score,
+            'tfidf': tfidf_score,
+            'ner': ner_score,
+            'sentiment': sentiment_score,
+            'readability': readability_score,
+            'structural': structural_score,
+            'coherence': coherence_score,
+            'similarity': similarity_score,
+            'ngram': ngram_score
+        }
         
-        # Communication Clarity: readability + sentiment + coherence
-        communication_clarity = (
-            readability_score * 0.40 +
-            coherence_score * 0.35 +
-            sentiment_score * 0.25
+        # Calculate composite scores
+        technical_accuracy, depth_of_knowledge, communication_clarity = (
+            sum(values[name] * weight for name, weight in COMPOSITE_WEIGHTS[composite])
+            for composite, _ in QUESTION_WEIGHT_KEYS
         )
         
         # Apply question-specific weights
@@ -93,7 +206,102 @@ class ScoringEngine:
             }
         }
     
-    def generate_detailed_feedback(self, answer, best_answer, analysis_result, scores):
+    def component_row(self, analysis_result):
+        """
+        Extract component scores of one analysis in COMPONENT_COLUMNS order
+        
+        Args:
+            analysis_result (dict): Results from TextMiningAnalyzer
+            
+        Returns:
+            list: Component scores
+        """
+        similarity = analysis_result.get('similarity') or {}
+        return [
+            analysis_result['keyword_analysis']['score'],
+            analysis_result['tfidf']['score'],
+            analysis_result['ner']['score'],
+            analysis_result['sentiment']['score'],
+            analysis_result['readability']['score'],
+            analysis_result['structural']['score'],
+            analysis_result['coherence']['score'],
+            similarity.get('score', 0),
+            analysis_result['ngrams'].get('score', 0)
+        ]
+    
+    def component_matrix(self, analysis_results):
+        """
+        Stack component scores of many analyses into an N x 9 matrix
+        
+        Args:
+            analysis_results (iterable): Results from TextMiningAnalyzer
+            
+        Returns:
+            numpy.ndarray: Component scores, columns in COMPONENT_COLUMNS order
+        """
+        rows = [self.component_row(result) for result in analysis_results]
+        return np.asarray(rows, dtype=float).reshape(-1, len(COMPONENT_COLUMNS))
+    
+    def calculate_scores_batch(self, component_scores, question_weights, difficulty='Mid-level'):
+        """
+        Vectorized calculate_scores over a matrix of component scores
+        
+        Args:
+            component_scores (array-like): N x 9 scores, columns in COMPONENT_COLUMNS order
+            question_weights (dict | array-like): One weight dict for all rows, or an
+                N x 3 array of (technical, depth, structure) weights
+            difficulty (str | array-like): One difficulty for all rows, or N difficulties
+            
+        Returns:
+            dict: Arrays of length N for technical_accuracy, depth_of_knowledge,
+                communication_clarity and overall
+        """
+        components = np.asarray(component_scores, dtype=float)
+        if components.ndim != 2 or components.shape[1] != len(COMPONENT_COLUMNS):
+            raise ValueError(
+                f"component_scores must have shape (N, {len(COMPONENT_COLUMNS)}), got {components.shape}"
+            )
+        n_rows = components.shape[0]
+        column = {name: components[:, i] for i, name in enumerate(COMPONENT_COLUMNS)}
+        
+        # Composite scores (same term order as calculate_scores)
+        composites = {}
+        for composite, _ in QUESTION_WEIGHT_KEYS:
+            total = np.zeros(n_rows)
+            for name, weight in COMPOSITE_WEIGHTS[composite]:
+                total = total + column[name] * weight
+            composites[composite] = total
+        
+        # Question weights: a single dict or one row per answer
+        if isinstance(question_weights, dict):
+            weights = np.tile(
+                [question_weights[key] for _, key in QUESTION_WEIGHT_KEYS], (n_rows, 1)
+            ).astype(float)
+        else:
+            weights = np.broadcast_to(np.asarray(question_weights, dtype=float), (n_rows, 3))
+        
+        overall = np.zeros(n_rows)
+        for i, (composite, _) in enumerate(QUESTION_WEIGHT_KEYS):
+            overall = overall + composites[composite] * weights[:, i]
+        
+        # Difficulty multipliers: map unique labels once, then broadcast
+        if isinstance(difficulty, str):
+            multipliers = np.full(n_rows, self.difficulty_multipliers.get(difficulty, 1.0))
+        else:
+            labels, inverse = np.unique(np.asarray(difficulty, dtype=str), return_inverse=True)
+            lookup = np.array([self.difficulty_multipliers.get(label, 1.0) for label in labels])
+            multipliers = lookup[inverse.reshape(-1)]
+        
+        overall = np.minimum(overall * multipliers, 5.0)
+        
+        result = {
+            composite: np.round(np.minimum(values, 5.0), 2)
+            for composite, values in composites.items()
+        }
+        result['overall'] = np.round(overall, 2)
+        return result
+    
+    def generate_detailed_feedback(self, answer, best_answer, analysis_result, scores, key_points=None):
         """
         Generate comprehensive feedback with comparison (INDONESIAN VERSION)
         
@@ -102,6 +310,7 @@ class ScoringEngine:
             best_answer (str): Reference answer
             analysis_result (dict): Analysis results
             scores (dict): Calculated scores
+            key_points (sequence): Pre-split key points of best_answer (optional)
             
         Returns:
             dict: Detailed feedback with multiple sections
@@ -111,17 +320,20 @@ class ScoringEngine:
         gaps = []
         recommendations = []
         
-        # Compare answers
-        answer_points = self._extract_key_points(answer)
-        best_points = self._extract_key_points(best_answer)
-        
         # Identify gaps (apa yang ada di best answer tapi tidak di jawaban user)
-        for point in best_points[:5]:  # Ambil 5 point penting dari best answer
-            if not any(self._similarity_check(point, ap) for ap in answer_points):
-                # Ekstrak kata kunci dari point yang missing
-                words = [w for w in point.lower().split() if len(w) > 4][:3]
-                if words:
-                    gaps.append(f"Tidak menyebutkan tentang {' '.join(words[:2])}")
+        # Semua point best answer dibandingkan dengan semua kalimat jawaban
+        # dalam satu perkalian matriks sparse
+        key_point_index = self.key_point_indexes.get_or_compute(
+            best_answer, lambda: KeyPointIndex(best_answer, key_points)
+        )
+        missing_points = key_point_index.missing_points(
+            extract_key_points(answer), self.gap_overlap_threshold
+        )
+        for point in missing_points:
+            # Ekstrak kata kunci dari point yang missing
+            words = [w for w in point.lower().split() if len(w) > 4][:3]
+            if words:
+                gaps.append(f"Tidak menyebutkan tentang {' '.join(words[:2])}")
         
         # Limit gaps
         gaps = gaps[:5]  # Maksimal 5 gaps
@@ -313,21 +525,6 @@ class ScoringEngine:
             'recommendations': recommendations[:5]
         }
     
-    def _extract_key_points(self, text):
-        """Extract key points from text"""
-        # Split into sentences
-        sentences = [s.strip() for s in text.split('.') if len(s.strip()) > 20]
-        # Return first 10 meaningful sentences
-        return sentences[:10]
-    
-    def _similarity_check(self, text1, text2):
-        """Check if two texts are similar"""
-        # Simple word overlap check
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        overlap = len(words1.intersection(words2))
-        return overlap > 3
-    
     def _generate_specific_feedback(self, answer, best_answer, analysis, scores):
         """Generate specific actionable feedback (INDONESIAN)"""
         feedback_parts = []
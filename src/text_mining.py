@@ -5,25 +5,105 @@ Implements comprehensive NLP algorithms for interview answer analysis
 
 import re
 import string
+import functools
+import threading
 from collections import Counter
-from textblob import TextBlob
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import nltk
-from nltk import ngrams
-from nltk.tokenize import word_tokenize, sent_tokenize
+from keyword_matcher import KeywordMatcher
+from instrumentation import timing_registry
 
-# Download required NLTK data (run once)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+# TextBlob, scikit-learn and NLTK are imported on first use so that pages
+# which never run an analysis don't pay for loading them.
 
-try:
-    nltk.data.find('averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger', quiet=True)
+
+@functools.lru_cache(maxsize=None)
+def _nltk_tokenizers():
+    """
+    Import NLTK tokenizers, downloading missing data (checked once per process)
+    
+    Returns:
+        tuple: (sent_tokenize, word_tokenize, ngrams)
+    """
+    import nltk
+    
+    for resource, package in (
+        ('tokenizers/punkt', 'punkt'),
+        ('tokenizers/punkt_tab', 'punkt_tab'),
+        ('averaged_perceptron_tagger', 'averaged_perceptron_tagger')
+    ):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+    
+    from nltk import ngrams
+    from nltk.tokenize import word_tokenize, sent_tokenize
+    return sent_tokenize, word_tokenize, ngrams
+
+
+def sent_tokenize(text):
+    """Split text into sentences (NLTK punkt)"""
+    return _nltk_tokenizers()[0](text)
+
+
+def word_tokenize(text):
+    """Split text into word tokens (NLTK)"""
+    return _nltk_tokenizers()[1](text)
+
+
+def ngrams(sequence, n):
+    """Iterate over n-grams of a token sequence (NLTK)"""
+    return _nltk_tokenizers()[2](sequence, n)
+
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Transition/connection words used by the coherence analysis
+TRANSITION_WORDS = [
+    'however', 'moreover', 'furthermore', 'therefore', 'consequently',
+    'additionally', 'similarly', 'in contrast', 'for example',
+    'specifically', 'first', 'second', 'finally', 'sebagai tambahan',
+    'oleh karena itu', 'selain itu', 'dengan demikian', 'misalnya'
+]
+
+
+class ParsedDocument:
+    """
+    Tokenized view of an answer, built once and shared by every analyzer
+    """
+    
+    def __init__(self, text, stopwords=None):
+        """
+        Run the single tokenization pass over the text
+        
+        Args:
+            text (str): Raw answer text
+            stopwords (set): Stopwords removed from filtered_tokens
+        """
+        self.text = text
+        self.lower = text.lower()
+        
+        # Whitespace words (used for length/density metrics)
+        self.words = text.split()
+        
+        # Sentences and their word counts
+        self.sentences = sent_tokenize(text)
+        self.sentence_lengths = [len(s.split()) for s in self.sentences]
+        
+        # Lowercased, punctuation-free tokens
+        self.tokens = word_tokenize(self.lower.translate(_PUNCTUATION_TABLE))
+        if stopwords:
+            self.filtered_tokens = [t for t in self.tokens if t not in stopwords]
+        else:
+            self.filtered_tokens = self.tokens
+    
+    @property
+    def word_count(self):
+        return len(self.words)
+    
+    @property
+    def sentence_count(self):
+        return len(self.sentences)
 
 
 class TextMiningAnalyzer:
@@ -31,14 +111,24 @@ class TextMiningAnalyzer:
     Comprehensive text mining analyzer for interview answers
     """
     
-    def __init__(self, stopwords=None):
+    def __init__(self, stopwords=None, reference_models=None, instrument=False, timing_registry=None):
         """
         Initialize analyzer with stopwords
         
         Args:
             stopwords (set): Set of stopwords to filter
+            reference_models (ReferenceModelBank): Optional pre-fitted TF-IDF models per category
+            instrument (bool): Record per-stage wall time in comprehensive_analysis
+            timing_registry (StageTimingRegistry): Aggregate registry (default: process-wide one)
         """
-        self.stopwords = stopwords if stopwords else set()
+        # Immutable so a single analyzer can be shared across sessions and threads
+        self.stopwords = frozenset(stopwords) if stopwords else frozenset()
+        self.reference_models = reference_models
+        self.instrument = instrument
+        self.timing_registry = timing_registry
+        
+        # sklearn expects a list; convert once instead of per request
+        self._stopword_list = list(self.stopwords) if self.stopwords else None
         
         # Data Science specific entities
         self.ds_entities = {
@@ -55,6 +145,35 @@ class TextMiningAnalyzer:
                        'rmse', 'mae', 'r2', 'r-squared', 'auc', 'roc', 
                        'confusion matrix', 'mse', 'cross-validation']
         }
+        
+        # One automaton over every entity term, compiled at load time
+        self.entity_matcher = KeywordMatcher(
+            term for terms in self.ds_entities.values() for term in terms
+        )
+        
+        # Compiled keyword automata, keyed by vocabulary
+        self._keyword_matchers = {}
+        self._keyword_matchers_lock = threading.Lock()
+    
+    def compile_keywords(self, keywords):
+        """
+        Get the compiled matcher for a keyword list, building it on first use
+        
+        Args:
+            keywords (list): Expected keywords
+            
+        Returns:
+            KeywordMatcher: Compiled automaton for the keyword vocabulary
+        """
+        key = frozenset(kw.lower() for kw in keywords)
+        matcher = self._keyword_matchers.get(key)
+        if matcher is None:
+            with self._keyword_matchers_lock:
+                matcher = self._keyword_matchers.get(key)
+                if matcher is None:
+                    matcher = KeywordMatcher(sorted(key))
+                    self._keyword_matchers[key] = matcher
+        return matcher
     
     def preprocess_text(self, text, remove_stopwords=True):
         """
@@ -71,7 +190,7 @@ class TextMiningAnalyzer:
         text = text.lower()
         
         # Remove punctuation
-        text = text.translate(str.maketrans('', '', string.punctuation))
+        text = text.translate(_PUNCTUATION_TABLE)
         
         # Tokenize
         tokens = word_tokenize(text)
@@ -82,29 +201,48 @@ class TextMiningAnalyzer:
         
         return tokens
     
+    def parse(self, text):
+        """
+        Build the shared tokenized view of a text
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            ParsedDocument: Parsed document using this analyzer's stopwords
+        """
+        return ParsedDocument(text, self.stopwords)
+    
+    def _as_document(self, answer):
+        """Accept either raw text or an already parsed document"""
+        if isinstance(answer, ParsedDocument):
+            return answer
+        return self.parse(answer)
+    
     def quick_analysis(self, answer, expected_keywords):
         """
         Quick statistical analysis
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             expected_keywords (list): Expected keywords
             
         Returns:
             dict: Quick statistics
         """
-        words = answer.split()
-        sentences = sent_tokenize(answer)
+        doc = self._as_document(answer)
+        word_count = doc.word_count
+        sentence_count = doc.sentence_count
         
         # Count keywords
-        answer_lower = answer.lower()
-        keywords_found = sum(1 for kw in expected_keywords if kw in answer_lower)
+        found = self.compile_keywords(expected_keywords).found(doc.lower)
+        keywords_found = sum(1 for kw in expected_keywords if kw.lower() in found)
         keyword_coverage = (keywords_found / len(expected_keywords) * 100) if expected_keywords else 0
         
         return {
-            'word_count': len(words),
-            'sentence_count': len(sentences),
-            'avg_sentence_length': len(words) / len(sentences) if sentences else 0,
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'avg_sentence_length': word_count / sentence_count if sentence_count else 0,
             'keywords_found': keywords_found,
             'keyword_coverage': keyword_coverage
         }
@@ -114,66 +252,85 @@ class TextMiningAnalyzer:
         Analyze keyword coverage and relevance
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             expected_keywords (list): Expected keywords
             
         Returns:
             dict: Keyword analysis results
         """
-        answer_lower = answer.lower()
+        doc = self._as_document(answer)
         
-        found_keywords = [kw for kw in expected_keywords if kw in answer_lower]
+        keyword_counts = self.compile_keywords(expected_keywords).counts(doc.lower)
+        
+        found_keywords = [kw for kw in expected_keywords if kw.lower() in keyword_counts]
         coverage = (len(found_keywords) / len(expected_keywords) * 100) if expected_keywords else 0
         
         # Calculate keyword density
-        total_words = len(answer.split())
+        total_words = doc.word_count
         keyword_density = (len(found_keywords) / total_words * 100) if total_words > 0 else 0
         
         return {
             'expected_keywords': expected_keywords,
             'found_keywords': found_keywords,
+            'keyword_counts': dict(keyword_counts),
             'coverage': coverage,
             'keyword_density': keyword_density,
             'score': min(coverage / 20, 5.0)
         }
     
-    def tfidf_analysis(self, answer, reference_texts=None):
+    def _reference_model(self, category):
+        """Pre-fitted reference model for a category, if available"""
+        if self.reference_models is None or category is None:
+            return None
+        return self.reference_models.get(category)
+    
+    def tfidf_analysis(self, answer, reference_texts=None, category=None):
         """
         TF-IDF analysis to identify important terms
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             reference_texts (list): Optional reference texts for comparison
+            category (str): Question category; uses its pre-fitted model when available
             
         Returns:
             dict: TF-IDF analysis results
         """
-        # Prepare corpus
-        if reference_texts:
-            corpus = [answer] + reference_texts
-        else:
-            corpus = [answer]
-        
-        # Create TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(
-            max_features=50,
-            stop_words=list(self.stopwords) if self.stopwords else None,
-            ngram_range=(1, 2)
-        )
+        doc = self._as_document(answer)
+        model = self._reference_model(category)
         
         try:
-            tfidf_matrix = vectorizer.fit_transform(corpus)
-            feature_names = vectorizer.get_feature_names_out()
-            
-            # Get TF-IDF scores for the answer
-            answer_scores = tfidf_matrix[0].toarray().flatten()
+            if model is not None:
+                # Pre-fitted model: only transform the answer
+                feature_names = model.feature_names
+                answer_scores = model.term_scores(doc.text)
+            else:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                
+                # Prepare corpus
+                if reference_texts:
+                    corpus = [doc.text] + reference_texts
+                else:
+                    corpus = [doc.text]
+                
+                # Create TF-IDF vectorizer
+                vectorizer = TfidfVectorizer(
+                    max_features=50,
+                    stop_words=self._stopword_list,
+                    ngram_range=(1, 2)
+                )
+                tfidf_matrix = vectorizer.fit_transform(corpus)
+                feature_names = vectorizer.get_feature_names_out()
+                
+                # Get TF-IDF scores for the answer
+                answer_scores = tfidf_matrix[0].toarray().flatten()
             
             # Get top terms
             top_indices = answer_scores.argsort()[-10:][::-1]
             top_terms = [(feature_names[i], answer_scores[i]) for i in top_indices if answer_scores[i] > 0]
             
             # Calculate statistics
-            tokens = self.preprocess_text(answer, remove_stopwords=False)
+            tokens = doc.tokens
             unique_tokens = set(tokens)
             
             lexical_diversity = len(unique_tokens) / len(tokens) if tokens else 0
@@ -192,7 +349,7 @@ class TextMiningAnalyzer:
             }
         except Exception as e:
             # Fallback if TF-IDF fails
-            tokens = self.preprocess_text(answer)
+            tokens = doc.filtered_tokens
             return {
                 'top_terms': [],
                 'total_words': len(tokens),
@@ -202,33 +359,43 @@ class TextMiningAnalyzer:
                 'score': 0
             }
     
-    def calculate_cosine_similarity(self, text1, text2):
+    def calculate_cosine_similarity(self, text1, text2, category=None):
         """
         Calculate cosine similarity between two texts
         
         Args:
-            text1 (str): First text
+            text1 (str | ParsedDocument): First text
             text2 (str): Second text
+            category (str): Question category; when text2 is its best answer the
+                cached best-answer vector is reused
             
         Returns:
             dict: Similarity results
         """
-        if not text1 or not text2:
+        doc1 = self._as_document(text1) if text1 else None
+        
+        if not doc1 or not doc1.text or not text2:
             return {
                 'cosine_similarity': 0.0,
                 'interpretation': 'No comparison available',
                 'common_terms_count': 0
             }
         
-        # Create TF-IDF vectors
-        vectorizer = TfidfVectorizer(stop_words=list(self.stopwords) if self.stopwords else None)
+        model = self._reference_model(category)
         
         try:
-            tfidf_matrix = vectorizer.fit_transform([text1, text2])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            similarity = model.similarity_to_best_answer(doc1.text, text2) if model is not None else None
+            if similarity is None:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                from sklearn.metrics.pairwise import cosine_similarity
+                
+                # Create TF-IDF vectors
+                vectorizer = TfidfVectorizer(stop_words=self._stopword_list)
+                tfidf_matrix = vectorizer.fit_transform([doc1.text, text2])
+                similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
             
             # Find common terms
-            tokens1 = set(self.preprocess_text(text1))
+            tokens1 = set(doc1.filtered_tokens)
             tokens2 = set(self.preprocess_text(text2))
             common_terms = tokens1.intersection(tokens2)
             
@@ -261,13 +428,13 @@ class TextMiningAnalyzer:
         Extract and analyze n-grams
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             n_range (tuple): Range of n-gram sizes
             
         Returns:
             dict: N-gram analysis results
         """
-        tokens = self.preprocess_text(answer)
+        tokens = self._as_document(answer).filtered_tokens
         
         results = {}
         
@@ -298,18 +465,18 @@ class TextMiningAnalyzer:
         Extract named entities (tools, libraries, methods, metrics)
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             
         Returns:
             dict: Named entities found
         """
-        answer_lower = answer.lower()
+        found = self.entity_matcher.found(self._as_document(answer).lower)
         
         found_entities = {
-            'tools': [t for t in self.ds_entities['tools'] if t in answer_lower],
-            'libraries': [l for l in self.ds_entities['libraries'] if l in answer_lower],
-            'methods': [m for m in self.ds_entities['methods'] if m in answer_lower],
-            'metrics': [m for m in self.ds_entities['metrics'] if m in answer_lower]
+            'tools': [t for t in self.ds_entities['tools'] if t in found],
+            'libraries': [l for l in self.ds_entities['libraries'] if l in found],
+            'methods': [m for m in self.ds_entities['methods'] if m in found],
+            'metrics': [m for m in self.ds_entities['metrics'] if m in found]
         }
         
         total_entities = sum(len(v) for v in found_entities.values())
@@ -331,13 +498,15 @@ class TextMiningAnalyzer:
         Analyze sentiment and tone
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             
         Returns:
             dict: Sentiment analysis results
         """
         try:
-            blob = TextBlob(answer)
+            from textblob import TextBlob
+            
+            blob = TextBlob(self._as_document(answer).text)
             polarity = blob.sentiment.polarity  # -1 to 1
             subjectivity = blob.sentiment.subjectivity  # 0 to 1
             
@@ -381,16 +550,15 @@ class TextMiningAnalyzer:
         Analyze readability and structure
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             
         Returns:
             dict: Readability metrics
         """
-        sentences = sent_tokenize(answer)
-        words = answer.split()
+        doc = self._as_document(answer)
         
-        word_count = len(words)
-        sentence_count = len(sentences)
+        word_count = doc.word_count
+        sentence_count = doc.sentence_count
         
         if sentence_count == 0 or word_count == 0:
             return {
@@ -421,7 +589,7 @@ class TextMiningAnalyzer:
             assessment = "Poor structure"
         
         # Calculate variance in sentence length (good writing has variation)
-        sentence_lengths = [len(s.split()) for s in sentences]
+        sentence_lengths = doc.sentence_lengths
         length_variance = np.var(sentence_lengths) if len(sentence_lengths) > 1 else 0
         
         # Moderate variance is good
@@ -444,13 +612,14 @@ class TextMiningAnalyzer:
         Analyze answer structure and organization
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             ideal_length (tuple): (min_words, max_words)
             
         Returns:
             dict: Structural analysis results
         """
-        word_count = len(answer.split())
+        doc = self._as_document(answer)
+        word_count = doc.word_count
         min_len, max_len = ideal_length
         
         # Length score
@@ -473,13 +642,13 @@ class TextMiningAnalyzer:
             'project', 'pengalaman', 'saya pernah', 'pada saat', 'ketika',
             'for example', 'for instance', 'such as'
         ]
-        has_examples = any(indicator in answer.lower() for indicator in example_indicators)
+        has_examples = any(indicator in doc.lower for indicator in example_indicators)
         
         # Check for structure (paragraphs, organization)
-        has_structure = '\n' in answer or len(sent_tokenize(answer)) > 3
+        has_structure = '\n' in doc.text or doc.sentence_count > 3
         
         # Check for quantitative mentions (shows concrete results)
-        has_numbers = bool(re.search(r'\d+', answer))
+        has_numbers = bool(re.search(r'\d+', doc.text))
         
         # Bonus points
         example_bonus = 0.5 if has_examples else 0
@@ -502,12 +671,13 @@ class TextMiningAnalyzer:
         Analyze coherence and logical flow
         
         Args:
-            answer (str): User's answer
+            answer (str | ParsedDocument): User's answer
             
         Returns:
             dict: Coherence metrics
         """
-        sentences = sent_tokenize(answer)
+        doc = self._as_document(answer)
+        sentences = doc.sentences
         
         if len(sentences) < 2:
             return {
@@ -517,18 +687,10 @@ class TextMiningAnalyzer:
             }
         
         # Check for transition/connection words
-        transition_words = [
-            'however', 'moreover', 'furthermore', 'therefore', 'consequently',
-            'additionally', 'similarly', 'in contrast', 'for example',
-            'specifically', 'first', 'second', 'finally', 'sebagai tambahan',
-            'oleh karena itu', 'selain itu', 'dengan demikian', 'misalnya'
-        ]
-        
-        answer_lower = answer.lower()
-        transition_count = sum(1 for tw in transition_words if tw in answer_lower)
+        transition_count = sum(1 for tw in TRANSITION_WORDS if tw in doc.lower)
         
         # Calculate lexical cohesion (repeated important terms)
-        tokens = self.preprocess_text(answer)
+        tokens = doc.filtered_tokens
         word_freq = Counter(tokens)
         repeated_terms = sum(1 for count in word_freq.values() if count > 1)
         
@@ -545,7 +707,8 @@ class TextMiningAnalyzer:
             'repeated_terms': repeated_terms
         }
     
-    def comprehensive_analysis(self, answer, question_data, best_answer="", category_keywords=None):
+    def comprehensive_analysis(self, answer, question_data, best_answer="", category_keywords=None,
+                               category=None):
         """
         Run all text mining analyses
         
@@ -554,6 +717,7 @@ class TextMiningAnalyzer:
             question_data (dict): Question metadata
             best_answer (str): Reference best answer
             category_keywords (list): Additional category keywords
+            category (str): Question category, used to pick pre-fitted reference models
             
         Returns:
             dict: Comprehensive analysis results
@@ -562,14 +726,46 @@ class TextMiningAnalyzer:
         if category_keywords:
             all_keywords = list(set(all_keywords + category_keywords))
         
+        if self.instrument:
+            return self._instrumented_analysis(answer, question_data, best_answer, all_keywords, category)
+        
+        # Tokenize once; every analyzer below reuses the same parse
+        doc = self.parse(answer)
+        
         return {
-            'keyword_analysis': self.keyword_analysis(answer, all_keywords),
-            'tfidf': self.tfidf_analysis(answer, [best_answer] if best_answer else None),
-            'similarity': self.calculate_cosine_similarity(answer, best_answer) if best_answer else {},
-            'ngrams': self.ngram_analysis(answer),
-            'ner': self.named_entity_recognition(answer),
-            'sentiment': self.sentiment_analysis(answer),
-            'readability': self.readability_analysis(answer),
-            'structural': self.structural_analysis(answer, question_data['ideal_length']),
-            'coherence': self.coherence_analysis(answer)
+            result_key: run()
+            for result_key, _, run in self._analysis_stages(doc, question_data, best_answer, all_keywords, category)
         }
+    
+    def _analysis_stages(self, doc, question_data, best_answer, all_keywords, category):
+        """(result key, stage name, callable) for every sub-analysis, in order"""
+        return [
+            ('keyword_analysis', 'keyword', lambda: self.keyword_analysis(doc, all_keywords)),
+            ('tfidf', 'tfidf', lambda: self.tfidf_analysis(doc, [best_answer] if best_answer else None, category)),
+            ('similarity', 'similarity',
+             lambda: self.calculate_cosine_similarity(doc, best_answer, category) if best_answer else {}),
+            ('ngrams', 'ngrams', lambda: self.ngram_analysis(doc)),
+            ('ner', 'ner', lambda: self.named_entity_recognition(doc)),
+            ('sentiment', 'sentiment', lambda: self.sentiment_analysis(doc)),
+            ('readability', 'readability', lambda: self.readability_analysis(doc)),
+            ('structural', 'structural', lambda: self.structural_analysis(doc, question_data['ideal_length'])),
+            ('coherence', 'coherence', lambda: self.coherence_analysis(doc))
+        ]
+    
+    def _instrumented_analysis(self, answer, question_data, best_answer, all_keywords, category):
+        """comprehensive_analysis with per-stage wall time attached as result['timings']"""
+        registry = self.timing_registry or timing_registry
+        timings = {}
+        
+        with registry.time('total', timings):
+            with registry.time('parse', timings):
+                doc = self.parse(answer)
+            
+            result = {}
+            for result_key, stage, run in self._analysis_stages(doc, question_data, best_answer,
+                                                                all_keywords, category):
+                with registry.time(stage, timings):
+                    result[result_key] = run()
+        
+        result['timings'] = timings
+        return result
@@ -3,11 +3,87 @@ Visualization Module
 Generates charts and visual representations of analysis results
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import numpy as np
+import functools
+import hashlib
+import io
+import json
+import sys
+
+from result_cache import ResultCache, make_cache_key
+
+# Plotting libraries are imported inside each method so that importing this
+# module (and rendering pages without charts) stays cheap.
+
+
+def _content_key(o):
+    """
+    JSON-serializable stand-in for a value json can't encode
+
+    Arrays and DataFrames are reduced to a hash of their full contents
+    (their repr abbreviates large data). Any other type raises TypeError,
+    which makes the call bypass the cache.
+    """
+    if isinstance(o, (set, frozenset)):
+        return sorted(o)
+    # Only check for numpy/pandas types if the caller already imported them
+    np = sys.modules.get('numpy')
+    if np is not None:
+        if isinstance(o, np.generic):
+            return o.item()
+        if isinstance(o, np.ndarray) and not o.dtype.hasobject:
+            digest = hashlib.sha256(np.ascontiguousarray(o).tobytes()).hexdigest()
+            return ['ndarray', o.dtype.str, list(o.shape), digest]
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(o, (pd.DataFrame, pd.Series)):
+        row_hashes = pd.util.hash_pandas_object(o, index=True).to_numpy()
+        digest = hashlib.sha256(row_hashes.tobytes()).hexdigest()
+        if isinstance(o, pd.DataFrame):
+            labels = [str(o.columns.tolist()), str(o.dtypes.tolist())]
+        else:
+            labels = [str(o.name), str(o.dtype)]
+        return [type(o).__name__, list(o.shape), labels, digest]
+    raise TypeError(f"{type(o).__name__} has no stable cache key")
+
+
+def _cache_key_part(value):
+    """
+    Stable text form of a chart input for the figure cache key
+
+    Returns:
+        str: Key part, or None if the value can't be keyed reliably
+    """
+    fingerprint = getattr(value, 'fingerprint', None)
+    if fingerprint is not None:
+        return fingerprint
+    try:
+        return json.dumps(value, sort_keys=True, default=_content_key)
+    except (TypeError, ValueError):
+        return None
+
+
+def _memoized(method):
+    """
+    Cache a chart method's result in the generator's figure cache
+
+    The key covers the method name and all arguments, so a rerun with
+    unchanged data returns the figure built before. Cached figures are
+    shared and must be treated as read-only.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.figure_cache is None:
+            return method(self, *args, **kwargs)
+        parts = [_cache_key_part(arg) for arg in args]
+        parts += [
+            None if part is None else f"{name}={part}"
+            for name, part in ((name, _cache_key_part(value)) for name, value in sorted(kwargs.items()))
+        ]
+        if None in parts:
+            # Unkeyable input: always build a fresh figure
+            return method(self, *args, **kwargs)
+        key = make_cache_key(method.__name__, *parts)
+        return self.figure_cache.get_or_compute(key, lambda: method(self, *args, **kwargs))
+    return wrapper
 
 
 class VisualizationGenerator:
@@ -15,7 +91,12 @@ class VisualizationGenerator:
     Generator for various visualizations
     """
     
-    def __init__(self):
+    def __init__(self, cache_size=128):
+        """
+        Args:
+            cache_size (int): Figures kept in the LRU figure cache (0 disables it)
+        """
+        self.figure_cache = ResultCache(max_size=cache_size, ttl_seconds=None) if cache_size else None
         self.color_palette = {
             'primary': '#1f77b4',
             'success': '#2ecc71',
@@ -24,6 +105,7 @@ class VisualizationGenerator:
             'info': '#3498db'
         }
     
+    @_memoized
     def create_radar_chart(self, scores):
         """
         Create radar chart for score visualization
@@ -34,6 +116,8 @@ class VisualizationGenerator:
         Returns:
             plotly.graph_objects.Figure: Radar chart
         """
+        import plotly.graph_objects as go
+
         categories = [
             'Technical Accuracy',
             'Depth of Knowledge',
@@ -84,6 +168,7 @@ class VisualizationGenerator:
         
         return fig
     
+    @_memoized
     def create_score_breakdown(self, scores):
         """
         Create bar chart for score breakdown
@@ -94,6 +179,8 @@ class VisualizationGenerator:
         Returns:
             plotly.graph_objects.Figure: Bar chart
         """
+        import plotly.graph_objects as go
+
         components = scores['components']
         
         labels = [
@@ -159,14 +246,21 @@ class VisualizationGenerator:
         Returns:
             matplotlib.figure.Figure: Word cloud figure
         """
+        from matplotlib.figure import Figure
+
+        # A bare Figure is not registered with pyplot, so it is freed once unused
+        fig = Figure(figsize=(10, 5))
+        ax = fig.subplots()
+
         if not text or len(text.split()) < 10:
             # Return empty figure if text is too short
-            fig, ax = plt.subplots(figsize=(10, 5))
             ax.text(0.5, 0.5, 'Not enough text for word cloud', 
                    ha='center', va='center', fontsize=12)
             ax.axis('off')
             return fig
         
+        from wordcloud import WordCloud
+
         # Generate word cloud
         wordcloud = WordCloud(
             width=800,
@@ -179,25 +273,48 @@ class VisualizationGenerator:
             min_font_size=10
         ).generate(text)
         
-        # Create figure
-        fig, ax = plt.subplots(figsize=(10, 5))
         ax.imshow(wordcloud, interpolation='bilinear')
         ax.axis('off')
         ax.set_title('Word Cloud - Most Frequent Terms', fontsize=14, pad=20)
         
         return fig
+
+    @_memoized
+    def create_wordcloud_png(self, text, stopwords=None):
+        """
+        Create word cloud as encoded PNG (cached, e.g. for st.image)
+        
+        Args:
+            text (str): Input text
+            stopwords (set): Stopwords to exclude
+            
+        Returns:
+            bytes: PNG image
+        """
+        fig = self.create_wordcloud(text, stopwords)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', bbox_inches='tight')
+        return buffer.getvalue()
     
-    def create_progress_chart(self, history):
+    @_memoized
+    def create_progress_chart(self, stats, trend='sma', window=None, max_points=400):
         """
         Create line chart showing score progression
         
         Args:
-            history (list): List of historical scores
+            stats (DashboardAggregates): Running dashboard aggregates
+            trend (str): 'sma' (moving average) or 'ewma' (exponentially weighted)
+            window (int): Moving-average window or EWMA span
+                (default: the aggregates' trend window)
+            max_points (int): Longer histories are downsampled with LTTB
             
         Returns:
             plotly.graph_objects.Figure: Line chart
         """
-        if not history:
+        import plotly.graph_objects as go
+        from dashboard_stats import ewma, lttb_indices, rolling_mean
+
+        if not stats.count:
             # Return empty figure
             fig = go.Figure()
             fig.add_annotation(
@@ -210,15 +327,25 @@ class VisualizationGenerator:
             )
             return fig
         
-        attempts = list(range(1, len(history) + 1))
-        scores = [item['score'] for item in history]
-        
-        # Calculate moving average
-        window = min(3, len(scores))
-        moving_avg = []
-        for i in range(len(scores)):
-            start = max(0, i - window + 1)
-            moving_avg.append(np.mean(scores[start:i+1]))
+        window = window or stats.trend_window
+        scores = stats.scores
+        if trend == 'ewma':
+            trend_values = ewma(scores, window)
+            trend_name = f'Trend (EWMA, span {window})'
+        elif window == stats.trend_window:
+            # Already maintained by the aggregates as attempts are added
+            trend_values = stats.trend
+            trend_name = 'Trend'
+        else:
+            trend_values = rolling_mean(scores, window)
+            trend_name = f'Trend ({window} attempts)'
+
+        # Keep the chart responsive for long histories; peaks and dips survive LTTB
+        keep = lttb_indices(scores, max_points)
+        downsampled = len(keep) < len(scores)
+        attempts = [int(i) + 1 for i in keep]
+        scores = [scores[i] for i in keep]
+        moving_avg = [float(trend_values[i]) for i in keep]
         
         fig = go.Figure()
         
@@ -226,7 +353,7 @@ class VisualizationGenerator:
         fig.add_trace(go.Scatter(
             x=attempts,
             y=scores,
-            mode='lines+markers',
+            mode='lines' if downsampled else 'lines+markers',
             name='Score',
             line=dict(color=self.color_palette['primary'], width=2),
             marker=dict(size=8)
@@ -237,7 +364,7 @@ class VisualizationGenerator:
             x=attempts,
             y=moving_avg,
             mode='lines',
-            name='Trend',
+            name=trend_name,
             line=dict(color=self.color_palette['success'], width=2, dash='dash')
         ))
         
@@ -260,6 +387,122 @@ class VisualizationGenerator:
         
         return fig
     
+    @_memoized
+    def create_category_radar_chart(self, stats):
+        """
+        Create radar chart of average score per category
+        
+        Args:
+            stats (DashboardAggregates): Running dashboard aggregates
+            
+        Returns:
+            plotly.graph_objects.Figure: Radar chart
+        """
+        import plotly.graph_objects as go
+
+        category_avgs = stats.category_averages()
+        radar_categories = list(category_avgs.keys())
+        radar_values = list(category_avgs.values())
+
+        # Close the polygon when there is more than one category
+        if len(radar_categories) > 1:
+            radar_categories.append(radar_categories[0])
+            radar_values.append(radar_values[0])
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(
+            r=radar_values,
+            theta=radar_categories,
+            fill='toself',
+            line=dict(color="#6C63FF", width=3),
+            marker=dict(size=7)
+        ))
+
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True, range=[0, 5])),
+            showlegend=False,
+            height=500
+        )
+
+        return fig
+
+    @_memoized
+    def create_category_ranking_chart(self, stats):
+        """
+        Create horizontal bar chart of categories ranked by average score
+        
+        Args:
+            stats (DashboardAggregates): Running dashboard aggregates
+            
+        Returns:
+            plotly.graph_objects.Figure: Horizontal bar chart
+        """
+        import plotly.graph_objects as go
+
+        ranked = stats.ranked_categories()
+        cats_sorted = [category for category, _ in ranked]
+        scores_sorted = [category_stats.mean for _, category_stats in ranked]
+        attempts_sorted = [category_stats.count for _, category_stats in ranked]
+
+        colors_sorted = [
+            '#11998e' if s >= 4 else '#667eea' if s >= 3.5 else '#f093fb' if s >= 3 else '#dc3545'
+            for s in scores_sorted
+        ]
+
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            y=cats_sorted,
+            x=scores_sorted,
+            orientation='h',
+            text=[f"{s:.1f} ({a}x)" for s, a in zip(scores_sorted, attempts_sorted)],
+            textposition='outside',
+            marker=dict(color=colors_sorted, line=dict(color='white', width=2))
+        ))
+
+        fig.update_layout(
+            xaxis=dict(range=[0, 5.5]),
+            height=max(300, len(cats_sorted) * 50),
+            margin=dict(l=150)
+        )
+
+        return fig
+
+    @_memoized
+    def create_category_bar_chart(self, stats):
+        """
+        Create bar chart of average score and attempts per category
+        
+        Args:
+            stats (DashboardAggregates): Running dashboard aggregates
+            
+        Returns:
+            plotly.graph_objects.Figure: Bar chart
+        """
+        import plotly.graph_objects as go
+
+        categories = list(stats.by_category.keys())
+        avgs = [stats.by_category[c].mean for c in categories]
+        attempts = [stats.by_category[c].count for c in categories]
+
+        colors = ['#28a745' if a >= 4 else '#ffc107' if a >= 3.5 else '#dc3545' for a in avgs]
+
+        fig = go.Figure([go.Bar(
+            x=categories,
+            y=avgs,
+            text=[f"{a:.1f}<br>({t}x)" for a, t in zip(avgs, attempts)],
+            textposition='outside',
+            marker_color=colors
+        )])
+
+        fig.update_layout(
+            yaxis=dict(range=[0, 5.5]),
+            height=400
+        )
+        fig.add_hline(y=3.5, line_dash="dash", line_color="orange")
+
+        return fig
+    
+    @_memoized
     def create_comparison_chart(self, current_scores, avg_scores):
         """
         Create comparison chart between current and average scores
@@ -271,6 +514,8 @@ class VisualizationGenerator:
         Returns:
             plotly.graph_objects.Figure: Grouped bar chart
         """
+        import plotly.graph_objects as go
+
         categories = [
             'Technical',
             'Depth',
@@ -318,6 +563,7 @@ class VisualizationGenerator:
         
         return fig
     
+    @_memoized
     def create_heatmap(self, score_matrix, categories, components):
         """
         Create heatmap for multi-dimensional analysis
@@ -330,6 +576,8 @@ class VisualizationGenerator:
         Returns:
             plotly.graph_objects.Figure: Heatmap
         """
+        import plotly.graph_objects as go
+
         fig = go.Figure(data=go.Heatmap(
             z=score_matrix,
             x=components,
@@ -350,6 +598,7 @@ class VisualizationGenerator:
         
         return fig
     
+    @_memoized
     def create_gauge_chart(self, score, title="Overall Score"):
         """
         Create gauge chart for single score
@@ -361,6 +610,8 @@ class VisualizationGenerator:
         Returns:
             plotly.graph_objects.Figure: Gauge chart
         """
+        import plotly.graph_objects as go
+
         fig = go.Figure(go.Indicator(
             mode="gauge+number+delta",
             value=score,
@@ -388,6 +639,7 @@ class VisualizationGenerator:
         
         return fig
     
+    @_memoized
     def create_improvement_tracker(self, scores_by_category):
         """
         Create improvement tracker showing performance across categories
@@ -398,6 +650,8 @@ class VisualizationGenerator:
         Returns:
             plotly.graph_objects.Figure: Stacked bar chart
         """
+        import plotly.graph_objects as go
+
         categories = list(scores_by_category.keys())
         attempts = max(len(scores) for scores in scores_by_category.values())
         
@@ -4,8 +4,171 @@ Menggunakan browser microphone via streamlit_mic_recorder
 """
 
 import io
-import tempfile
-import os
+import threading
+import time
+import uuid
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+_INSTALL_MESSAGE = """❌ Library SpeechRecognition belum terinstall!
+
+Install dengan:
+pip install SpeechRecognition
+
+Kemudian restart aplikasi.
+"""
+
+_NO_AUDIO_MESSAGE = "❌ Tidak ada audio yang direkam. Coba lagi."
+
+_BUSY_MESSAGE = """❌ Server sedang memproses banyak transkripsi.
+
+Tunggu beberapa saat lalu klik Transkripsi lagi."""
+
+
+def google_backend(recognizer, audio_data, language):
+    """Google Web Speech API (online)"""
+    return recognizer.recognize_google(audio_data, language=language)
+
+
+def sphinx_backend(recognizer, audio_data, language):
+    """CMU Sphinx (offline, butuh pocketsphinx + model bahasa yang sesuai)"""
+    return recognizer.recognize_sphinx(audio_data, language=language)
+
+
+SPEECH_BACKENDS = {
+    'google': google_backend,
+    'sphinx': sphinx_backend
+}
+
+
+def split_on_silence(audio_bytes, min_silence_seconds=0.4, silence_ratio=0.1,
+                     target_chunk_seconds=20.0, max_chunk_seconds=30.0, min_chunk_seconds=2.0,
+                     window_seconds=0.03):
+    """
+    Potong audio WAV pada jeda bicara menjadi potongan sekitar target_chunk_seconds
+    
+    Energi (RMS) dihitung per window; window dengan RMS di bawah
+    silence_ratio x persentil-95 dianggap hening, dan tengah setiap jeda
+    yang cukup panjang menjadi kandidat titik potong. Dari awal potongan,
+    dipilih kandidat yang paling dekat ke target (antara min dan max);
+    tanpa kandidat, audio dipotong paksa di max_chunk_seconds. Potongan
+    yang seluruhnya hening dibuang. Jadi jumlah request ke recognizer
+    mengikuti durasi audio, bukan jumlah jeda.
+    
+    Args:
+        audio_bytes (bytes): Audio WAV (PCM)
+        min_silence_seconds (float): Jeda minimum untuk titik potong
+        silence_ratio (float): Ambang hening relatif terhadap energi bicara
+        target_chunk_seconds (float): Panjang potongan yang dituju
+        max_chunk_seconds (float): Panjang maksimum satu potongan (batas keras)
+        min_chunk_seconds (float): Panjang minimum potongan yang dipotong pada jeda
+        window_seconds (float): Panjang window energi
+        
+    Returns:
+        list: Bytes WAV per potongan, berurutan
+    """
+    with wave.open(io.BytesIO(audio_bytes), 'rb') as wav:
+        params = wav.getparams()
+        frames = wav.readframes(params.nframes)
+    
+    dtype = {1: np.uint8, 2: np.int16, 4: np.int32}.get(params.sampwidth)
+    frame_size = params.sampwidth * params.nchannels
+    n_frames = len(frames) // frame_size
+    window = max(int(params.framerate * window_seconds), 1)
+    n_windows = n_frames // window
+    if dtype is None or n_windows < 2:
+        return [audio_bytes]
+    
+    # Energi per window dari sinyal mono
+    samples = np.frombuffer(frames[:n_frames * frame_size], dtype=dtype).astype(np.float64)
+    if params.sampwidth == 1:
+        samples -= 128
+    samples = samples.reshape(-1, params.nchannels).mean(axis=1)
+    rms = np.sqrt(np.mean(samples[:n_windows * window].reshape(n_windows, window) ** 2, axis=1))
+    silent = rms <= silence_ratio * np.percentile(rms, 95)
+    
+    # Titik potong di tengah setiap jeda yang cukup panjang
+    min_run = max(int(round(min_silence_seconds / window_seconds)), 1)
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    cuts = np.array(
+        [(start + end) // 2 * window for start, end in zip(run_starts, run_ends) if end - start >= min_run],
+        dtype=np.int64
+    )
+    
+    # Batas potongan: jeda terdekat ke target, potong paksa di batas maksimum
+    max_frames = max(int(max_chunk_seconds * params.framerate), 1)
+    target_frames = min(int(target_chunk_seconds * params.framerate), max_frames)
+    min_frames = min(int(min_chunk_seconds * params.framerate), target_frames)
+    bounds = [0]
+    while n_frames - bounds[-1] > max_frames:
+        start = bounds[-1]
+        candidates = cuts[np.searchsorted(cuts, start + min_frames):np.searchsorted(cuts, start + max_frames, 'right')]
+        if candidates.size:
+            bounds.append(int(candidates[np.argmin(np.abs(candidates - (start + target_frames)))]))
+        else:
+            bounds.append(start + max_frames)
+    bounds.append(n_frames)
+    
+    chunks = []
+    for start, end in zip(bounds, bounds[1:]):
+        # Lewati potongan yang seluruhnya hening
+        if silent[start // window:max(end // window, start // window + 1)].all():
+            continue
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as out:
+            out.setparams(params)
+            out.writeframes(frames[start * frame_size:end * frame_size])
+        chunks.append(buffer.getvalue())
+    
+    return chunks
+
+
+class TranscriptionJob:
+    """
+    State of one background transcription
+    
+    Status goes pending -> running -> done | partial | failed. Audio is
+    transcribed in chunks; chunk_texts fills in as chunks finish. A job is
+    'partial' when some chunks gave text but others hit a backend error:
+    text holds what was transcribed and error names the missing parts.
+    """
+    
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.status = 'pending'
+        self.text = None
+        self.error = None
+        self.chunk_texts = []
+        self.chunk_errors = []
+        self.submitted_at = time.monotonic()
+        self.finished_at = None
+        self._remaining = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def finished(self):
+        return self.status in ('done', 'partial', 'failed')
+    
+    @property
+    def progress(self):
+        """(finished_chunks, total_chunks)"""
+        total = len(self.chunk_texts)
+        return total - self._remaining, total
+    
+    @property
+    def partial_text(self):
+        """Teks potongan yang sudah selesai, berurutan"""
+        return ' '.join(text for text in self.chunk_texts if text)
+    
+    @property
+    def failed_chunks(self):
+        """Nomor potongan (mulai 1) yang gagal karena error backend"""
+        return [index + 1 for index, error in enumerate(self.chunk_errors) if error is not None]
 
 
 class VoiceHandler:
@@ -14,19 +177,67 @@ class VoiceHandler:
     Menggunakan browser microphone (no PyAudio needed!)
     """
     
-    def __init__(self):
+    def __init__(self, backend='google', language='id-ID', max_workers=4, max_pending=32,
+                 job_ttl_seconds=600, target_chunk_seconds=20.0, max_chunk_seconds=30.0):
+        """
+        Args:
+            backend (str | callable): Nama backend di SPEECH_BACKENDS, atau
+                callable(recognizer, audio_data, language) -> str
+            language (str): Kode bahasa untuk recognizer
+            max_workers (int): Jumlah potongan audio yang ditranskripsi bersamaan
+            max_pending (int): Batas potongan audio yang belum selesai (antri +
+                berjalan) dari semua job; job yang melebihinya ditolak kecuali
+                tidak ada potongan lain yang tertunda
+            job_ttl_seconds (float): Job selesai yang tidak diambil dihapus setelah ini
+            target_chunk_seconds (float): Panjang potongan audio yang dituju
+            max_chunk_seconds (float): Panjang maksimum satu potongan audio
+        """
+        self.backend = SPEECH_BACKENDS[backend] if isinstance(backend, str) else backend
+        self.backend_name = backend if isinstance(backend, str) else getattr(backend, '__name__', 'custom')
+        self.language = language
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.job_ttl_seconds = job_ttl_seconds
+        self.target_chunk_seconds = target_chunk_seconds
+        self.max_chunk_seconds = max_chunk_seconds
+        
+        self._jobs = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        
         # Check if SpeechRecognition available
         self.voice_available = False
         try:
             import speech_recognition as sr
-            self.recognizer = sr.Recognizer()
             self.voice_available = True
         except ImportError:
-            self.recognizer = None
+            pass
+    
+    def recognize(self, audio_bytes):
+        """
+        Transcribe WAV bytes langsung dari memori (tanpa file sementara)
+        
+        Args:
+            audio_bytes (bytes): Audio WAV
+            
+        Returns:
+            str: Transcribed text
+            
+        Raises:
+            Exception: Error dari SpeechRecognition atau backend
+        """
+        import speech_recognition as sr
+        
+        # Recognizer per panggilan: aman dipakai dari banyak thread
+        recognizer = sr.Recognizer()
+        with sr.AudioFile(io.BytesIO(audio_bytes)) as source:
+            audio_data = recognizer.record(source)
+        
+        return self.backend(recognizer, audio_data, self.language)
     
     def transcribe_from_audio_bytes(self, audio_bytes):
         """
-        Transcribe audio dari bytes yang direkam browser
+        Transcribe audio dari bytes yang direkam browser (blocking)
         
         Args:
             audio_bytes: Audio data dalam bytes (dari mic recorder)
@@ -35,41 +246,162 @@ class VoiceHandler:
             str: Transcribed text atau error message
         """
         if not self.voice_available:
-            return """❌ Library SpeechRecognition belum terinstall!
-
-Install dengan:
-pip install SpeechRecognition
-
-Kemudian restart aplikasi.
-"""
+            return _INSTALL_MESSAGE
         
         if not audio_bytes:
-            return "❌ Tidak ada audio yang direkam. Coba lagi."
+            return _NO_AUDIO_MESSAGE
         
         try:
-            import speech_recognition as sr
-            
-            # Save audio bytes to temporary WAV file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as temp_audio:
-                temp_audio.write(audio_bytes)
-                temp_audio_path = temp_audio.name
+            return self.recognize(audio_bytes)
+        except Exception as e:
+            return self._error_message(e)
+    
+    def submit_transcription(self, audio_bytes):
+        """
+        Mulai transkripsi di worker pool tanpa memblokir UI
+        
+        Audio dipotong pada jeda bicara dan setiap potongan ditranskripsi
+        paralel; teks sementara tersedia lewat job.partial_text.
+        
+        Args:
+            audio_bytes (bytes): Audio WAV
             
+        Returns:
+            str: Job id untuk get_job / pop_job
+        """
+        job = TranscriptionJob(uuid.uuid4().hex)
+        
+        chunks = []
+        if self.voice_available and audio_bytes:
             try:
-                # Load audio file
-                with sr.AudioFile(temp_audio_path) as source:
-                    audio_data = self.recognizer.record(source)
-                
-                # Transcribe menggunakan Google Speech Recognition (Bahasa Indonesia)
-                text = self.recognizer.recognize_google(audio_data, language='id-ID')
-                
-                return text
-                
-            finally:
-                # Cleanup temporary file
-                if os.path.exists(temp_audio_path):
-                    os.remove(temp_audio_path)
+                chunks = split_on_silence(
+                    audio_bytes,
+                    target_chunk_seconds=self.target_chunk_seconds,
+                    max_chunk_seconds=self.max_chunk_seconds
+                )
+            except (wave.Error, EOFError, ValueError):
+                # Bukan WAV PCM yang bisa dipotong; kirim utuh ke recognizer
+                chunks = [audio_bytes]
+        
+        with self._lock:
+            self._purge_expired()
+            # Budget in chunks (recognizer requests), not jobs: one long answer
+            # costs as much as several short ones
+            pending = sum(j._remaining for j in self._jobs.values() if not j.finished)
+            self._jobs[job.job_id] = job
+            
+            if not self.voice_available:
+                self._fail(job, _INSTALL_MESSAGE)
+            elif not audio_bytes or not chunks:
+                self._fail(job, _NO_AUDIO_MESSAGE)
+            elif pending and pending + len(chunks) > self.max_pending:
+                self._fail(job, _BUSY_MESSAGE)
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix='transcription'
+                    )
+                job.chunk_texts = [None] * len(chunks)
+                job.chunk_errors = [None] * len(chunks)
+                job._remaining = len(chunks)
+                job.status = 'running'
+                for index, chunk in enumerate(chunks):
+                    self._executor.submit(self._run_chunk, job, index, chunk)
+        
+        return job.job_id
+    
+    def get_job(self, job_id):
+        """
+        Lihat status job
+        
+        Args:
+            job_id (str): Job id dari submit_transcription
             
+        Returns:
+            TranscriptionJob: Job, atau None jika tidak dikenal/kedaluwarsa
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def pop_job(self, job_id):
+        """
+        Ambil dan hapus job (panggil setelah job selesai)
+        
+        Args:
+            job_id (str): Job id dari submit_transcription
+            
+        Returns:
+            TranscriptionJob: Job, atau None jika tidak dikenal/kedaluwarsa
+        """
+        with self._lock:
+            return self._jobs.pop(job_id, None)
+    
+    def shutdown(self, wait=True):
+        """Hentikan worker pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _run_chunk(self, job, index, audio_bytes):
+        import speech_recognition as sr
+        
+        text, error = None, None
+        try:
+            text = self.recognize(audio_bytes)
         except sr.UnknownValueError:
+            # Potongan tanpa ucapan yang jelas tidak menggagalkan seluruh job
+            text = ''
+        except Exception as e:
+            error = e
+        
+        with job._lock:
+            job.chunk_texts[index] = text
+            job.chunk_errors[index] = error
+            job._remaining -= 1
+            if job._remaining:
+                return
+        
+        # Potongan terakhir selesai: gabungkan hasil
+        first_error = next((e for e in job.chunk_errors if e is not None), None)
+        if job.partial_text:
+            job.text = job.partial_text
+            if first_error is not None:
+                # Teks yang ada tetap dipakai, tapi bagian yang hilang harus terlihat
+                failed = job.failed_chunks
+                job.error = (
+                    f"⚠️ Transkripsi tidak lengkap: bagian {', '.join(map(str, failed))} "
+                    f"dari {len(job.chunk_texts)} gagal ditranskripsi ({first_error}). "
+                    "Periksa hasilnya atau rekam ulang bagian tersebut."
+                )
+            job.finished_at = time.monotonic()
+            job.status = 'done' if first_error is None else 'partial'
+        else:
+            if first_error is None:
+                first_error = sr.UnknownValueError()
+            self._fail(job, self._error_message(first_error))
+    
+    def _fail(self, job, message):
+        job.error = message
+        job.finished_at = time.monotonic()
+        job.status = 'failed'
+    
+    def _purge_expired(self):
+        """Hapus job selesai yang tidak pernah diambil (caller memegang lock)"""
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and now - job.finished_at > self.job_ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+    
+    def _error_message(self, error):
+        """Pesan error untuk ditampilkan ke pengguna"""
+        import speech_recognition as sr
+        
+        if isinstance(error, sr.UnknownValueError):
             return """❌ Tidak dapat memahami audio yang direkam.
 
 Tips:
@@ -78,16 +410,15 @@ Tips:
 - Rekam di tempat yang tenang
 - Coba rekam ulang"""
         
-        except sr.RequestError as e:
-            return f"""❌ Error koneksi ke Google Speech API: {str(e)}
+        if isinstance(error, sr.RequestError):
+            return f"""❌ Error dari backend speech recognition '{self.backend_name}': {str(error)}
 
 Pastikan:
-- Anda terkoneksi internet
-- Koneksi stabil (tidak putus-putus)
+- Anda terkoneksi internet (untuk backend online) dan koneksi stabil
+- Backend offline terinstall lengkap (mis. pocketsphinx + model bahasa)
 - Coba lagi dalam beberapa saat"""
         
-        except Exception as e:
-            return f"""❌ Error saat memproses audio: {str(e)}
+        return f"""❌ Error saat memproses audio: {str(error)}
 
 Coba:
 - Rekam ulang audio